@@ -16,12 +16,69 @@ class Settings(BaseSettings):
         app_port: Port number for the server.
         app_debug: Enable debug mode.
         database_url: PostgreSQL connection string.
+        events_backend: Broker for realtime task events, "memory" or
+            "postgres" (LISTEN/NOTIFY, shared by all workers).
+        events_channel: PostgreSQL NOTIFY channel for task events.
+        events_queue_size: Events buffered per WebSocket client before it
+            is disconnected as a slow consumer.
+        changes_safety_lag_seconds: Age a change must reach before the
+            change feed serves it; must exceed the longest task write
+            transaction, so changes committing late are never skipped.
+        changes_retention_days: Days deletion tombstones are kept; older
+            change-feed cursors get 410 and must resync from scratch.
+        db_pool_size: Connections kept open in the pool.
+        db_max_overflow: Extra connections allowed beyond db_pool_size.
+        db_pool_timeout: Seconds to wait for a free connection before failing.
+        db_pool_recycle: Seconds after which a pooled connection is replaced.
+        db_pool_pre_ping: Test connections for liveness on checkout.
+        db_statement_timeout_ms: PostgreSQL statement_timeout (0 disables).
         jwt_secret: Secret key for JWT token signing.
         jwt_algorithm: Algorithm for JWT encoding (default: HS256).
         jwt_expire_minutes: Token expiration time in minutes.
+        bcrypt_rounds: bcrypt cost factor; changing it rehashes on login.
+        password_hash_workers: Threads dedicated to bcrypt operations.
+        password_hash_queue_size: bcrypt operations allowed to wait before
+            requests are rejected with 429.
+        auth_cache_size: Max authenticated tokens kept in the user cache.
+        auth_cache_ttl_seconds: Max seconds a cached token/user is reused.
+            Invalidation only sees ORM writes in the same worker, so a
+            user deleted or changed by another worker (or by a Core/bulk
+            statement) stays authenticated for up to this long; keep it
+            to a few seconds.
         cors_origins: Comma-separated list of allowed CORS origins.
         deepseek_api_key: API key for DeepSeek AI service.
         deepseek_api_url: DeepSeek API endpoint URL.
+        deepseek_max_connections: Max pooled connections to DeepSeek.
+        deepseek_max_keepalive_connections: Max idle keep-alive connections.
+        deepseek_keepalive_expiry: Seconds an idle connection is kept open.
+        deepseek_http2: Use HTTP/2 for DeepSeek requests.
+        deepseek_connect_timeout: Connect/write/pool timeout in seconds.
+        deepseek_read_timeout: Read timeout in seconds.
+        llm_backend: Chat completion backend: "deepseek", "stub"
+            (deterministic, offline), "record" (DeepSeek, saving every
+            response) or "replay" (saved responses only).
+        llm_stub_latency: Seconds the stub backend waits before answering.
+        llm_recordings_dir: Directory of recorded LLM responses.
+        llm_max_concurrency: Max DeepSeek requests in flight per worker.
+        llm_queue_size: Max chat requests waiting for an LLM slot before
+            new ones are refused.
+        llm_queue_timeout: Max seconds a request waits for an LLM slot.
+        llm_max_retries: Retries of 429/5xx/timeouts after the first try.
+        llm_retry_base_delay: Backoff ceiling of the first retry (seconds).
+        llm_retry_max_delay: Longest wait before a retry; a longer
+            Retry-After fails the call instead.
+        llm_breaker_failure_threshold: Consecutive failed calls that open
+            the circuit breaker.
+        llm_breaker_reset_timeout: Seconds the circuit stays open before a
+            probe call is allowed.
+        chat_cache_backend: Chat answer cache backend ("memory" or "redis").
+        chat_cache_url: Redis URL when chat_cache_backend is "redis".
+        chat_cache_size: Max answers kept by the in-process cache.
+        chat_cache_ttl_seconds: Seconds a cached answer stays valid.
+        chat_context_format: Task context sent to the LLM, "compact"
+            (ranked rows within a token budget) or "verbose".
+        chat_context_token_budget: Max estimated tokens of the compact
+            chat prompt.
     """
 
     app_host: str = Field(default="0.0.0.0", env="APP_HOST")
@@ -30,10 +87,28 @@ class Settings(BaseSettings):
 
     database_url: str = Field(..., env="DATABASE_URL")
 
+    # Connection pool (ignored for SQLite)
+    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, env="DB_POOL_PRE_PING")
+    db_statement_timeout_ms: int = Field(default=0, env="DB_STATEMENT_TIMEOUT_MS")
+
     jwt_secret: str = Field(..., env="JWT_SECRET")
     jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
     jwt_expire_minutes: int = Field(default=60, env="JWT_EXPIRE_MINUTES")
 
+    # Password hashing: bcrypt cost and its dedicated worker pool
+    bcrypt_rounds: int = Field(default=12, env="BCRYPT_ROUNDS")
+    password_hash_workers: int = Field(default=4, env="PASSWORD_HASH_WORKERS")
+    password_hash_queue_size: int = Field(default=32, env="PASSWORD_HASH_QUEUE_SIZE")
+
+    # Per-token cache of decoded claims + user snapshot (0 size disables).
+    # The TTL bounds how long other workers keep a changed/deleted user.
+    auth_cache_size: int = Field(default=1024, env="AUTH_CACHE_SIZE")
+    auth_cache_ttl_seconds: int = Field(default=10, env="AUTH_CACHE_TTL_SECONDS")
+
     # CORS configuration - comma-separated list of allowed origins
     cors_origins: str = Field(
         default="http://localhost:3000,http://127.0.0.1:3000",
@@ -45,6 +120,66 @@ class Settings(BaseSettings):
         default="https://api.deepseek.com/chat/completions", env="DEEPSEEK_API_URL"
     )
 
+    # Shared HTTP client pool for DeepSeek calls
+    deepseek_max_connections: int = Field(default=20, env="DEEPSEEK_MAX_CONNECTIONS")
+    deepseek_max_keepalive_connections: int = Field(
+        default=10, env="DEEPSEEK_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    deepseek_keepalive_expiry: float = Field(
+        default=60.0, env="DEEPSEEK_KEEPALIVE_EXPIRY"
+    )
+    deepseek_http2: bool = Field(default=False, env="DEEPSEEK_HTTP2")
+    deepseek_connect_timeout: float = Field(
+        default=5.0, env="DEEPSEEK_CONNECT_TIMEOUT"
+    )
+    deepseek_read_timeout: float = Field(default=30.0, env="DEEPSEEK_READ_TIMEOUT")
+
+    # Chat completion backend; stub/replay run without network access
+    llm_backend: str = Field(default="deepseek", env="LLM_BACKEND")
+    llm_stub_latency: float = Field(default=0.0, env="LLM_STUB_LATENCY")
+    llm_recordings_dir: str = Field(
+        default="recordings/llm", env="LLM_RECORDINGS_DIR"
+    )
+
+    # Load protection for DeepSeek calls: concurrency cap, retries, breaker
+    llm_max_concurrency: int = Field(default=8, env="LLM_MAX_CONCURRENCY")
+    llm_queue_size: int = Field(default=32, env="LLM_QUEUE_SIZE")
+    llm_queue_timeout: float = Field(default=10.0, env="LLM_QUEUE_TIMEOUT")
+    llm_max_retries: int = Field(default=3, env="LLM_MAX_RETRIES")
+    llm_retry_base_delay: float = Field(default=0.5, env="LLM_RETRY_BASE_DELAY")
+    llm_retry_max_delay: float = Field(default=8.0, env="LLM_RETRY_MAX_DELAY")
+    llm_breaker_failure_threshold: int = Field(
+        default=5, env="LLM_BREAKER_FAILURE_THRESHOLD"
+    )
+    llm_breaker_reset_timeout: float = Field(
+        default=30.0, env="LLM_BREAKER_RESET_TIMEOUT"
+    )
+
+    # Chat answer cache, invalidated by task writes
+    chat_cache_backend: str = Field(default="memory", env="CHAT_CACHE_BACKEND")
+    chat_cache_url: str = Field(
+        default="redis://localhost:6379/0", env="CHAT_CACHE_URL"
+    )
+    chat_cache_size: int = Field(default=512, env="CHAT_CACHE_SIZE")
+    chat_cache_ttl_seconds: int = Field(default=300, env="CHAT_CACHE_TTL_SECONDS")
+
+    # Task context in chat prompts
+    chat_context_format: str = Field(default="compact", env="CHAT_CONTEXT_FORMAT")
+    chat_context_token_budget: int = Field(
+        default=1500, env="CHAT_CONTEXT_TOKEN_BUDGET"
+    )
+
+    # Realtime task events over WebSocket
+    events_backend: str = Field(default="memory", env="EVENTS_BACKEND")
+    events_channel: str = Field(default="task_events", env="EVENTS_CHANNEL")
+    events_queue_size: int = Field(default=100, env="EVENTS_QUEUE_SIZE")
+
+    # Task change feed (GET /tasks/changes)
+    changes_safety_lag_seconds: float = Field(
+        default=5.0, env="CHANGES_SAFETY_LAG_SECONDS"
+    )
+    changes_retention_days: int = Field(default=30, env="CHANGES_RETENTION_DAYS")
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -0,0 +1,121 @@
+"""In-process caching utilities.
+
+This module provides a small thread-safe LRU cache with per-entry
+time-to-live, used to avoid repeating work on hot request paths.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after a time-to-live.
+
+    Endpoints are async and share it on the event loop thread; the lock
+    keeps it correct if it is also used from worker threads (e.g. code
+    run through ``run_in_threadpool``).
+
+    Attributes:
+        maxsize: Maximum number of entries kept before evicting the least
+            recently used one.
+        ttl: Default time-to-live in seconds for new entries.
+        hits: Number of lookups that found a live entry.
+        misses: Number of lookups that found nothing or an expired entry.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if absent or expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: Optional shorter time-to-live in seconds; it is capped at
+                the cache default. Entries with a non-positive ttl are not
+                stored.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove every entry whose value matches ``predicate``.
+
+        Args:
+            predicate: Callable receiving a cached value.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        with self._lock:
+            doomed = [k for k, (_, v) in self._data.items() if predicate(v)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size.
+
+        Returns:
+            dict: ``size``, ``maxsize``, ``hits``, ``misses`` and ``hit_rate``.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,25 @@
+"""Current date and time for deadline arithmetic.
+
+Deadlines are stored as naive UTC, so "today", "overdue" and "due this
+week" are worked out in UTC too, whatever the server's local timezone.
+"""
+
+from datetime import date, datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Return the current time as a naive UTC datetime.
+
+    Returns:
+        datetime: Now, comparable with stored deadlines.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def utc_today() -> date:
+    """Return today's date in UTC.
+
+    Returns:
+        date: The UTC calendar date.
+    """
+    return utcnow().date()
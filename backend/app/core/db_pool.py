@@ -0,0 +1,123 @@
+"""Connection pool instrumentation for the async SQLAlchemy engine.
+
+This module provides a queue pool that records how long checkouts take
+and how often requests had to wait for a free connection, plus pool
+event listeners that track how long connections are held.
+"""
+
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from .metrics import Histogram
+
+
+class PoolStats:
+    """Counters and latency histograms for a connection pool.
+
+    Attributes:
+        checkouts: Successful connection checkouts.
+        timeouts: Checkouts that failed with a pool timeout.
+        connects: New DBAPI connections opened.
+        invalidations: Connections discarded as broken.
+        checkout_latency: Seconds spent in ``Pool.connect`` (waiting,
+            opening connections and pre-ping).
+        wait_time: Checkout latency of requests that found the pool
+            exhausted and had to wait for a connection to be returned.
+        hold_time: Seconds a connection stayed checked out.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.checkout_latency = Histogram()
+        self.wait_time = Histogram()
+        self.hold_time = Histogram()
+        self._lock = threading.Lock()
+
+    def incr(self, name: str) -> None:
+        """Increment the counter attribute ``name``."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self, pool: Pool) -> dict:
+        """Return counters, latencies and current pool gauges.
+
+        Args:
+            pool: The pool to read live gauges from.
+
+        Returns:
+            dict: JSON-friendly pool metrics.
+        """
+        gauges = {"pool_class": type(pool).__name__}
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            gauges.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,
+            )
+        return {
+            **gauges,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "checkout_latency_seconds": self.checkout_latency.snapshot(),
+            "wait_time_seconds": self.wait_time.snapshot(),
+            "hold_time_seconds": self.hold_time.snapshot(),
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that times every checkout into ``pool_stats``."""
+
+    def connect(self):
+        exhausted = self.checkedin() == 0 and self.overflow() >= self._max_overflow
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_stats.incr("timeouts")
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            pool_stats.checkout_latency.observe(elapsed)
+            if exhausted:
+                pool_stats.wait_time.observe(elapsed)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Attach pool event listeners that feed ``pool_stats``.
+
+    Args:
+        engine: Sync engine (``AsyncEngine.sync_engine`` for async engines).
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        pool_stats.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        pool_stats.incr("checkouts")
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            pool_stats.hold_time.observe(time.perf_counter() - started)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        pool_stats.incr("invalidations")
@@ -0,0 +1,64 @@
+"""Weak ETag helpers for conditional GET requests.
+
+This module builds weak entity tags from cheap version fingerprints
+(row counts, latest timestamps) and evaluates ``If-None-Match`` so
+endpoints can answer ``304 Not Modified`` before loading and
+serializing a payload.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+# Let clients store responses but revalidate them on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_weak_etag(*parts: object) -> str:
+    """Build a weak ETag from the values that determine a response.
+
+    Args:
+        *parts: Version fingerprint and any request parameters that
+            change the payload.
+
+    Returns:
+        str: A weak ETag such as ``W/"3f2a..."``.
+    """
+    raw = "|".join(repr(part) for part in parts)
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against ``etag``.
+
+    Uses the weak comparison required for ``If-None-Match``.
+
+    Args:
+        if_none_match: Raw header value, possibly a list or ``*``.
+        etag: Current ETag of the resource.
+
+    Returns:
+        bool: True if the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach ``etag`` and revalidation caching headers to ``response``."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty ``304 Not Modified`` response for ``etag``."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
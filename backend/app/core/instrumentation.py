@@ -0,0 +1,161 @@
+"""Request, database and LLM instrumentation for the ``/metrics`` endpoint.
+
+This module provides the application-wide metric registry, an ASGI
+middleware that times every request per route and status, engine event
+listeners that count SQL statements per request, and helpers used by
+the chatbot to record DeepSeek latency and token usage.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import Counter, Gauge, HistogramFamily, Registry
+
+# Buckets for "statements per request"
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+registry = Registry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route and status.",
+    ("method", "route", "status"),
+))
+http_request_duration = registry.register(HistogramFamily(
+    "http_request_duration_seconds", "HTTP request latency by route and status.",
+    ("method", "route", "status"),
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.",
+))
+http_request_db_queries = registry.register(HistogramFamily(
+    "http_request_db_queries", "SQL statements executed per HTTP request.",
+    ("method", "route"), buckets=QUERY_COUNT_BUCKETS,
+))
+http_request_db_duration = registry.register(HistogramFamily(
+    "http_request_db_duration_seconds", "Time spent in SQL per HTTP request.",
+    ("method", "route"),
+))
+db_queries_total = registry.register(Counter(
+    "db_queries_total", "SQL statements executed.",
+))
+db_query_duration = registry.register(HistogramFamily(
+    "db_query_duration_seconds", "Latency of individual SQL statements.",
+))
+llm_request_duration = registry.register(HistogramFamily(
+    "llm_request_duration_seconds", "DeepSeek call latency by mode and outcome.",
+    ("mode", "outcome"),
+))
+llm_tokens_total = registry.register(Counter(
+    "llm_tokens_total", "DeepSeek tokens reported in API usage.", ("type",),
+))
+
+
+class _RequestDbStats:
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+_request_db: ContextVar[Optional[_RequestDbStats]] = ContextVar(
+    "request_db", default=None
+)
+
+
+def _route_label(scope: Scope) -> str:
+    # Route templates keep label cardinality bounded ("/tasks/{task_id}")
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class PrometheusMiddleware:
+    """ASGI middleware recording request count, latency and SQL usage.
+
+    Latency covers the whole response, including streamed bodies.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        db_stats = _RequestDbStats()
+        token = _request_db.set(db_stats)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec()
+            _request_db.reset(token)
+
+            labels = {"method": scope["method"], "route": _route_label(scope)}
+            status = str(status_code)
+            http_requests_total.inc(**labels, status=status)
+            http_request_duration.observe(elapsed, **labels, status=status)
+            http_request_db_queries.observe(db_stats.queries, **labels)
+            http_request_db_duration.observe(db_stats.seconds, **labels)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Count and time every SQL statement run through ``engine``.
+
+    Statements run inside a request are also attributed to it. For an
+    async engine pass its ``sync_engine``.
+
+    Args:
+        engine: Engine to attach the listeners to.
+    """
+
+    # The start time lives on the execution context, which is discarded
+    # with the statement, so failed statements (no after_cursor_execute)
+    # leave nothing behind on the pooled connection
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        db_queries_total.inc()
+        db_query_duration.observe(elapsed)
+        stats = _request_db.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+
+def observe_llm_call(mode: str, outcome: str, elapsed: float,
+                     usage: Optional[dict] = None) -> None:
+    """Record one DeepSeek call.
+
+    Args:
+        mode: ``"complete"`` or ``"stream"``.
+        outcome: ``"ok"``, ``"error"``, ``"cancelled"`` or ``"rejected"``
+            (refused by the LLM guard without calling DeepSeek).
+        elapsed: Call duration in seconds.
+        usage: The ``usage`` object from the API response, if any.
+    """
+    llm_request_duration.observe(elapsed, mode=mode, outcome=outcome)
+    for kind in ("prompt", "completion"):
+        tokens = (usage or {}).get(f"{kind}_tokens")
+        if tokens:
+            llm_tokens_total.inc(tokens, type=kind)
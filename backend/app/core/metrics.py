@@ -0,0 +1,263 @@
+"""Lightweight in-process metric primitives.
+
+This module provides thread-safe metric types used to instrument hot
+paths (database pool, HTTP requests) without external dependencies,
+and a registry that renders them in the Prometheus text format.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Sample = Tuple[str, Dict[str, str], float]
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values.
+
+    Attributes:
+        buckets: Upper bounds of the buckets, ascending.
+        count: Number of observations.
+        total: Sum of observed values.
+        max: Largest observed value.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value (e.g. seconds).
+        """
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def cumulative_counts(self) -> list:
+        """Return ``(upper_bound, cumulative_count)`` pairs, ending with +Inf.
+
+        Returns:
+            list: Cumulative bucket counts, Prometheus style.
+        """
+        with self._lock:
+            pairs, running = [], 0
+            for bound, count in zip(self.buckets + (float("inf"),), self._counts):
+                running += count
+                pairs.append((bound, running))
+            return pairs
+
+    def snapshot(self) -> dict:
+        """Return a JSON-friendly summary.
+
+        Returns:
+            dict: ``count``, ``sum``, ``mean`` and ``max``.
+        """
+        with self._lock:
+            return {
+                "count": self.count,
+                "sum": self.total,
+                "mean": self.total / self.count if self.count else 0.0,
+                "max": self.max,
+            }
+
+
+class MetricFamily:
+    """Base class for a named metric with optional labels.
+
+    Attributes:
+        name: Metric name, e.g. ``http_requests_total``.
+        documentation: Help text shown in the exposition.
+        labelnames: Names of the labels every sample carries.
+    """
+
+    type = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[Sample]:
+        """Yield ``(name, labels, value)`` samples for the exposition."""
+        raise NotImplementedError
+
+
+class Counter(MetricFamily):
+    """Monotonically increasing value per label set.
+
+    When ``func`` is given, values are read from it at scrape time
+    instead (useful for counters kept elsewhere, like cache hits).
+
+    Args:
+        func: Optional callable returning ``(label_values, value)`` pairs.
+    """
+
+    type = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        func: Optional[Callable[[], Iterable[Tuple[Tuple, float]]]] = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._func = func
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add ``amount`` to the value for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[Sample]:
+        if self._func is not None:
+            items = [(tuple(map(str, k)), v) for k, v in self._func()]
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        for key, value in items:
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label set."""
+
+    type = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Subtract ``amount`` from the value for ``labels``."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the value for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class HistogramFamily(MetricFamily):
+    """A :class:`Histogram` per label set."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._children: Dict[Tuple[str, ...], Histogram] = {}
+
+    def labels(self, **labels: str) -> Histogram:
+        """Return the histogram for ``labels``, creating it if needed."""
+        key = self._key(labels)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = Histogram(self.buckets)
+            return child
+
+    def bind(self, histogram: Histogram, **labels: str) -> None:
+        """Expose an existing histogram under ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = histogram
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for ``labels``."""
+        self.labels(**labels).observe(value)
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            labels = dict(zip(self.labelnames, key))
+            for bound, count in child.cumulative_counts():
+                yield self.name + "_bucket", {**labels, "le": _format_value(bound)}, count
+            summary = child.snapshot()
+            yield self.name + "_sum", labels, summary["sum"]
+            yield self.name + "_count", labels, summary["count"]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Registry:
+    """Collection of metric families rendered together on scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: List[MetricFamily] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: MetricFamily) -> MetricFamily:
+        """Add ``metric`` to the registry and return it.
+
+        Raises:
+            ValueError: If a metric with the same name is registered.
+        """
+        with self._lock:
+            if any(m.name == metric.name for m in self._metrics):
+                raise ValueError(f"Duplicate metric: {metric.name}")
+            self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    rendered = ",".join(
+                        f'{k}="{_escape(str(v))}"' for k, v in labels.items()
+                    )
+                    name = f"{name}{{{rendered}}}"
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
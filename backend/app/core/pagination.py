@@ -0,0 +1,111 @@
+"""Keyset pagination helpers.
+
+This module encodes and decodes the opaque cursors used by list
+endpoints that paginate on a stable sort key such as
+``(created_at, id)``, and the sync cursors of change feeds.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded."""
+
+
+class ExpiredCursor(InvalidCursor):
+    """Raised when a sync cursor can no longer be resumed.
+
+    Clients should drop the cursor and sync again from scratch.
+    """
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a keyset position into an opaque URL-safe cursor.
+
+    Args:
+        created_at: Sort key timestamp of the last row on the page.
+        row_id: Primary key of the last row on the page (tie-breaker).
+
+    Returns:
+        str: URL-safe base64 cursor string.
+    """
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string from a previous page.
+
+    Returns:
+        Tuple[datetime, int]: The ``(created_at, id)`` keyset position.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+
+def encode_sync_cursor(
+    change_seq: int, row_id: int, deletion_id: int, issued_at: datetime
+) -> str:
+    """Encode a change-feed position into an opaque URL-safe cursor.
+
+    Args:
+        change_seq: ``change_seq`` of the last change delivered (0 if none).
+        row_id: Primary key of that row (tie-breaker).
+        deletion_id: Last deletion-log entry delivered.
+        issued_at: Database time the cursor was issued, used to expire
+            cursors older than the deletion-log retention.
+
+    Returns:
+        str: URL-safe base64 cursor string.
+    """
+    raw = json.dumps(
+        [change_seq, row_id, deletion_id, issued_at.isoformat()],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> Tuple[int, int, int, datetime]:
+    """Decode a cursor produced by :func:`encode_sync_cursor`.
+
+    Args:
+        cursor: Opaque cursor string from a previous sync.
+
+    Returns:
+        Tuple[int, int, int, datetime]: ``(change_seq, id, deletion_id,
+        issued_at)`` position.
+
+    Raises:
+        ExpiredCursor: If the cursor predates the change-sequence feed.
+        InvalidCursor: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(position, list) and len(position) == 3:
+            # Pre-0006 (updated_at, id, deletion_id) cursor
+            raise ExpiredCursor("Cursor expired")
+        change_seq, row_id, deletion_id, issued_at = position
+        return (
+            int(change_seq),
+            int(row_id),
+            int(deletion_id),
+            datetime.fromisoformat(issued_at),
+        )
+    except ExpiredCursor:
+        raise
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
@@ -4,15 +4,109 @@ This module provides password hashing, verification, and JWT token
 management for the application's authentication system.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from ..config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes with a different cost than BCRYPT_ROUNDS are flagged for rehash
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds,
+)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password worker pool and its queue are full."""
+
+
+class PasswordHasher:
+    """Run bcrypt operations on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so a small thread pool uses
+    several cores without starving the event loop or the default
+    threadpool. At most ``workers + queue_size`` operations may be
+    running or waiting; beyond that new requests fail fast with
+    :class:`PasswordHasherBusy`.
+
+    Attributes:
+        workers: Number of hashing threads.
+        capacity: Max running plus queued operations.
+        pending: Operations currently running or queued.
+        rejected: Operations refused because the pool was full.
+    """
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.pending = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+
+    async def _run(self, func: Callable, *args):
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password on the worker pool.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            str: The bcrypt hashed password.
+
+        Raises:
+            PasswordHasherBusy: If the pool and queue are full.
+        """
+        return await self._run(pwd_context.hash, password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password and rehash it if its cost is outdated.
+
+        Args:
+            plain_password: The plain text password to verify.
+            hashed_password: The stored bcrypt hash.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the password matches, and a
+            new hash to store when the configured bcrypt cost changed.
+
+        Raises:
+            PasswordHasherBusy: If the pool and queue are full.
+        """
+        return await self._run(
+            pwd_context.verify_and_update, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued work finishes."""
+        self._executor.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    queue_size=settings.password_hash_queue_size,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
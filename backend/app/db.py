@@ -2,34 +2,107 @@
 
 This module provides SQLAlchemy engine configuration, session factory,
 and the declarative base for ORM models.
+
+API requests use the async engine and ``AsyncSession`` so a slow query
+does not block the event loop. The sync engine is kept for scripts,
+migrations and table bootstrap.
 """
 
-from typing import Generator
+from typing import AsyncGenerator
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 from .config import settings
+from .core.db_pool import InstrumentedAsyncQueuePool, instrument_pool
+from .core.instrumentation import instrument_queries
+
+# Async driver to use for each sync driver accepted in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Translate a sync database URL into its async-driver equivalent.
+
+    Args:
+        database_url: URL such as ``postgresql+psycopg2://...``.
+
+    Returns:
+        str: URL using asyncpg (PostgreSQL) or aiosqlite (SQLite). URLs
+        that already name an async driver are returned unchanged.
+    """
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def engine_options(async_driver: bool) -> dict:
+    """Build pool and connection options for ``create_engine``.
 
-engine = create_engine(settings.database_url, future=True, echo=False)
+    Args:
+        async_driver: Whether the options are for the asyncpg engine.
+
+    Returns:
+        dict: Keyword arguments for ``create_engine``/``create_async_engine``.
+        Empty for SQLite, which uses SQLAlchemy's default pooling.
+    """
+    if make_url(settings.database_url).get_backend_name() == "sqlite":
+        return {}
+
+    options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if async_driver:
+        options["poolclass"] = InstrumentedAsyncQueuePool
+    if settings.db_statement_timeout_ms:
+        timeout = str(settings.db_statement_timeout_ms)
+        options["connect_args"] = (
+            {"server_settings": {"statement_timeout": timeout}}
+            if async_driver
+            else {"options": f"-c statement_timeout={timeout}"}
+        )
+    return options
+
+
+engine = create_engine(
+    settings.database_url, future=True, echo=False, **engine_options(False)
+)
 SessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine, future=True
 )
 
+async_engine = create_async_engine(
+    to_async_url(settings.database_url), echo=False, **engine_options(True)
+)
+instrument_pool(async_engine.sync_engine)
+instrument_queries(async_engine.sync_engine)
+instrument_queries(engine)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Provide a transactional database session.
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a transactional async database session.
 
     Yields:
-        Session: SQLAlchemy database session.
+        AsyncSession: SQLAlchemy async database session.
 
     Note:
         The session is automatically closed after the request completes.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
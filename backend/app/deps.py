@@ -4,36 +4,72 @@ This module provides common dependencies for authentication
 and authorization used across API endpoints.
 """
 
+import time
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import models, schemas
 from .config import settings
+from .core.cache import TTLCache
 from .core.security import decode_token
 from .db import get_db
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# token -> schemas.UserRead snapshot; entries never outlive the JWT ``exp``.
+# The listeners below only see ORM writes in this process: other workers
+# and Core/bulk statements are covered by the short TTL alone.
+user_cache = TTLCache(
+    maxsize=settings.auth_cache_size, ttl=settings.auth_cache_ttl_seconds
+)
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-) -> models.User:
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop every cached token that resolves to ``user_id``.
+
+    Args:
+        user_id: ID of the user whose cached snapshots are stale.
+    """
+    user_cache.delete_where(lambda user: user.id == user_id)
+
+
+@event.listens_for(models.User, "after_insert")
+@event.listens_for(models.User, "after_update")
+@event.listens_for(models.User, "after_delete")
+def _invalidate_on_user_write(mapper, connection, target: models.User) -> None:
+    """Keep the user cache consistent with writes to the users table."""
+    invalidate_cached_user(target.id)
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+) -> schemas.UserRead:
     """Extract and validate the current user from JWT token.
 
+    Validated tokens are cached with a snapshot of their user, so repeat
+    requests skip both JWT decoding and the users lookup until the entry
+    expires (``AUTH_CACHE_TTL_SECONDS``), the token expires, or the user
+    is written through this worker's ORM session.
+
     Args:
         token: JWT access token from Authorization header.
         db: Database session.
 
     Returns:
-        models.User: The authenticated user instance.
+        schemas.UserRead: Snapshot of the authenticated user.
 
     Raises:
         HTTPException: 401 Unauthorized if token is invalid or user not found.
     """
+    cached = user_cache.get(token)
+    if cached is not None:
+        return cached
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -51,7 +87,12 @@ def get_current_user(
     except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    result = await db.execute(select(models.User).where(models.User.id == user_id))
+    user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
-    return user
+
+    snapshot = schemas.UserRead.model_validate(user)
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    user_cache.set(token, snapshot, ttl=expires_in)
+    return snapshot
@@ -1,15 +1,41 @@
 """FastAPI application factory and startup configuration.
 
 This module creates and configures the FastAPI application instance,
-including CORS middleware, routers, and database initialization.
+including CORS middleware and routers. The database schema is managed
+by Alembic migrations (``alembic upgrade head``), not at startup.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from .config import settings
-from .db import Base, engine
-from .routers import auth, chat, tasks, users
+from .core.instrumentation import PrometheusMiddleware
+from .core.security import PasswordHasherBusy, password_hasher
+from .db import async_engine
+from .routers import auth, chat, metrics, realtime, tasks, users
+from .services.events import broker
+from .services.http_client import close_llm_client, start_llm_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage application-lifetime resources.
+
+    Opens the pooled DeepSeek HTTP client and the task event broker on
+    startup, and closes them, the async database pool and the password
+    worker pool on shutdown.
+    """
+    await start_llm_client()
+    await broker.start()
+    yield
+    await broker.stop()
+    await close_llm_client()
+    await async_engine.dispose()
+    password_hasher.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -20,9 +46,11 @@ def create_app() -> FastAPI:
 
     Note:
         - CORS origins are configured from environment variables.
-        - Includes auth, users, tasks, and chat routers.
+        - Includes auth, users, tasks, chat, metrics, and realtime routers.
     """
-    app = FastAPI(title="Task Management API", debug=settings.app_debug)
+    app = FastAPI(
+        title="Task Management API", debug=settings.app_debug, lifespan=lifespan
+    )
 
     # Get allowed origins from settings
     allowed_origins = settings.get_cors_origins()
@@ -38,14 +66,29 @@ def create_app() -> FastAPI:
             "Accept",
             "Origin",
             "User-Agent",
+            "If-None-Match",
         ],
+        expose_headers=["ETag"],
         max_age=600,  # Cache preflight requests for 10 minutes
     )
+    # Outermost, so latency covers every other middleware
+    app.add_middleware(PrometheusMiddleware)
 
     app.include_router(auth.router)
     app.include_router(users.router)
     app.include_router(tasks.router)
     app.include_router(chat.router)
+    app.include_router(metrics.router)
+    app.include_router(realtime.router)
+
+    @app.exception_handler(PasswordHasherBusy)
+    async def password_hasher_busy(request: Request, exc: PasswordHasherBusy):
+        """Shed login/registration load when the bcrypt pool is full."""
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": "Server sibuk, silakan coba lagi sebentar lagi"},
+            headers={"Retry-After": "1"},
+        )
 
     @app.get("/health")
     def health() -> dict:
@@ -60,6 +103,3 @@ def create_app() -> FastAPI:
 
 
 app = create_app()
-
-# Create tables on startup (simple bootstrap)
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
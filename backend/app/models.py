@@ -9,18 +9,73 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.expression import FunctionElement
 
 from .db import Base
 
+# Weighted text search document for a task (PostgreSQL). Title words rank
+# above description words; "simple" lower-cases without stemming, which
+# suits mixed Indonesian/English text. Queries must use this exact
+# expression to hit the ix_tasks_search GIN index (migration 0005).
+TASK_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')"
+)
+
+
+class next_change_seq(FunctionElement):
+    """Next task change-feed position, assigned by the database.
+
+    Evaluated inside the writing statement, so the position comes from
+    the database rather than from an app server's clock.
+    """
+
+    type = BigInteger()
+    inherit_cache = True
+
+
+@compiles(next_change_seq)
+def _compile_next_change_seq(element, compiler, **kw) -> str:
+    # SQLite serializes writers, so max + 1 cannot be handed out twice
+    # across transactions
+    return "(SELECT coalesce(max(change_seq), 0) + 1 FROM tasks)"
+
+
+@compiles(next_change_seq, "postgresql")
+def _compile_next_change_seq_pg(element, compiler, **kw) -> str:
+    return "nextval('task_change_seq')"
+
+
+class db_utcnow(FunctionElement):
+    """Current time of the database server, as naive UTC."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(db_utcnow)
+def _compile_db_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(db_utcnow, "postgresql")
+def _compile_db_utcnow_pg(element, compiler, **kw) -> str:
+    # Wall-clock time at the statement, not the start of the transaction
+    return "(clock_timestamp() AT TIME ZONE 'UTC')"
+
 
 class TaskStatus(str, enum.Enum):
     """Enumeration of possible task statuses.
@@ -71,10 +126,37 @@ class Task(Base):
         assignee_id: Foreign key to assigned user.
         created_at: Timestamp of task creation.
         updated_at: Timestamp of last update.
+        change_seq: Change-feed position, taken from a database sequence
+            on every insert and update.
+        changed_at: Database time of the last insert or update.
         assignee_rel: Relationship to the assigned User.
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Chat filters by status and deadline range, ordered by deadline
+        Index("ix_tasks_status_deadline", "status", "deadline"),
+        # Keyset pagination of GET /tasks/
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_assignee_id", "assignee_id"),
+        # Tasks by last update
+        Index("ix_tasks_updated_at", "updated_at"),
+        # Change feed order
+        Index("ix_tasks_change_seq_id", "change_seq", "id"),
+        # Open tasks by deadline, for overdue / due-soon lookups
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            postgresql_where=text("status <> 'done'"),
+            sqlite_where=text("status <> 'done'"),
+        ),
+        # Full-text search; PostgreSQL only
+        Index(
+            "ix_tasks_search",
+            text(f"({TASK_SEARCH_VECTOR_SQL})"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(150), nullable=False)
@@ -84,6 +166,13 @@ class Task(Base):
     assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # PostgreSQL also sets both as server defaults, for COPY imports (0006)
+    change_seq = Column(
+        BigInteger, default=next_change_seq(), onupdate=next_change_seq(), nullable=False
+    )
+    changed_at = Column(
+        DateTime, default=db_utcnow(), onupdate=db_utcnow(), nullable=False
+    )
 
     assignee_rel = relationship("User", back_populates="tasks")
 
@@ -95,3 +184,21 @@ class Task(Base):
             Optional[str]: Assignee's name or None if unassigned.
         """
         return self.assignee_rel.name if self.assignee_rel else None
+
+
+class TaskDeletion(Base):
+    """Log of deleted tasks, used as tombstones by the change feed.
+
+    Attributes:
+        id: Monotonic position in the log.
+        task_id: ID of the deleted task.
+        deleted_at: Database time of the deletion; entries older than the
+            retention period are pruned.
+    """
+
+    __tablename__ = "task_deletions"
+    __table_args__ = (Index("ix_task_deletions_deleted_at", "deleted_at"),)
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=db_utcnow(), nullable=False)
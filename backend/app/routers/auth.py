@@ -8,19 +8,20 @@ from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import models, schemas
-from ..core.security import create_access_token, verify_password
+from ..core.security import create_access_token, password_hasher
 from ..db import get_db
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login", response_model=schemas.Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """Authenticate user and return JWT access token.
 
@@ -33,18 +34,28 @@ def login(
 
     Raises:
         HTTPException: 401 Unauthorized if credentials are invalid.
+        PasswordHasherBusy: If the password worker pool is full (429).
     """
-    user = (
-        db.query(models.User)
-        .filter(models.User.email == form_data.username)
-        .first()
+    result = await db.execute(
+        select(models.User).where(models.User.email == form_data.username)
     )
-    if not user or not verify_password(form_data.password, user.password_hash):
+    user = result.scalar_one_or_none()
+    valid, new_hash = (False, None)
+    if user:
+        valid, new_hash = await password_hasher.verify_and_update(
+            form_data.password, user.password_hash
+        )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
 
+    # BCRYPT_ROUNDS changed since this hash was made: store the new one
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+
     access_token = create_access_token(
         data={"sub": str(user.id), "email": user.email},
         expires_delta=timedelta(minutes=60),
@@ -4,20 +4,39 @@ This module provides the chatbot endpoint that uses DeepSeek AI
 to answer questions about tasks with smart filtering.
 """
 
-from datetime import datetime, timedelta
-from typing import List
+import asyncio
+import json
+from contextlib import nullcontext
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from .. import models
-from ..db import get_db
+from .. import models, schemas
+from ..db import AsyncSessionLocal, get_db
 from ..deps import get_current_user
-from ..services.chatbot import _detect_intent, ask_deepseek
+from ..services.answer_cache import answer_cache, make_answer_key
+from ..services.chatbot import (
+    ChatbotError,
+    _detect_intent,
+    ask_deepseek,
+    stream_deepseek,
+)
+from ..services.fast_answers import intent_filters, try_fast_answer
+from ..services.search import search_tasks
+from ..services.single_flight import Broadcast, chat_flights
+from ..services.task_stats import get_task_statistics, get_tasks_version
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Answers being streamed from DeepSeek, by answer cache key; each is also
+# the chat_flights flight for that key
+_answer_streams: Dict[str, Broadcast] = {}
+
 
 class ChatRequest(BaseModel):
     """Request model for chat queries.
@@ -34,12 +53,15 @@ class ChatResponse(BaseModel):
 
     Attributes:
         answer: The AI-generated response.
+        source: Which path produced the answer: "rules" (SQL fast path),
+            "cache" (answer cache) or "llm" (DeepSeek).
     """
 
     answer: str
+    source: str = "llm"
 
 
-def _fetch_tasks_smart(db: Session, question: str) -> List[models.Task]:
+async def _fetch_tasks_smart(db: AsyncSession, question: str) -> List[models.Task]:
     """Fetch tasks with smart filtering based on question intent.
 
     Args:
@@ -47,60 +69,149 @@ def _fetch_tasks_smart(db: Session, question: str) -> List[models.Task]:
         question: User's question to analyze for filtering.
 
     Returns:
-        List[models.Task]: Filtered list of tasks (max 50).
+        List[models.Task]: Filtered list of tasks (max 50), most relevant
+        first when the question names something to search for.
     """
     intent = _detect_intent(question)
-    query = db.query(models.Task).join(models.User, isouter=True)
-
-    # Filter by status if detected
-    if intent["filter_status"]:
-        query = query.filter(models.Task.status == intent["filter_status"])
-
-    # Filter by deadline if detected
-    today = datetime.now().date()
-    if intent["filter_deadline"] == "today":
-        query = query.filter(
-            models.Task.deadline >= datetime.combine(today, datetime.min.time()),
-            models.Task.deadline
-            < datetime.combine(today + timedelta(days=1), datetime.min.time()),
-        )
-    elif intent["filter_deadline"] == "tomorrow":
-        tomorrow = today + timedelta(days=1)
-        query = query.filter(
-            models.Task.deadline >= datetime.combine(tomorrow, datetime.min.time()),
-            models.Task.deadline
-            < datetime.combine(tomorrow + timedelta(days=1), datetime.min.time()),
-        )
-    elif intent["filter_deadline"] == "overdue":
-        query = query.filter(
-            models.Task.deadline < datetime.combine(today, datetime.min.time()),
-            models.Task.status != models.TaskStatus.done,
-        )
-    elif intent["filter_deadline"] == "this_week":
-        week_end = today + timedelta(days=(6 - today.weekday()))
-        query = query.filter(
-            models.Task.deadline >= datetime.combine(today, datetime.min.time()),
-            models.Task.deadline <= datetime.combine(week_end, datetime.max.time()),
+    if intent["search_keyword"]:
+        return await search_tasks(
+            db, intent["search_keyword"], intent_filters(intent), limit=50
         )
+    query = (
+        select(models.Task)
+        .options(joinedload(models.Task.assignee_rel))
+        .where(*intent_filters(intent))
+    )
 
     # Order by deadline (null last), then by created_at
-    return (
+    result = await db.execute(
         query.order_by(
             models.Task.deadline.asc().nullslast(), models.Task.created_at.desc()
+        ).limit(50)
+    )
+    return list(result.scalars().all())
+
+
+async def _load_context_tasks(
+    db: AsyncSession, question: str
+) -> List[models.Task]:
+    """Fetch the tasks used as LLM context for a question.
+
+    Args:
+        db: Database session.
+        question: User's question.
+
+    Returns:
+        List[models.Task]: Intent-filtered tasks, or the first 50 tasks by
+        deadline when the filter matches nothing.
+    """
+    tasks = await _fetch_tasks_smart(db, question)
+
+    # If no results from filter, get all tasks for context
+    if not tasks:
+        result = await db.execute(
+            select(models.Task)
+            .options(joinedload(models.Task.assignee_rel))
+            .order_by(models.Task.deadline.asc().nullslast())
+            .limit(50)
         )
-        .limit(50)
-        .all()
+        tasks = list(result.scalars().all())
+    return tasks
+
+
+async def _answer_cache_key(db: AsyncSession, question: str) -> str:
+    """Build the answer cache key for ``question`` at the current version."""
+    return make_answer_key(
+        question, _detect_intent(question), await get_tasks_version(db)
     )
 
 
+async def _answer_with_llm(question: str, cache_key: str) -> str:
+    """Load the context, ask DeepSeek and cache the answer.
+
+    Runs as a single flight shared by identical concurrent questions,
+    detached from the request that started it, so it uses its own
+    session. The session is closed before the LLM call so no database
+    connection is held while waiting for DeepSeek.
+
+    Args:
+        question: The user's question.
+        cache_key: Answer cache key of the question.
+
+    Returns:
+        str: The answer.
+
+    Raises:
+        ChatbotError: If DeepSeek fails.
+    """
+    async with AsyncSessionLocal() as db:
+        tasks = await _load_context_tasks(db, question)
+        stats = await get_task_statistics(db)
+    answer = await ask_deepseek(question, tasks, stats)
+    await answer_cache.set(cache_key, answer)
+    return answer
+
+
+async def _stream_with_llm(question: str, cache_key: str, broadcast: Broadcast) -> str:
+    """Stream a DeepSeek answer to every subscriber of ``broadcast``.
+
+    Runs as a single flight like :func:`_answer_with_llm`. Once every
+    subscriber has gone (client disconnects), the upstream response is
+    closed so no further tokens are paid for and nothing is cached.
+
+    Args:
+        question: The user's question.
+        cache_key: Answer cache key of the question.
+        broadcast: Where the chunks are published.
+
+    Returns:
+        str: The complete answer.
+
+    Raises:
+        ChatbotError: If DeepSeek fails or the stream was abandoned.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            tasks = await _load_context_tasks(db, question)
+            stats = await get_task_statistics(db)
+        chunks = stream_deepseek(question, tasks, stats)
+        try:
+            async for chunk in chunks:
+                if broadcast.abandoned:
+                    raise ChatbotError("Maaf, terjadi kesalahan. Silakan coba lagi.")
+                broadcast.publish(chunk)
+        finally:
+            # Closes the upstream response if we stopped early
+            await chunks.aclose()
+    finally:
+        broadcast.close()
+        if _answer_streams.get(cache_key) is broadcast:
+            del _answer_streams[cache_key]
+    answer = "".join(broadcast.parts)
+    await answer_cache.set(cache_key, answer)
+    return answer
+
+
+def _sse(data: dict, event: Optional[str] = None) -> str:
+    """Format one Server-Sent Events message."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
 @router.post("/query", response_model=ChatResponse)
 async def chat_query(
     payload: ChatRequest,
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
 ) -> ChatResponse:
     """Process a chat query using DeepSeek AI.
 
+    Statistical questions are answered straight from SQL without calling
+    the LLM. Other answers are cached per normalized question, intent and
+    task-data version; failed LLM calls are returned but never cached.
+    Identical questions asked while an answer is being generated wait for
+    that answer instead of calling DeepSeek again.
+
     Args:
         payload: Chat request containing the question.
         db: Database session.
@@ -116,18 +227,109 @@ async def chat_query(
     if not payload.question or not payload.question.strip():
         raise HTTPException(status_code=400, detail="Pertanyaan tidak boleh kosong")
 
-    # Fetch tasks with smart filtering
-    tasks = _fetch_tasks_smart(db, payload.question)
+    fast_answer = await try_fast_answer(db, payload.question)
+    if fast_answer is not None:
+        return ChatResponse(answer=fast_answer, source="rules")
 
-    # If no results from filter, get all tasks for context
-    if not tasks:
-        tasks = (
-            db.query(models.Task)
-            .join(models.User, isouter=True)
-            .order_by(models.Task.deadline.asc().nullslast())
-            .limit(50)
-            .all()
-        )
+    cache_key = await _answer_cache_key(db, payload.question)
+    cached = await answer_cache.get(cache_key)
+    if cached is not None:
+        return ChatResponse(answer=cached, source="cache")
 
-    answer = await ask_deepseek(payload.question, tasks)
+    # Joining a streamed answer keeps it from being abandoned meanwhile
+    stream = _answer_streams.get(cache_key)
+    try:
+        with stream.subscription() if stream else nullcontext():
+            answer = await chat_flights.do(
+                cache_key, lambda: _answer_with_llm(payload.question, cache_key)
+            )
+    except ChatbotError as exc:
+        return ChatResponse(answer=exc.message)
     return ChatResponse(answer=answer)
+
+
+@router.post("/stream")
+async def chat_stream(
+    payload: ChatRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream a chat answer as Server-Sent Events.
+
+    Each message carries ``{"delta": "<text>"}``; the stream ends with a
+    ``done`` event whose data reports the ``source`` ("rules", "cache" or
+    "llm"), or an ``error`` event with a user-facing message. Identical
+    questions streamed at the same time share one upstream DeepSeek
+    stream, each receiving every delta; once all of their clients have
+    disconnected, the upstream request is closed so no further tokens are
+    paid for. If the same question is already being answered by
+    ``/chat/query``, the stream waits for that answer and sends it as one
+    delta.
+
+    Args:
+        payload: Chat request containing the question.
+        request: Incoming request, used to detect client disconnects.
+        db: Database session.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` response.
+
+    Raises:
+        HTTPException: 400 Bad Request if question is empty.
+    """
+    if not payload.question or not payload.question.strip():
+        raise HTTPException(status_code=400, detail="Pertanyaan tidak boleh kosong")
+
+    cache_key = None
+    ready_answer = await try_fast_answer(db, payload.question)
+    source = "rules"
+    if ready_answer is None:
+        cache_key = await _answer_cache_key(db, payload.question)
+        ready_answer = await answer_cache.get(cache_key)
+        source = "cache"
+    flight = broadcast = None
+    if ready_answer is None:
+        source = "llm"
+        flight = chat_flights.join(cache_key)
+        if flight is None:
+            broadcast = Broadcast()
+            _answer_streams[cache_key] = broadcast
+            flight = chat_flights.start(
+                cache_key,
+                lambda: _stream_with_llm(payload.question, cache_key, broadcast),
+            )
+        else:
+            # None when the flight is a /chat/query answer
+            broadcast = _answer_streams.get(cache_key)
+
+    async def events() -> AsyncIterator[str]:
+        if ready_answer is not None:
+            yield _sse({"delta": ready_answer})
+            yield _sse({"source": source}, event="done")
+            return
+
+        if broadcast is not None:
+            chunks = broadcast.follow()
+            try:
+                async for chunk in chunks:
+                    if await request.is_disconnected():
+                        return
+                    yield _sse({"delta": chunk})
+            finally:
+                await chunks.aclose()
+        try:
+            answer = await asyncio.shield(flight)
+        except ChatbotError as exc:
+            yield _sse({"message": exc.message}, event="error")
+            return
+        if broadcast is None:
+            yield _sse({"delta": answer})
+        yield _sse({"source": source}, event="done")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,184 @@
+"""Metrics router for operational visibility.
+
+This module exposes internal counters (cache effectiveness and
+similar) so hot paths can be monitored in production. ``/metrics``
+serves everything in the Prometheus text format; ``/metrics/cache`` and
+``/metrics/pool`` return JSON summaries.
+"""
+
+from fastapi import APIRouter, Response
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..core.db_pool import pool_stats
+from ..core.instrumentation import registry
+from ..core.metrics import CONTENT_TYPE, Counter, Gauge, HistogramFamily
+from ..core.security import password_hasher
+from ..db import async_engine
+from ..deps import user_cache
+from ..services.answer_cache import answer_cache
+from ..services.events import hub
+from ..services.llm_guard import CircuitBreaker, llm_guard
+from ..services.single_flight import chat_flights
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+def _cache_stats() -> dict:
+    return {"auth": user_cache.stats(), "chat_answers": answer_cache.stats()}
+
+
+def _cache_metric(field: str):
+    return lambda: [((name,), stats[field]) for name, stats in _cache_stats().items()]
+
+
+def _pool_gauge(method: str):
+    def collect():
+        pool = async_engine.pool
+        if not isinstance(pool, AsyncAdaptedQueuePool):
+            return []
+        return [((), max(getattr(pool, method)(), 0))]
+    return collect
+
+
+registry.register(Counter(
+    "cache_hits_total", "Cache lookups served from the cache.", ("cache",),
+    func=_cache_metric("hits"),
+))
+registry.register(Counter(
+    "cache_misses_total", "Cache lookups that found nothing.", ("cache",),
+    func=_cache_metric("misses"),
+))
+registry.register(Gauge(
+    "cache_hit_ratio", "Share of cache lookups that were hits.", ("cache",),
+    func=_cache_metric("hit_rate"),
+))
+registry.register(Gauge(
+    "db_pool_checked_out", "Connections currently checked out.",
+    func=_pool_gauge("checkedout"),
+))
+registry.register(Gauge(
+    "db_pool_overflow", "Overflow connections currently open.",
+    func=_pool_gauge("overflow"),
+))
+registry.register(Counter(
+    "db_pool_checkouts_total", "Successful connection checkouts.",
+    func=lambda: [((), pool_stats.checkouts)],
+))
+registry.register(Counter(
+    "db_pool_timeouts_total", "Checkouts that timed out waiting for a connection.",
+    func=lambda: [((), pool_stats.timeouts)],
+))
+for _name, _histogram, _help in (
+    ("db_pool_checkout_seconds", pool_stats.checkout_latency, "Connection checkout latency."),
+    ("db_pool_wait_seconds", pool_stats.wait_time, "Checkout latency when the pool was exhausted."),
+    ("db_pool_hold_seconds", pool_stats.hold_time, "Time connections stay checked out."),
+):
+    registry.register(HistogramFamily(_name, _help)).bind(_histogram)
+registry.register(Gauge(
+    "websocket_connections", "Connected realtime task event clients.",
+    func=lambda: [((), hub.stats()["connections"])],
+))
+registry.register(Counter(
+    "websocket_events_delivered_total", "Task events queued to clients.",
+    func=lambda: [((), hub.delivered)],
+))
+registry.register(Counter(
+    "websocket_slow_consumers_dropped_total", "Clients disconnected for falling behind.",
+    func=lambda: [((), hub.dropped)],
+))
+registry.register(Counter(
+    "chat_llm_flights_total", "Chat answers generated by a DeepSeek call.",
+    func=lambda: [((), chat_flights.flights)],
+))
+registry.register(Counter(
+    "chat_coalesced_requests_total",
+    "Chat requests that shared an identical in-flight DeepSeek call.",
+    func=lambda: [((), chat_flights.coalesced)],
+))
+registry.register(Gauge(
+    "chat_llm_in_flight", "DeepSeek calls currently generating chat answers.",
+    func=lambda: [((), chat_flights.stats()["in_flight"])],
+))
+registry.register(Gauge(
+    "llm_active_requests", "DeepSeek requests holding a concurrency slot.",
+    func=lambda: [((), llm_guard.limiter.active)],
+))
+registry.register(Gauge(
+    "llm_waiting_requests", "Requests waiting for a DeepSeek concurrency slot.",
+    func=lambda: [((), llm_guard.limiter.waiting)],
+))
+registry.register(Counter(
+    "llm_rejected_total", "DeepSeek calls refused without contacting the API.",
+    ("reason",),
+    func=lambda: [
+        (("busy",), llm_guard.limiter.rejected),
+        (("circuit_open",), llm_guard.breaker.rejected),
+    ],
+))
+registry.register(Counter(
+    "llm_retries_total", "DeepSeek request retries.",
+    func=lambda: [((), llm_guard.retries)],
+))
+registry.register(Gauge(
+    "llm_circuit_open", "1 while the DeepSeek circuit breaker refuses calls.",
+    func=lambda: [((), int(llm_guard.breaker.state == CircuitBreaker.OPEN))],
+))
+registry.register(Counter(
+    "llm_circuit_opened_total", "Times the DeepSeek circuit breaker opened.",
+    func=lambda: [((), llm_guard.breaker.opened)],
+))
+registry.register(Gauge(
+    "password_hash_pending", "bcrypt operations running or queued.",
+    func=lambda: [((), password_hasher.pending)],
+))
+registry.register(Counter(
+    "password_hash_rejected_total", "bcrypt operations rejected with 429.",
+    func=lambda: [((), password_hasher.rejected)],
+))
+
+
+@router.get("")
+def prometheus_metrics() -> Response:
+    """Expose all metrics in the Prometheus text format.
+
+    Returns:
+        Response: ``text/plain`` exposition for a Prometheus scrape.
+    """
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+@router.get("/cache")
+def cache_metrics() -> dict:
+    """Report hit/miss counters for the in-process caches.
+
+    Returns:
+        dict: Stats per cache, keyed by cache name.
+    """
+    return _cache_stats()
+
+
+@router.get("/chat")
+def chat_metrics() -> dict:
+    """Report chat answer cache, coalescing and LLM guard counters.
+
+    Returns:
+        dict: ``answers`` (cache hits/misses), ``flights`` (DeepSeek
+        calls started, requests coalesced onto them, calls in flight) and
+        ``llm`` (concurrency, rejections, retries, circuit state).
+    """
+    return {
+        "answers": answer_cache.stats(),
+        "flights": chat_flights.stats(),
+        "llm": llm_guard.stats(),
+    }
+
+
+@router.get("/pool")
+def pool_metrics() -> dict:
+    """Report database connection pool usage and checkout latency.
+
+    Returns:
+        dict: Pool gauges (size, checked out, overflow), counters
+        (checkouts, timeouts) and latency summaries in seconds.
+    """
+    return pool_stats.snapshot(async_engine.pool)
@@ -0,0 +1,70 @@
+"""Realtime router pushing task changes over WebSocket.
+
+This module provides the ``/ws/tasks`` endpoint. Each connected board
+receives ``task.created``, ``task.updated`` and ``task.deleted`` events
+(and ``tasks.reload`` after bulk writes) as JSON text frames.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query, WebSocket, status
+from starlette.websockets import WebSocketDisconnect
+
+from ..db import AsyncSessionLocal
+from ..deps import get_current_user
+from ..services.events import Subscriber, hub
+
+router = APIRouter(tags=["realtime"])
+
+# Close code sent to clients dropped for falling behind ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+async def _send_events(websocket: WebSocket, subscriber: Subscriber) -> None:
+    """Forward queued events to the socket until dropped or disconnected."""
+    try:
+        while True:
+            message = await subscriber.queue.get()
+            if message is None:
+                await websocket.close(
+                    code=SLOW_CONSUMER_CLOSE_CODE, reason="slow consumer"
+                )
+                return
+            await websocket.send_text(message)
+    except (WebSocketDisconnect, RuntimeError):
+        # The client went away mid-send; the receive loop cleans up
+        return
+
+
+@router.websocket("/ws/tasks")
+async def task_events(websocket: WebSocket, token: str = Query(...)) -> None:
+    """Stream task change events to a connected client.
+
+    Browsers cannot set an ``Authorization`` header on WebSocket requests,
+    so the JWT is passed as the ``token`` query parameter. Clients that
+    are disconnected as slow consumers (close code 1013) should
+    reconnect and catch up with ``GET /tasks/changes``.
+
+    Args:
+        websocket: The WebSocket connection.
+        token: JWT access token.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            await get_current_user(token=token, db=db)
+        except HTTPException:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+    await websocket.accept()
+    subscriber = hub.subscribe()
+    sender = asyncio.create_task(_send_events(websocket, subscriber))
+    try:
+        # Clients only listen; receiving just detects the disconnect
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        hub.unsubscribe(subscriber)
+        sender.cancel()
@@ -4,40 +4,296 @@ This module provides endpoints for creating, reading, updating,
 and deleting tasks.
 """
 
-from typing import List
+import time
+from datetime import datetime, timedelta
+from itertools import takewhile
+from typing import Dict, Iterable, List, Optional, Set, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, func, insert, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from .. import models, schemas
+from ..config import settings
+from ..core.etag import etag_matches, make_weak_etag, not_modified, set_etag
+from ..core.pagination import (
+    ExpiredCursor,
+    InvalidCursor,
+    decode_cursor,
+    decode_sync_cursor,
+    encode_cursor,
+    encode_sync_cursor,
+)
 from ..db import get_db
 from ..deps import get_current_user
+from ..services import events
+from ..services.answer_cache import answer_cache
+from ..services.search import search_index, search_tasks
+from ..services.task_export import EXPORT_FORMATS, export_tasks
+from ..services.task_import import IMPORT_FORMATS, import_tasks
+from ..services.task_stats import get_tasks_version
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Upper bound for the ``limit`` query parameter of list endpoints
+MAX_PAGE_SIZE = 200
 
-@router.get("/", response_model=List[schemas.TaskRead])
-def list_tasks(
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
-) -> List[models.Task]:
-    """Retrieve all tasks ordered by creation date (newest first).
+# Minimum seconds between task_deletions prunes, per worker
+DELETION_PRUNE_INTERVAL = 3600.0
+_last_deletion_prune = float("-inf")
+
+
+async def _tasks_changed() -> None:
+    """Invalidate caches derived from task data after a committed write."""
+    await answer_cache.invalidate()
+    search_index.invalidate()
+
+
+async def _get_task(db: AsyncSession, task_id: int) -> Optional[models.Task]:
+    """Load a task with its assignee, refreshing any copy already in the session.
+
+    Args:
+        db: Database session.
+        task_id: The task's unique identifier.
+
+    Returns:
+        Optional[models.Task]: The task, or None if it doesn't exist.
+    """
+    result = await db.execute(
+        select(models.Task)
+        .options(joinedload(models.Task.assignee_rel))
+        .where(models.Task.id == task_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _record_deletions(db: AsyncSession, task_ids: Iterable[int]) -> None:
+    """Log deleted task IDs so the change feed can report tombstones.
+
+    Must run in the same transaction as the delete.
+
+    Args:
+        db: Database session.
+        task_ids: IDs of the tasks being deleted.
+    """
+    rows = [{"task_id": task_id} for task_id in task_ids]
+    if rows:
+        await db.execute(insert(models.TaskDeletion), rows)
+        await _prune_deletions(db)
+
+
+async def _db_now(db: AsyncSession) -> datetime:
+    """Return the database server's current time as naive UTC.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        datetime: Current database time.
+    """
+    result = await db.execute(select(models.db_utcnow()))
+    return result.scalar_one()
+
+
+async def _prune_deletions(db: AsyncSession) -> None:
+    """Drop tombstones older than the change-feed retention period.
+
+    Runs in the caller's transaction, at most once per
+    ``DELETION_PRUNE_INTERVAL`` per worker.
+
+    Args:
+        db: Database session.
+    """
+    global _last_deletion_prune
+    now = time.monotonic()
+    if now - _last_deletion_prune < DELETION_PRUNE_INTERVAL:
+        return
+    _last_deletion_prune = now
+    cutoff = await _db_now(db) - timedelta(days=settings.changes_retention_days)
+    await db.execute(
+        delete(models.TaskDeletion).where(models.TaskDeletion.deleted_at < cutoff)
+    )
+
+
+async def _get_tasks(db: AsyncSession, task_ids: Iterable[int]) -> Dict[int, models.Task]:
+    """Load several tasks with their assignees in one query.
+
+    Args:
+        db: Database session.
+        task_ids: IDs of the tasks to load.
+
+    Returns:
+        Dict[int, models.Task]: Tasks found, keyed by ID.
+    """
+    task_ids = set(task_ids)
+    if not task_ids:
+        return {}
+    result = await db.execute(
+        select(models.Task)
+        .options(joinedload(models.Task.assignee_rel))
+        .where(models.Task.id.in_(task_ids))
+        .execution_options(populate_existing=True)
+    )
+    return {task.id: task for task in result.scalars()}
+
+
+async def _existing_user_ids(db: AsyncSession, user_ids: Iterable[Optional[int]]) -> Set[int]:
+    """Return which of ``user_ids`` exist, using a single ``IN`` query.
+
+    Args:
+        db: Database session.
+        user_ids: Candidate user IDs; empty values are ignored.
+
+    Returns:
+        Set[int]: The IDs that belong to existing users.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id}
+    if not user_ids:
+        return set()
+    result = await db.execute(
+        select(models.User.id).where(models.User.id.in_(user_ids))
+    )
+    return set(result.scalars())
+
+
+def _bulk_result(results: List[dict]) -> dict:
+    """Wrap per-item results with success and failure counts."""
+    succeeded = sum(1 for r in results if r["ok"])
+    return {"succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
+
+
+async def _ensure_assignee_exists(db: AsyncSession, assignee_id: int) -> None:
+    """Raise 404 unless a user with ``assignee_id`` exists.
+
+    Args:
+        db: Database session.
+        assignee_id: ID of the user to look up.
+
+    Raises:
+        HTTPException: 404 Not Found if the assignee doesn't exist.
+    """
+    result = await db.execute(
+        select(models.User.id).where(models.User.id == assignee_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Assignee not found")
+
+
+@router.get("/", response_model=schemas.TaskPage)
+async def list_tasks(
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status_filter: Optional[models.TaskStatus] = Query(None, alias="status"),
+    assignee_id: Optional[int] = None,
+    deadline_from: Optional[schemas.UTCDatetime] = None,
+    deadline_to: Optional[schemas.UTCDatetime] = None,
+    q: Optional[str] = Query(None, max_length=100),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> Union[dict, Response]:
+    """Retrieve one page of tasks ordered by creation date (newest first).
+
+    Pagination uses a keyset on ``(created_at, id)`` so the cost of a page
+    does not grow with how deep the client has paged. Responses carry a
+    weak ETag derived from the table version and the query; a matching
+    ``If-None-Match`` gets ``304 Not Modified`` without loading the page.
 
     Args:
+        response: Outgoing response, used to set the ETag.
+        limit: Maximum number of tasks to return.
+        cursor: Opaque cursor from the previous page's ``next_cursor``.
+        status_filter: Only return tasks with this status.
+        assignee_id: Only return tasks assigned to this user.
+        deadline_from: Only return tasks with a deadline at or after this time.
+        deadline_to: Only return tasks with a deadline before this time.
+        q: Case-insensitive text to match against title or description.
+        if_none_match: ETag(s) of the client's cached copy.
         db: Database session.
         _: Current authenticated user (unused, for auth only).
 
     Returns:
-        List[models.Task]: List of all tasks.
+        Union[dict, Response]: Page of tasks and the cursor for the next
+        page, or an empty 304 response.
+
+    Raises:
+        HTTPException: 400 Bad Request if the cursor is invalid.
     """
-    return db.query(models.Task).order_by(models.Task.created_at.desc()).all()
+    etag = make_weak_etag(
+        await get_tasks_version(db),
+        limit, cursor, status_filter, assignee_id, deadline_from, deadline_to, q,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    # Load assignees in the same SELECT so serializing assignee_name
+    # does not issue one extra query per task
+    query = select(models.Task).options(joinedload(models.Task.assignee_rel))
+
+    if status_filter is not None:
+        query = query.where(models.Task.status == status_filter)
+    if assignee_id is not None:
+        query = query.where(models.Task.assignee_id == assignee_id)
+    if deadline_from is not None:
+        query = query.where(models.Task.deadline >= deadline_from)
+    if deadline_to is not None:
+        query = query.where(models.Task.deadline < deadline_to)
+    if q:
+        # Match q literally: its own % and _ are not wildcards
+        escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        query = query.where(
+            or_(
+                models.Task.title.ilike(pattern, escape="\\"),
+                models.Task.description.ilike(pattern, escape="\\"),
+            )
+        )
+
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(
+            tuple_(models.Task.created_at, models.Task.id)
+            < tuple_(cursor_created_at, cursor_id)
+        )
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(
+        query.order_by(models.Task.created_at.desc(), models.Task.id.desc()).limit(
+            limit + 1
+        )
+    )
+    rows = result.scalars().all()
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.post("/", response_model=schemas.TaskRead, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     payload: schemas.TaskCreate,
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
 ) -> models.Task:
     """Create a new task.
 
@@ -53,52 +309,411 @@ def create_task(
         HTTPException: 404 Not Found if assignee_id doesn't exist.
     """
     if payload.assignee_id:
-        assignee = (
-            db.query(models.User)
-            .filter(models.User.id == payload.assignee_id)
-            .first()
-        )
-        if not assignee:
-            raise HTTPException(status_code=404, detail="Assignee not found")
+        await _ensure_assignee_exists(db, payload.assignee_id)
 
     task = models.Task(**payload.dict())
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await _tasks_changed()
+    task = await _get_task(db, task.id)
+    await events.publish_task_changes("created", [task])
     return task
 
 
+# The bulk routes are declared before "/{task_id}" so "bulk" is not
+# parsed as a task ID.
+@router.post("/bulk", response_model=schemas.BulkResult)
+async def bulk_create_tasks(
+    payload: schemas.BulkTaskCreate,
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> dict:
+    """Create many tasks in one transaction.
+
+    All assignees are checked with one ``IN`` query and the valid items are
+    written with a single multi-row ``INSERT ... RETURNING``. Items with an
+    unknown assignee are reported as failed; the others are still created.
+
+    Args:
+        payload: Tasks to create.
+        db: Database session.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        dict: Counts and per-item results in request order.
+    """
+    known = await _existing_user_ids(db, (item.assignee_id for item in payload.items))
+
+    results: List[Optional[dict]] = [None] * len(payload.items)
+    rows, row_indexes = [], []
+    for index, item in enumerate(payload.items):
+        if item.assignee_id and item.assignee_id not in known:
+            results[index] = {"index": index, "ok": False, "error": "Assignee not found"}
+        else:
+            rows.append(item.dict())
+            row_indexes.append(index)
+
+    if rows:
+        # sort_by_parameter_order pairs returned IDs with request items.
+        # PostgreSQL keeps this a batched multi-row INSERT; SQLite can't
+        # order multi-row RETURNING, so SQLAlchemy inserts row by row there
+        # (still within this one transaction).
+        result = await db.execute(
+            insert(models.Task).returning(
+                models.Task.id, sort_by_parameter_order=True
+            ),
+            rows,
+        )
+        new_ids = list(result.scalars())
+        await db.commit()
+        await _tasks_changed()
+        tasks = await _get_tasks(db, new_ids)
+        for index, task_id in zip(row_indexes, new_ids):
+            results[index] = {"index": index, "ok": True, "id": task_id, "task": tasks[task_id]}
+        await events.publish_task_changes("created", list(tasks.values()))
+    return _bulk_result(results)
+
+
+@router.put("/bulk", response_model=schemas.BulkResult)
+async def bulk_update_tasks(
+    payload: schemas.BulkTaskUpdate,
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> dict:
+    """Apply partial updates to many tasks in one transaction.
+
+    Tasks and assignees are each loaded with one ``IN`` query. Items whose
+    task or assignee doesn't exist are reported as failed; the others are
+    still applied.
+
+    Args:
+        payload: Partial updates, each carrying the task ID.
+        db: Database session.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        dict: Counts and per-item results in request order.
+    """
+    tasks = await _get_tasks(db, (item.id for item in payload.items))
+    known = await _existing_user_ids(db, (item.assignee_id for item in payload.items))
+
+    results, updated = [], []
+    for index, item in enumerate(payload.items):
+        task = tasks.get(item.id)
+        data = item.dict(exclude_unset=True, exclude={"id"})
+        if task is None:
+            results.append({"index": index, "ok": False, "id": item.id, "error": "Task not found"})
+        elif data.get("assignee_id") and data["assignee_id"] not in known:
+            results.append({"index": index, "ok": False, "id": item.id, "error": "Assignee not found"})
+        else:
+            for field, value in data.items():
+                setattr(task, field, value)
+            results.append({"index": index, "ok": True, "id": item.id})
+            updated.append(item.id)
+
+    if updated:
+        await db.commit()
+        await _tasks_changed()
+        # Reload so assignee_name reflects changed assignee_ids
+        tasks = await _get_tasks(db, updated)
+        for result in results:
+            if result["ok"]:
+                result["task"] = tasks[result["id"]]
+        await events.publish_task_changes("updated", list(tasks.values()))
+    return _bulk_result(results)
+
+
+@router.delete("/bulk", response_model=schemas.BulkResult)
+async def bulk_delete_tasks(
+    payload: schemas.BulkTaskDelete,
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> dict:
+    """Delete many tasks with a single ``DELETE ... RETURNING``.
+
+    Args:
+        payload: IDs of the tasks to delete.
+        db: Database session.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        dict: Counts and per-item results; unknown IDs are reported as
+        failed.
+    """
+    result = await db.execute(
+        delete(models.Task)
+        .where(models.Task.id.in_(set(payload.ids)))
+        .returning(models.Task.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = set(result.scalars())
+    if deleted:
+        await _record_deletions(db, deleted)
+        await db.commit()
+        await _tasks_changed()
+        await events.publish_task_deletions(sorted(deleted))
+
+    return _bulk_result([
+        {"index": index, "ok": True, "id": task_id}
+        if task_id in deleted
+        else {"index": index, "ok": False, "id": task_id, "error": "Task not found"}
+        for index, task_id in enumerate(payload.ids)
+    ])
+
+
+@router.get("/search", response_model=List[schemas.TaskRead])
+async def search_task_text(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    status_filter: Optional[models.TaskStatus] = Query(None, alias="status"),
+    assignee_id: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> Union[List[models.Task], Response]:
+    """Full-text search over task titles and descriptions, best match first.
+
+    Every word of ``q`` must appear in the title or description, as a
+    whole word or a word prefix; title matches rank higher. On PostgreSQL
+    the search uses the ``ix_tasks_search`` GIN index.
+
+    Args:
+        response: Outgoing response, used to set the ETag.
+        q: Search words.
+        limit: Maximum number of tasks to return.
+        status_filter: Only return tasks with this status.
+        assignee_id: Only return tasks assigned to this user.
+        if_none_match: ETag(s) of the client's cached copy.
+        db: Database session.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        Union[List[models.Task], Response]: Matching tasks, or an empty
+        304 response.
+    """
+    etag = make_weak_etag(
+        await get_tasks_version(db), "search", q, limit, status_filter, assignee_id
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    conditions = []
+    if status_filter is not None:
+        conditions.append(models.Task.status == status_filter)
+    if assignee_id is not None:
+        conditions.append(models.Task.assignee_id == assignee_id)
+    return await search_tasks(db, q, conditions, limit)
+
+
+@router.get("/changes", response_model=schemas.TaskChanges)
+async def list_task_changes(
+    since: Optional[str] = None,
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> dict:
+    """Return tasks created, updated or deleted since a sync cursor.
+
+    Without ``since`` the feed starts from the beginning: every current
+    task, and no older tombstones. Changes are ordered by the
+    database-assigned ``(change_seq, id)``; deletions come from the
+    ``task_deletions`` log in ID order. Both sequences are numbered before
+    commit, so a change is only served once it is older than
+    ``changes_safety_lag_seconds`` (by the database clock), and each page
+    stops at the first younger one: a write with a lower number that
+    commits late is still ahead of the cursor. Clients upsert ``items`` by
+    ID, remove ``deleted`` IDs, store ``next_cursor`` and call again while
+    ``has_more`` is true.
+
+    Args:
+        since: ``next_cursor`` from the previous call.
+        limit: Maximum number of changed tasks (and of tombstones) returned.
+        db: Database session.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        dict: Changed tasks, tombstones and the cursor for the next call.
+
+    Raises:
+        HTTPException: 400 Bad Request if the cursor is invalid; 410 Gone
+            if it is older than the tombstone retention, in which case the
+            client must sync again without ``since``.
+    """
+    now = await _db_now(db)
+    lag = timedelta(seconds=settings.changes_safety_lag_seconds)
+    horizon = now - lag
+    if since:
+        try:
+            change_seq, last_id, deletion_id, issued_at = decode_sync_cursor(since)
+        except ExpiredCursor:
+            raise HTTPException(status_code=410, detail="Cursor expired")
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # The cursor still needs tombstones from issued_at - lag onwards
+        retention = timedelta(days=settings.changes_retention_days)
+        if issued_at - lag < now - retention:
+            raise HTTPException(status_code=410, detail="Cursor expired")
+    else:
+        # A full snapshot needs no tombstones for tasks already gone:
+        # start after the settled part of the log
+        result = await db.execute(
+            select(func.max(models.TaskDeletion.id)).where(
+                models.TaskDeletion.deleted_at < horizon
+            )
+        )
+        change_seq, last_id, deletion_id = 0, 0, result.scalar() or 0
+
+    result = await db.execute(
+        select(models.Task)
+        .options(joinedload(models.Task.assignee_rel))
+        .where(
+            tuple_(models.Task.change_seq, models.Task.id)
+            > tuple_(change_seq, last_id)
+        )
+        .order_by(models.Task.change_seq, models.Task.id)
+        .limit(limit + 1)
+    )
+    rows = list(takewhile(lambda t: t.changed_at < horizon, result.scalars()))
+    items = rows[:limit]
+
+    result = await db.execute(
+        select(models.TaskDeletion)
+        .where(models.TaskDeletion.id > deletion_id)
+        .order_by(models.TaskDeletion.id)
+        .limit(limit + 1)
+    )
+    deletions = list(takewhile(lambda d: d.deleted_at < horizon, result.scalars()))
+    tombstones = deletions[:limit]
+
+    if items:
+        change_seq, last_id = items[-1].change_seq, items[-1].id
+    if tombstones:
+        deletion_id = tombstones[-1].id
+    return {
+        "items": items,
+        "deleted": [{"id": d.task_id, "deleted_at": d.deleted_at} for d in tombstones],
+        "next_cursor": encode_sync_cursor(change_seq, last_id, deletion_id, now),
+        "has_more": len(rows) > limit or len(deletions) > limit,
+    }
+
+
+@router.get("/export")
+async def export_all_tasks(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream every task as NDJSON or CSV.
+
+    Rows are read with a server-side cursor and encoded in batches, so
+    memory stays flat however large the table is.
+
+    Args:
+        fmt: Output format, ``ndjson`` (default) or ``csv``.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        StreamingResponse: The export as a file download.
+    """
+    return StreamingResponse(
+        export_tasks(fmt),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{fmt}"'},
+    )
+
+
+@router.post("/import", response_model=schemas.TaskImportResult)
+async def import_task_file(
+    file: UploadFile = File(...),
+    fmt: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> dict:
+    """Import tasks from an uploaded CSV or NDJSON file.
+
+    Accepts the columns produced by ``/tasks/export``; ``id`` and the
+    timestamps are ignored and assignees may be given by
+    ``assignee_id``, ``assignee_email`` or ``assignee_name``. Invalid rows
+    are skipped and reported without aborting the import.
+
+    Args:
+        file: The uploaded file.
+        fmt: ``csv`` or ``ndjson``; inferred from the file name if omitted.
+        db: Database session.
+        _: Current authenticated user (unused, for auth only).
+
+    Returns:
+        dict: Imported/failed counts, throughput and row errors.
+
+    Raises:
+        HTTPException: 400 Bad Request if the format cannot be determined.
+    """
+    if fmt is None:
+        extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+        fmt = "ndjson" if extension in ("jsonl", "ndjson") else extension
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported import format")
+
+    report = await import_tasks(db, file.file, fmt)
+    if report["imported"]:
+        await _tasks_changed()
+        await events.publish_reload()
+    return report
+
+
 @router.get("/{task_id}", response_model=schemas.TaskRead)
-def get_task(
+async def get_task(
     task_id: int,
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
-) -> models.Task:
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> Union[models.Task, Response]:
     """Retrieve a single task by ID.
 
+    The weak ETag is derived from the task's ``updated_at`` and assignee,
+    read with a narrow query before the full row is loaded.
+
     Args:
         task_id: The task's unique identifier.
+        response: Outgoing response, used to set the ETag.
+        if_none_match: ETag(s) of the client's cached copy.
         db: Database session.
         _: Current authenticated user (unused, for auth only).
 
     Returns:
-        models.Task: The requested task.
+        Union[models.Task, Response]: The requested task, or an empty 304
+        response.
 
     Raises:
         HTTPException: 404 Not Found if task doesn't exist.
     """
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
+    result = await db.execute(
+        select(models.Task.updated_at, models.Task.assignee_id).where(
+            models.Task.id == task_id
+        )
+    )
+    version = result.one_or_none()
+    if version is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    etag = make_weak_etag(task_id, *version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    task = await _get_task(db, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 
 @router.put("/{task_id}", response_model=schemas.TaskRead)
-def update_task(
+async def update_task(
     task_id: int,
     payload: schemas.TaskUpdate,
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
 ) -> models.Task:
     """Update an existing task.
 
@@ -114,32 +729,29 @@ def update_task(
     Raises:
         HTTPException: 404 Not Found if task or assignee doesn't exist.
     """
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
+    task = await _get_task(db, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
     data = payload.dict(exclude_unset=True)
     if "assignee_id" in data and data["assignee_id"]:
-        assignee = (
-            db.query(models.User)
-            .filter(models.User.id == data["assignee_id"])
-            .first()
-        )
-        if not assignee:
-            raise HTTPException(status_code=404, detail="Assignee not found")
+        await _ensure_assignee_exists(db, data["assignee_id"])
 
     for field, value in data.items():
         setattr(task, field, value)
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await _tasks_changed()
+    # Reload so assignee_name reflects a changed assignee_id
+    task = await _get_task(db, task_id)
+    await events.publish_task_changes("updated", [task])
     return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
 ) -> None:
     """Delete a task by ID.
 
@@ -151,9 +763,12 @@ def delete_task(
     Raises:
         HTTPException: 404 Not Found if task doesn't exist.
     """
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
+    task = await db.get(models.Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    await _record_deletions(db, [task_id])
+    await db.commit()
+    await _tasks_changed()
+    await events.publish_task_deletions([task_id])
     return None
@@ -3,13 +3,15 @@
 This module provides endpoints for listing and creating users.
 """
 
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import models, schemas
-from ..core.security import get_password_hash
+from ..core.etag import etag_matches, make_weak_etag, not_modified, set_etag
+from ..core.security import password_hasher
 from ..db import get_db
 from ..deps import get_current_user
 
@@ -17,27 +19,47 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/", response_model=List[schemas.UserRead])
-def list_users(
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
-) -> List[models.User]:
+async def list_users(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
+) -> Union[List[models.User], Response]:
     """Retrieve all users ordered by creation date.
 
+    Users are never edited in place, so the row count and the highest ID
+    identify the list; a matching ``If-None-Match`` gets ``304 Not
+    Modified`` without loading the users.
+
     Args:
+        response: Outgoing response, used to set the ETag.
+        if_none_match: ETag(s) of the client's cached copy.
         db: Database session.
         _: Current authenticated user (unused, for auth only).
 
     Returns:
-        List[models.User]: List of all users.
+        Union[List[models.User], Response]: List of all users, or an empty
+        304 response.
     """
-    return db.query(models.User).order_by(models.User.created_at.desc()).all()
+    version = await db.execute(
+        select(func.count(models.User.id), func.max(models.User.id))
+    )
+    etag = make_weak_etag(*version.one())
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    result = await db.execute(
+        select(models.User).order_by(models.User.created_at.desc())
+    )
+    return list(result.scalars().all())
 
 
 @router.post("/", response_model=schemas.UserRead, status_code=status.HTTP_201_CREATED)
-def create_user(
+async def create_user(
     payload: schemas.UserCreate,
-    db: Session = Depends(get_db),
-    _: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    _: schemas.UserRead = Depends(get_current_user),
 ) -> models.User:
     """Create a new user.
 
@@ -51,18 +73,19 @@ def create_user(
 
     Raises:
         HTTPException: 400 Bad Request if email already exists.
+        PasswordHasherBusy: If the password worker pool is full (429).
     """
-    exists = (
-        db.query(models.User).filter(models.User.email == payload.email).first()
+    result = await db.execute(
+        select(models.User).where(models.User.email == payload.email)
     )
-    if exists:
+    if result.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Email already registered")
     user = models.User(
         name=payload.name,
         email=payload.email,
-        password_hash=get_password_hash(payload.password),
+        password_hash=await password_hasher.hash(payload.password),
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
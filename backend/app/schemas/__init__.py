@@ -4,14 +4,36 @@ This module defines all Pydantic models used for API request validation
 and response serialization.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, EmailStr, Field
 
 from ..models import TaskStatus
 
 
+def to_naive_utc(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive UTC.
+
+    Task timestamps are stored in ``TIMESTAMP WITHOUT TIME ZONE`` columns
+    holding UTC. asyncpg refuses aware values for those columns, and the
+    frontend sends ISO strings with ``Z``, so offsets are resolved here.
+
+    Args:
+        value: Parsed datetime, naive (assumed UTC) or aware.
+
+    Returns:
+        datetime: The same instant as a naive UTC datetime.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# Datetime input normalized to naive UTC, for task fields and filters
+UTCDatetime = Annotated[datetime, AfterValidator(to_naive_utc)]
+
+
 class Token(BaseModel):
     """JWT token response schema.
 
@@ -89,7 +111,7 @@ class TaskBase(BaseModel):
     title: str = Field(..., max_length=150)
     description: str
     status: TaskStatus = TaskStatus.todo
-    deadline: Optional[datetime] = None
+    deadline: Optional[UTCDatetime] = None
     assignee_id: Optional[int] = None
 
 
@@ -108,7 +130,7 @@ class TaskUpdate(BaseModel):
     title: Optional[str] = Field(None, max_length=150)
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
-    deadline: Optional[datetime] = None
+    deadline: Optional[UTCDatetime] = None
     assignee_id: Optional[int] = None
 
 
@@ -130,4 +152,152 @@ class TaskRead(TaskBase):
     class Config:
         """Pydantic configuration."""
 
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class TaskPage(BaseModel):
+    """Schema for one page of a keyset-paginated task listing.
+
+    Attributes:
+        items: Tasks on this page, newest first.
+        next_cursor: Opaque cursor for the next page, or None on the last page.
+    """
+
+    items: List[TaskRead]
+    next_cursor: Optional[str] = None
+
+
+# Max items accepted by one bulk request
+MAX_BULK_ITEMS = 2000
+
+
+class TaskBulkUpdate(TaskUpdate):
+    """Schema for one item of a bulk update.
+
+    Attributes:
+        id: ID of the task to update.
+    """
+
+    id: int
+
+
+class BulkTaskCreate(BaseModel):
+    """Schema for creating many tasks in one request.
+
+    Attributes:
+        items: Tasks to create.
+    """
+
+    items: List[TaskCreate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkTaskUpdate(BaseModel):
+    """Schema for updating many tasks in one request.
+
+    Attributes:
+        items: Partial updates, each carrying the task ID.
+    """
+
+    items: List[TaskBulkUpdate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkTaskDelete(BaseModel):
+    """Schema for deleting many tasks in one request.
+
+    Attributes:
+        ids: IDs of the tasks to delete.
+    """
+
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one item in a bulk request.
+
+    Attributes:
+        index: Position of the item in the request.
+        ok: Whether the item was applied.
+        id: ID of the affected task, if known.
+        task: The created or updated task.
+        error: Why the item was rejected.
+    """
+
+    index: int
+    ok: bool
+    id: Optional[int] = None
+    task: Optional[TaskRead] = None
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    """Schema for the response of a bulk request.
+
+    Attributes:
+        succeeded: Number of items applied.
+        failed: Number of items rejected.
+        results: Per-item outcomes in request order.
+    """
+
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class ImportRowError(BaseModel):
+    """Schema for a row rejected during import.
+
+    Attributes:
+        line: Line number in the uploaded file.
+        error: Why the row was rejected.
+    """
+
+    line: int
+    error: str
+
+
+class TaskImportResult(BaseModel):
+    """Schema for the outcome of a task import.
+
+    Attributes:
+        imported: Number of tasks created.
+        failed: Number of rows rejected.
+        elapsed_seconds: Wall-clock duration of the import.
+        rows_per_second: Import throughput.
+        errors: First rejected rows, in file order.
+        errors_truncated: Whether more errors occurred than are listed.
+    """
+
+    imported: int
+    failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: List[ImportRowError]
+    errors_truncated: bool = False
+
+
+class TaskTombstone(BaseModel):
+    """Schema for a deleted task in the change feed.
+
+    Attributes:
+        id: ID of the deleted task.
+        deleted_at: Timestamp of the deletion.
+    """
+
+    id: int
+    deleted_at: datetime
+
+
+class TaskChanges(BaseModel):
+    """Schema for one page of the task change feed.
+
+    Attributes:
+        items: Tasks created or updated since the cursor, oldest change first.
+        deleted: Tasks deleted since the cursor.
+        next_cursor: Cursor to pass as ``since`` on the next call.
+        has_more: Whether more changes are waiting; call again immediately.
+    """
+
+    items: List[TaskRead]
+    deleted: List[TaskTombstone]
+    next_cursor: str
+    has_more: bool
@@ -0,0 +1,180 @@
+"""Answer cache for chatbot responses.
+
+Chat answers are cached under the normalized question, the detected
+intent, today's date and a task-data version read from the database
+(``task_stats.get_tasks_version``). Any task write, from any worker,
+moves the version, so stale answers are never served after the
+underlying tasks change.
+
+Two backends are available, selected by ``CHAT_CACHE_BACKEND``:
+
+- ``memory`` (default): in-process LRU with TTL, one cache per worker;
+  workers still agree on the version, so none serves a stale answer.
+- ``redis``: shared between workers; requires the optional ``redis``
+  package and ``CHAT_CACHE_URL``. Eviction follows the Redis server's
+  ``maxmemory-policy`` (use ``allkeys-lru``).
+"""
+
+import hashlib
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..config import settings
+from ..core.cache import TTLCache
+from ..core.clock import utc_today
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question so trivial variations share a cache entry.
+
+    Args:
+        question: Raw user question.
+
+    Returns:
+        str: Lower-cased question with collapsed whitespace and without
+        trailing punctuation.
+    """
+    return re.sub(r"\s+", " ", question.lower()).strip().rstrip("?!. ")
+
+
+def make_answer_key(question: str, intent: dict, version: tuple) -> str:
+    """Build the cache key for a chat answer.
+
+    Today's (UTC) date is part of the key because relative questions
+    ("hari ini", "terlambat") change meaning at midnight.
+
+    Args:
+        question: Raw user question.
+        intent: Result of ``_detect_intent`` for the question.
+        version: Current task-data version.
+
+    Returns:
+        str: Hex digest identifying the answer.
+    """
+    raw = json.dumps(
+        [normalize_question(question), intent, version, utc_today().isoformat()],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class AnswerCache(ABC):
+    """Interface for chat answer cache backends.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that found nothing.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached answer for ``key`` or None."""
+
+    @abstractmethod
+    async def set(self, key: str, answer: str) -> None:
+        """Store ``answer`` under ``key``."""
+
+    async def invalidate(self) -> None:
+        """Drop answers after a task write made in this process.
+
+        Keys already carry the task-data version, so this only frees
+        space held by unreachable entries early.
+        """
+
+    def _record(self, answer: Optional[str]) -> Optional[str]:
+        if answer is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return answer
+
+    def stats(self) -> dict:
+        """Return hit/miss counters.
+
+        Returns:
+            dict: ``backend``, ``hits``, ``misses`` and ``hit_rate``.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class MemoryAnswerCache(AnswerCache):
+    """In-process answer cache backed by :class:`TTLCache`."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__()
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._record(self._cache.get(key))
+
+    async def set(self, key: str, answer: str) -> None:
+        self._cache.set(key, answer)
+
+    async def invalidate(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["size"] = self._cache.stats()["size"]
+        return stats
+
+
+class RedisAnswerCache(AnswerCache):
+    """Answer cache shared by all workers through Redis."""
+
+    ANSWER_PREFIX = "chat:answer:"
+
+    def __init__(self, url: str, ttl: float) -> None:
+        super().__init__()
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "CHAT_CACHE_BACKEND=redis requires the 'redis' package"
+            ) from exc
+        self._redis = redis_asyncio.from_url(url, decode_responses=True)
+        self._ttl = int(ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._record(await self._redis.get(self.ANSWER_PREFIX + key))
+
+    async def set(self, key: str, answer: str) -> None:
+        # Entries of older versions become unreachable and expire on their
+        # own TTL
+        await self._redis.set(self.ANSWER_PREFIX + key, answer, ex=self._ttl)
+
+
+def build_answer_cache() -> AnswerCache:
+    """Create the answer cache backend selected in settings.
+
+    Returns:
+        AnswerCache: Configured cache backend.
+
+    Raises:
+        ValueError: If ``CHAT_CACHE_BACKEND`` is not recognised.
+    """
+    if settings.chat_cache_backend == "memory":
+        return MemoryAnswerCache(
+            maxsize=settings.chat_cache_size, ttl=settings.chat_cache_ttl_seconds
+        )
+    if settings.chat_cache_backend == "redis":
+        return RedisAnswerCache(
+            settings.chat_cache_url, ttl=settings.chat_cache_ttl_seconds
+        )
+    raise ValueError(f"Unknown CHAT_CACHE_BACKEND: {settings.chat_cache_backend}")
+
+
+answer_cache = build_answer_cache()
@@ -1,17 +1,39 @@
 """AI Chatbot service using DeepSeek API.
 
 This module provides the chatbot functionality for answering
-task-related questions using DeepSeek's language model.
+task-related questions using DeepSeek's language model. Requests go
+through the backend selected by ``LLM_BACKEND`` (see ``llm_backends``),
+so chat can also run against a local stub or recorded responses.
 """
 
+import re
+import time
 from datetime import datetime, timedelta
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 import httpx
 from sqlalchemy.orm import Session
 
 from ..config import settings
+from ..core.clock import utc_today
+from ..core.instrumentation import observe_llm_call
 from ..models import Task, TaskStatus
+from .llm_backends import llm_backend
+from .llm_guard import LLMUnavailable
+from .prompt_context import build_compact_prompt
+from .task_stats import TaskStatistics
+
+
+class ChatbotError(Exception):
+    """Raised when the LLM cannot produce an answer.
+
+    Attributes:
+        message: User-facing explanation, safe to return as the answer.
+    """
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
 
 
 SYSTEM_PROMPT = """Kamu adalah asisten AI untuk aplikasi Task Management. 
@@ -40,7 +62,7 @@ def _format_deadline(deadline) -> str:
     if not deadline:
         return "Tidak ada deadline"
     
-    today = datetime.now().date()
+    today = utc_today()
     deadline_date = deadline.date() if isinstance(deadline, datetime) else deadline
     
     diff = (deadline_date - today).days
@@ -57,28 +79,17 @@ def _format_deadline(deadline) -> str:
         return deadline.strftime('%Y-%m-%d')
 
 
-def _get_task_statistics(tasks: List[Task]) -> str:
-    """Generate statistik dari daftar task"""
-    if not tasks:
+def _get_task_statistics(stats: TaskStatistics) -> str:
+    """Format statistik task (dihitung di SQL atas seluruh tabel)"""
+    if not stats.total:
         return "Tidak ada task."
-    
-    total = len(tasks)
-    todo = sum(1 for t in tasks if t.status == TaskStatus.todo)
-    in_progress = sum(1 for t in tasks if t.status == TaskStatus.in_progress)
-    done = sum(1 for t in tasks if t.status == TaskStatus.done)
-    
-    today = datetime.now().date()
-    overdue = sum(1 for t in tasks if t.deadline and t.deadline.date() < today and t.status != TaskStatus.done)
-    due_today = sum(1 for t in tasks if t.deadline and t.deadline.date() == today)
-    
-    unassigned = sum(1 for t in tasks if not t.assignee_rel)
-    
-    return f"""📊 STATISTIK TASK:
-- Total: {total} task
-- Todo: {todo} | In Progress: {in_progress} | Done: {done}
-- Deadline hari ini: {due_today}
-- Terlambat (overdue): {overdue}
-- Belum ada assignee: {unassigned}"""
+
+    return f"""📊 STATISTIK TASK (seluruh data):
+- Total: {stats.total} task
+- Todo: {stats.todo} | In Progress: {stats.in_progress} | Done: {stats.done}
+- Deadline hari ini: {stats.due_today}
+- Terlambat (overdue): {stats.overdue}
+- Belum ada assignee: {stats.unassigned}"""
 
 
 def _summarize_tasks(tasks: List[Task]) -> str:
@@ -102,17 +113,38 @@ def _summarize_tasks(tasks: List[Task]) -> str:
     return "\n\n".join(lines)
 
 
-def build_prompt(user_question: str, tasks: List[Task]) -> str:
+def build_prompt(
+    user_question: str,
+    tasks: List[Task],
+    stats: TaskStatistics,
+    context_format: Optional[str] = None,
+    token_budget: Optional[int] = None,
+) -> str:
     """Build a complete prompt with task context for the AI.
 
     Args:
         user_question: The user's question about tasks.
         tasks: List of Task objects to include as context.
+        stats: Exact statistics over all tasks.
+        context_format: "compact" (ranked rows within a token budget) or
+            "verbose" (four lines per task); defaults to
+            ``CHAT_CONTEXT_FORMAT``.
+        token_budget: Prompt token budget for the compact format;
+            defaults to ``CHAT_CONTEXT_TOKEN_BUDGET``.
 
     Returns:
         str: Formatted prompt with statistics and task list.
     """
-    statistics = _get_task_statistics(tasks)
+    if (context_format or settings.chat_context_format) == "compact":
+        return build_compact_prompt(
+            user_question,
+            tasks,
+            stats,
+            _detect_intent(user_question),
+            token_budget or settings.chat_context_token_budget,
+        )
+
+    statistics = _get_task_statistics(stats)
     task_list = _summarize_tasks(tasks)
 
     return f"""Pertanyaan user: {user_question}
@@ -125,6 +157,35 @@ def build_prompt(user_question: str, tasks: List[Task]) -> str:
 Berikan jawaban yang relevan berdasarkan data di atas."""
 
 
+# Quoted text is taken verbatim as the search keyword; single quotes
+# must stand apart from words so apostrophes ("what's") don't count
+_QUOTED_KEYWORD = re.compile(r"[\"“](.+?)[\"”]|(?<!\w)['‘](.+?)['’](?!\w)")
+
+# Otherwise, the words after one of these triggers, up to a connective or
+# punctuation ("task tentang laporan keuangan yang belum selesai")
+_KEYWORD_AFTER = re.compile(
+    r"\b(?:tentang|terkait|mengenai|berjudul|judul|judulnya|soal|cari|carikan|"
+    r"mencari|search|about)\s+(.+?)(?=\s+(?:yang|yg|dengan|untuk|dan|di|dari|"
+    r"deadline|status)\b|[?!.,;]|$)"
+)
+
+
+def _detect_search_keyword(question: str) -> Optional[str]:
+    """Extract the text a question asks to search tasks for.
+
+    Args:
+        question: The user's question text.
+
+    Returns:
+        Optional[str]: Search words, or None if the question names none.
+    """
+    match = _QUOTED_KEYWORD.search(question) or _KEYWORD_AFTER.search(question.lower())
+    if match is None:
+        return None
+    keyword = next(group for group in match.groups() if group is not None).strip()
+    return keyword or None
+
+
 def _detect_intent(question: str) -> dict:
     """Detect user intent from question for query optimization.
 
@@ -159,50 +220,179 @@ def _detect_intent(question: str) -> dict:
         intent["filter_deadline"] = "overdue"
     elif any(word in question_lower for word in ["minggu ini", "this week"]):
         intent["filter_deadline"] = "this_week"
+
+    # Deteksi kata kunci pencarian
+    intent["search_keyword"] = _detect_search_keyword(question)
     
     return intent
 
 
-async def ask_deepseek(question: str, tasks: List[Task]) -> str:
-    """Send a question to DeepSeek API with task context.
+NO_TASKS_ANSWER = (
+    "Saat ini tidak ada task yang tersedia di sistem. "
+    "Silakan tambahkan task terlebih dahulu."
+)
+
+# Answers when the guard refuses a call without contacting DeepSeek
+UNAVAILABLE_ANSWERS = {
+    "busy": "Maaf, server sedang sibuk. Silakan coba lagi dalam beberapa saat.",
+    "circuit_open": (
+        "Maaf, layanan AI sedang tidak tersedia. "
+        "Silakan coba lagi dalam beberapa saat."
+    ),
+}
+
+
+def _build_payload(
+    question: str, tasks: List[Task], stats: TaskStatistics, stream: bool = False
+) -> dict:
+    """Build the DeepSeek chat completion request body.
 
     Args:
         question: The user's question.
         tasks: List of tasks to provide as context.
+        stats: Exact statistics over all tasks.
+        stream: Request incremental (SSE) output from the API.
 
     Returns:
-        str: AI-generated response or error message.
+        dict: JSON payload for the chat completions endpoint.
     """
-    # If no tasks exist at all
-    if not tasks:
-        return (
-            "Saat ini tidak ada task yang tersedia di sistem. "
-            "Silakan tambahkan task terlebih dahulu."
-        )
-    
     payload = {
         "model": "deepseek-chat",
         "messages": [
             {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": build_prompt(question, tasks)},
+            {"role": "user", "content": build_prompt(question, tasks, stats)},
         ],
         "temperature": 0.3,
         "max_tokens": 1000,
     }
+    if stream:
+        payload["stream"] = True
+        # Ask for a final chunk carrying token usage
+        payload["stream_options"] = {"include_usage": True}
+    return payload
+
+
+async def ask_deepseek(
+    question: str, tasks: List[Task], stats: TaskStatistics
+) -> str:
+    """Send a question to DeepSeek API with task context.
+
+    Args:
+        question: The user's question.
+        tasks: List of tasks to provide as context.
+        stats: Exact statistics over all tasks.
+
+    Returns:
+        str: AI-generated response.
+
+    Raises:
+        ChatbotError: If DeepSeek fails; carries a user-facing message.
+        Error answers are raised rather than returned so callers do not
+        cache them.
+    """
+    # If no tasks exist at all
+    if not tasks:
+        return NO_TASKS_ANSWER
+
+    payload = _build_payload(question, tasks, stats)
     
-    headers = {"Authorization": f"Bearer {settings.deepseek_api_key}"}
-    
+    start = time.perf_counter()
+    outcome, usage = "cancelled", None
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(settings.deepseek_api_url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            return data["choices"][0]["message"]["content"]
+        data = await llm_backend.complete(payload)
+        usage = data.get("usage")
+        answer = data["choices"][0]["message"]["content"]
+        outcome = "ok"
+        return answer
+    except LLMUnavailable as e:
+        outcome = "rejected"
+        raise ChatbotError(UNAVAILABLE_ANSWERS[e.reason])
     except httpx.TimeoutException:
-        return "Maaf, server sedang sibuk. Silakan coba lagi dalam beberapa saat."
+        outcome = "error"
+        raise ChatbotError("Maaf, server sedang sibuk. Silakan coba lagi dalam beberapa saat.")
     except httpx.HTTPStatusError as e:
+        outcome = "error"
         if e.response.status_code == 429:
-            return "Maaf, terlalu banyak permintaan. Silakan tunggu sebentar dan coba lagi."
-        return "Maaf, terjadi kesalahan saat memproses pertanyaan Anda. Silakan coba lagi."
+            raise ChatbotError("Maaf, terlalu banyak permintaan. Silakan tunggu sebentar dan coba lagi.")
+        raise ChatbotError("Maaf, terjadi kesalahan saat memproses pertanyaan Anda. Silakan coba lagi.")
     except Exception:
-        return "Maaf, terjadi kesalahan. Silakan coba lagi."
+        outcome = "error"
+        raise ChatbotError("Maaf, terjadi kesalahan. Silakan coba lagi.")
+    finally:
+        observe_llm_call("complete", outcome, time.perf_counter() - start, usage)
+
+
+def stream_deepseek(
+    question: str, tasks: List[Task], stats: TaskStatistics
+) -> AsyncIterator[str]:
+    """Stream an answer from DeepSeek token by token.
+
+    The prompt is built eagerly, so ``tasks`` may be detached from their
+    session by the time the returned iterator is consumed.
+
+    Args:
+        question: The user's question.
+        tasks: List of tasks to provide as context.
+        stats: Exact statistics over all tasks.
+
+    Returns:
+        AsyncIterator[str]: Answer text fragments as they arrive. Closing
+        the iterator (e.g. on client disconnect) closes the upstream
+        request, so no further tokens are generated.
+
+    Raises:
+        ChatbotError: While iterating, if DeepSeek fails.
+    """
+    if not tasks:
+        return _single_chunk(NO_TASKS_ANSWER)
+    return _stream_completion(_build_payload(question, tasks, stats, stream=True))
+
+
+async def _single_chunk(text: str) -> AsyncIterator[str]:
+    """Yield ``text`` as a one-chunk stream."""
+    yield text
+
+
+async def _stream_completion(payload: dict) -> AsyncIterator[str]:
+    """Post a streaming completion request and yield content deltas.
+
+    Args:
+        payload: Chat completion payload with ``stream`` enabled.
+
+    Yields:
+        str: Non-empty content fragments from the upstream SSE stream.
+
+    Raises:
+        ChatbotError: If the request fails or times out.
+    """
+    start = time.perf_counter()
+    # Stays "cancelled" if the consumer closes the stream early
+    outcome, usage = "cancelled", None
+    chunks = llm_backend.stream(payload)
+    try:
+        async for chunk in chunks:
+            usage = chunk.get("usage") or usage
+            # The usage chunk has an empty choices list
+            for choice in chunk.get("choices") or []:
+                content = choice.get("delta", {}).get("content")
+                if content:
+                    yield content
+        outcome = "ok"
+    except LLMUnavailable as e:
+        outcome = "rejected"
+        raise ChatbotError(UNAVAILABLE_ANSWERS[e.reason])
+    except httpx.TimeoutException:
+        outcome = "error"
+        raise ChatbotError("Maaf, server sedang sibuk. Silakan coba lagi dalam beberapa saat.")
+    except httpx.HTTPStatusError as e:
+        outcome = "error"
+        if e.response.status_code == 429:
+            raise ChatbotError("Maaf, terlalu banyak permintaan. Silakan tunggu sebentar dan coba lagi.")
+        raise ChatbotError("Maaf, terjadi kesalahan saat memproses pertanyaan Anda. Silakan coba lagi.")
+    except (httpx.HTTPError, ValueError, LookupError):
+        outcome = "error"
+        raise ChatbotError("Maaf, terjadi kesalahan. Silakan coba lagi.")
+    finally:
+        # Closes the upstream response if the consumer stopped early
+        await chunks.aclose()
+        observe_llm_call("stream", outcome, time.perf_counter() - start, usage)
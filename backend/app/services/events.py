@@ -0,0 +1,333 @@
+"""Real-time task change events for WebSocket clients.
+
+The tasks router publishes an event after every committed write. A
+broker carries events to the :class:`EventHub` of every worker, which
+fans them out to its connected sockets:
+
+- ``memory`` (default): the hub of the current process only.
+- ``postgres``: ``NOTIFY`` on a channel that every worker ``LISTEN``\\ s
+  to, so clients see changes made through any worker. Requires a
+  PostgreSQL ``DATABASE_URL`` (asyncpg).
+
+Each socket gets a bounded queue. A client that falls ``EVENTS_QUEUE_SIZE``
+events behind is disconnected instead of buffering without limit; it
+should reconnect and catch up with ``GET /tasks/changes``.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Iterable, List, Optional, Set
+
+from ..config import settings
+from ..db import to_async_url
+from ..schemas import TaskRead
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_BYTES = 7900
+
+# Writes touching more tasks send one "tasks.reload" instead of an event
+# per task, which would overflow every client's queue
+MAX_EVENTS_PER_WRITE = 50
+
+RELOAD_MESSAGE = json.dumps({"type": "tasks.reload"})
+
+
+class Subscriber:
+    """One connected client's bounded event queue.
+
+    Attributes:
+        queue: Pending messages; ``None`` tells the sender to disconnect.
+        dropped: Whether the client was cut off for falling behind.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize)
+        self.dropped = False
+
+    def offer(self, message: str) -> bool:
+        """Queue ``message`` without waiting.
+
+        Returns:
+            bool: False if the queue was full and the subscriber has been
+            dropped.
+        """
+        if self.dropped:
+            return False
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.drop()
+            return False
+
+    def drop(self) -> None:
+        """Discard queued messages and signal the sender to disconnect."""
+        self.dropped = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class EventHub:
+    """Fan-out of serialized events to the subscribers of this process.
+
+    Attributes:
+        queue_size: Capacity of each subscriber's queue.
+        published: Messages fanned out.
+        delivered: Messages queued to subscribers.
+        dropped: Subscribers disconnected as slow consumers.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self._subscribers: Set[Subscriber] = set()
+
+    def subscribe(self) -> Subscriber:
+        """Register a new subscriber."""
+        subscriber = Subscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Forget ``subscriber``; safe to call more than once."""
+        self._subscribers.discard(subscriber)
+
+    def fanout(self, message: str) -> None:
+        """Queue ``message`` for every subscriber, dropping slow ones.
+
+        Args:
+            message: Serialized event, encoded once for all clients.
+        """
+        self.published += 1
+        for subscriber in list(self._subscribers):
+            if subscriber.offer(message):
+                self.delivered += 1
+            else:
+                self.dropped += 1
+                self._subscribers.discard(subscriber)
+
+    def stats(self) -> dict:
+        """Return connection and delivery counters.
+
+        Returns:
+            dict: ``connections``, ``published``, ``delivered`` and
+            ``dropped``.
+        """
+        return {
+            "connections": len(self._subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+class MemoryBroker:
+    """Deliver events to the hub of the current process only."""
+
+    def __init__(self, hub: EventHub) -> None:
+        self.hub = hub
+
+    async def start(self) -> None:
+        """Nothing to set up."""
+
+    async def stop(self) -> None:
+        """Nothing to tear down."""
+
+    async def publish(self, message: str) -> None:
+        """Fan ``message`` out locally."""
+        self.hub.fanout(message)
+
+
+class PostgresBroker:
+    """Share events between workers through PostgreSQL LISTEN/NOTIFY.
+
+    One dedicated asyncpg connection per worker both listens and sends
+    notifications; a worker's own events reach its hub through the
+    listener like everyone else's, so each event is delivered once.
+
+    If the connection drops (database restart, idle timeout), it is
+    reopened in the background with capped exponential backoff, and by
+    ``publish`` if it is needed first. Notifications sent meanwhile are
+    lost, so every reconnect tells local clients to reload.
+
+    Attributes:
+        reconnects: Connections reopened after a loss.
+    """
+
+    RECONNECT_INITIAL_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 30.0
+
+    def __init__(self, hub: EventHub, url: str, channel: str) -> None:
+        self.hub = hub
+        self.channel = channel
+        self.reconnects = 0
+        # asyncpg takes a plain postgresql:// DSN
+        self._dsn = to_async_url(url).replace("postgresql+asyncpg://", "postgresql://", 1)
+        self._conn = None
+        self._connected_before = False
+        self._stopping = False
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Open the connection and start listening."""
+        self._stopping = False
+        async with self._lock:
+            await self._connect()
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+    async def _connect(self) -> None:
+        """Open a listening connection unless one is live; hold the lock."""
+        if self._conn is not None and not self._conn.is_closed():
+            return
+        import asyncpg
+
+        conn = await asyncpg.connect(self._dsn)
+        await conn.add_listener(self.channel, self._on_notify)
+        conn.add_termination_listener(self._on_terminate)
+        self._conn = conn
+        if self._connected_before:
+            self.reconnects += 1
+            logger.info("Task event connection re-established")
+            # Events published while disconnected never arrived
+            self.hub.fanout(RELOAD_MESSAGE)
+        self._connected_before = True
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.hub.fanout(payload)
+
+    def _on_terminate(self, connection) -> None:
+        # stop() detaches the connection before closing it
+        if self._stopping or connection is not self._conn:
+            return
+        logger.warning("Task event connection lost; reconnecting")
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self.RECONNECT_INITIAL_DELAY
+        while not self._stopping:
+            try:
+                async with self._lock:
+                    await self._connect()
+                return
+            except Exception as exc:
+                logger.warning(
+                    "Task event reconnect failed (%s); retrying in %.1fs",
+                    exc.__class__.__name__, delay,
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+
+    async def publish(self, message: str) -> None:
+        """Send ``message`` to every worker with ``pg_notify``.
+
+        A dead connection is replaced and the send retried once.
+        """
+        import asyncpg
+
+        # One asyncpg connection runs one command at a time
+        async with self._lock:
+            for attempt in range(2):
+                await self._connect()
+                try:
+                    await self._conn.execute(
+                        "SELECT pg_notify($1, $2)", self.channel, message
+                    )
+                    return
+                except (asyncpg.PostgresConnectionError, asyncpg.InterfaceError, OSError):
+                    if attempt:
+                        raise
+                    self._conn.terminate()
+
+
+def build_broker(hub: EventHub):
+    """Create the broker selected by ``EVENTS_BACKEND``.
+
+    Args:
+        hub: Local hub that receives events.
+
+    Returns:
+        MemoryBroker | PostgresBroker: Configured broker.
+
+    Raises:
+        ValueError: If ``EVENTS_BACKEND`` is not recognised.
+    """
+    if settings.events_backend == "memory":
+        return MemoryBroker(hub)
+    if settings.events_backend == "postgres":
+        return PostgresBroker(hub, settings.database_url, settings.events_channel)
+    raise ValueError(f"Unknown EVENTS_BACKEND: {settings.events_backend}")
+
+
+hub = EventHub(settings.events_queue_size)
+broker = build_broker(hub)
+
+
+def _encode(kind: str, task=None, task_id: Optional[int] = None) -> str:
+    event = {"type": f"task.{kind}"}
+    if task is not None:
+        event["id"] = task.id
+        event["task"] = TaskRead.model_validate(task).model_dump(mode="json")
+    else:
+        event["id"] = task_id
+    message = json.dumps(event, ensure_ascii=False)
+    if len(message.encode()) > MAX_NOTIFY_BYTES:
+        # Too large for NOTIFY: clients fetch the task themselves
+        message = json.dumps({"type": event["type"], "id": event["id"]})
+    return message
+
+
+async def _publish(messages: Iterable[str]) -> None:
+    for message in messages:
+        try:
+            await broker.publish(message)
+        except Exception:
+            # Realtime push is best effort; the write already committed
+            logger.exception("Failed to publish task event")
+            return
+
+
+async def publish_task_changes(kind: str, tasks: List) -> None:
+    """Publish ``task.created`` or ``task.updated`` events.
+
+    Args:
+        kind: ``"created"`` or ``"updated"``.
+        tasks: Committed tasks with their assignee loaded.
+    """
+    if len(tasks) > MAX_EVENTS_PER_WRITE:
+        await publish_reload()
+    else:
+        await _publish(_encode(kind, task=task) for task in tasks)
+
+
+async def publish_task_deletions(task_ids: List[int]) -> None:
+    """Publish ``task.deleted`` events.
+
+    Args:
+        task_ids: IDs of the deleted tasks.
+    """
+    if len(task_ids) > MAX_EVENTS_PER_WRITE:
+        await publish_reload()
+    else:
+        await _publish(_encode("deleted", task_id=task_id) for task_id in task_ids)
+
+
+async def publish_reload() -> None:
+    """Tell clients to reload the board (after bulk writes and imports)."""
+    await _publish([RELOAD_MESSAGE])
@@ -0,0 +1,210 @@
+"""Rule-based answers for statistical chat questions.
+
+Questions that only need counts or short lists of tasks ("berapa task
+yang done?", "task apa saja yang deadlinenya hari ini?") are answered
+directly from SQL in milliseconds. Anything the rules do not fully
+understand returns None so the caller can fall back to the LLM.
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from ..core.clock import utc_today
+from ..models import Task, TaskStatus
+from .chatbot import _detect_intent
+from .task_stats import get_task_statistics
+
+# Max tasks listed in a rule-based answer
+MAX_LISTED_TASKS = 20
+
+COUNT_WORDS = ("berapa", "jumlah", "how many", "hitung", "total")
+SUMMARY_WORDS = ("statistik", "ringkasan", "summary", "rekap")
+LIST_WORDS = ("apa saja", "tampilkan", "daftar", "list", "sebutkan", "mana saja", "show")
+
+# Words the rules can account for. A question containing any other word
+# may carry a condition we would silently ignore, so it goes to the LLM.
+KNOWN_WORDS = {
+    # question / filler words
+    "apa", "saja", "berapa", "jumlah", "total", "banyak", "hitung", "how",
+    "many", "what", "which", "are", "is", "the", "show", "list", "tampilkan",
+    "daftar", "sebutkan", "mana", "statistik", "ringkasan", "summary", "rekap",
+    "task", "tasks", "tugas", "yang", "yg", "ada", "ini", "itu", "dan", "di",
+    "semua", "seluruh", "status", "statusnya", "deadline", "deadlinenya",
+    "dengan", "sekarang", "saat", "masih", "tolong", "dong", "nya", "kita",
+    "saya", "jatuh", "tempo", "telah", "all",
+    # status and deadline keywords recognised by _detect_intent
+    "selesai", "dikerjakan", "todo", "to", "do", "pending", "sedang",
+    "in", "progress", "ongoing", "proses", "done", "completed", "hari",
+    "today", "besok", "tomorrow", "terlambat", "overdue", "lewat", "minggu",
+    "this", "week",
+}
+
+# "belum" and "sudah" only have a fixed meaning in these phrases. On their
+# own they negate or qualify the next word ("belum done", "sudah
+# terlambat"), which the intent filters cannot express.
+KNOWN_PHRASES = ("belum selesai", "belum dikerjakan", "sudah selesai")
+
+DEADLINE_LABELS = {
+    "today": "yang deadlinenya hari ini",
+    "tomorrow": "yang deadlinenya besok",
+    "overdue": "yang terlambat (overdue)",
+    "this_week": "yang deadlinenya minggu ini",
+}
+
+
+def intent_filters(intent: dict) -> list:
+    """Translate a detected intent into SQLAlchemy filter conditions.
+
+    Args:
+        intent: Result of ``_detect_intent``.
+
+    Returns:
+        list: Conditions to pass to ``Query.filter``.
+    """
+    conditions = []
+    if intent["filter_status"]:
+        conditions.append(Task.status == intent["filter_status"])
+
+    today = utc_today()
+    start_of_today = datetime.combine(today, datetime.min.time())
+    if intent["filter_deadline"] == "today":
+        conditions += [
+            Task.deadline >= start_of_today,
+            Task.deadline < start_of_today + timedelta(days=1),
+        ]
+    elif intent["filter_deadline"] == "tomorrow":
+        conditions += [
+            Task.deadline >= start_of_today + timedelta(days=1),
+            Task.deadline < start_of_today + timedelta(days=2),
+        ]
+    elif intent["filter_deadline"] == "overdue":
+        conditions += [
+            Task.deadline < start_of_today,
+            Task.status != TaskStatus.done,
+        ]
+    elif intent["filter_deadline"] == "this_week":
+        week_end = today + timedelta(days=(6 - today.weekday()))
+        conditions += [
+            Task.deadline >= start_of_today,
+            Task.deadline <= datetime.combine(week_end, datetime.max.time()),
+        ]
+    return conditions
+
+
+def _is_fully_understood(question_lower: str) -> bool:
+    """Check that every word of the question is known to the rules."""
+    for phrase in KNOWN_PHRASES:
+        question_lower = re.sub(rf"\b{phrase}\b", " ", question_lower)
+    return all(word in KNOWN_WORDS for word in re.findall(r"[a-z0-9]+", question_lower))
+
+
+def _is_contradictory(intent: dict) -> bool:
+    """Check for filters no task can match, e.g. Done and overdue.
+
+    Such combinations come from misread phrasing ("sudah terlambat"), so
+    answering "0" would be confidently wrong.
+    """
+    return (
+        intent["filter_status"] == TaskStatus.done
+        and intent["filter_deadline"] == "overdue"
+    )
+
+
+def _describe(intent: dict) -> str:
+    """Describe the detected filters in Indonesian, e.g. "dengan status Done"."""
+    parts = []
+    if intent["filter_status"]:
+        parts.append(f"dengan status {intent['filter_status'].value}")
+    if intent["filter_deadline"]:
+        parts.append(DEADLINE_LABELS[intent["filter_deadline"]])
+    return " ".join(parts)
+
+
+async def _count(db: AsyncSession, conditions: list) -> int:
+    """Count tasks matching ``conditions``."""
+    result = await db.execute(select(func.count(Task.id)).where(*conditions))
+    return result.scalar_one()
+
+
+async def _statistics_answer(db: AsyncSession) -> str:
+    """Answer a general "how many tasks" question with overall counts."""
+    stats = await get_task_statistics(db)
+    return (
+        "📊 Statistik task saat ini:\n"
+        f"- Total: {stats.total} task\n"
+        f"- Todo: {stats.todo} | In Progress: {stats.in_progress} | "
+        f"Done: {stats.done}\n"
+        f"- Deadline hari ini: {stats.due_today}\n"
+        f"- Terlambat (overdue): {stats.overdue}\n"
+        f"- Belum ada assignee: {stats.unassigned}"
+    )
+
+
+async def _count_answer(db: AsyncSession, intent: dict) -> str:
+    """Answer a count question restricted to the detected filters."""
+    count = await _count(db, intent_filters(intent))
+    return f"Ada **{count}** task {_describe(intent)}."
+
+
+async def _list_answer(db: AsyncSession, intent: dict) -> str:
+    """Answer a "which tasks" question with a short list from SQL."""
+    conditions = intent_filters(intent)
+    total = await _count(db, conditions)
+    subject = f"task {_describe(intent)}".rstrip()
+    if not total:
+        return f"Tidak ada {subject}."
+
+    result = await db.execute(
+        select(Task)
+        .options(joinedload(Task.assignee_rel))
+        .where(*conditions)
+        .order_by(Task.deadline.asc().nullslast(), Task.created_at.desc())
+        .limit(MAX_LISTED_TASKS)
+    )
+    tasks: List[Task] = list(result.scalars().all())
+    lines = [f"Ada **{total}** {subject}:"]
+    for i, t in enumerate(tasks, 1):
+        deadline = t.deadline.strftime("%Y-%m-%d") if t.deadline else "tanpa deadline"
+        assignee = t.assignee_name or "Belum ditugaskan"
+        lines.append(f"{i}. {t.title} — {t.status.value}, {deadline}, {assignee}")
+    if total > len(tasks):
+        lines.append(f"...dan {total - len(tasks)} task lainnya.")
+    return "\n".join(lines)
+
+
+async def try_fast_answer(db: AsyncSession, question: str) -> Optional[str]:
+    """Answer a statistical question from SQL without calling the LLM.
+
+    Args:
+        db: Database session.
+        question: The user's question.
+
+    Returns:
+        Optional[str]: The answer, or None if the question needs the LLM.
+    """
+    question_lower = question.lower()
+    if not _is_fully_understood(question_lower):
+        return None
+
+    intent = _detect_intent(question)
+    if intent["search_keyword"]:
+        # Text search ranks by relevance; leave the answer to the LLM
+        return None
+    if _is_contradictory(intent):
+        return None
+    has_filter = bool(intent["filter_status"] or intent["filter_deadline"])
+
+    if any(word in question_lower for word in SUMMARY_WORDS):
+        return await _statistics_answer(db)
+    if any(word in question_lower for word in COUNT_WORDS):
+        if has_filter:
+            return await _count_answer(db, intent)
+        return await _statistics_answer(db)
+    if any(word in question_lower for word in LIST_WORDS):
+        return await _list_answer(db, intent)
+    return None
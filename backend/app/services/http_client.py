@@ -0,0 +1,64 @@
+"""Shared HTTP client for upstream LLM calls.
+
+This module owns a single application-lifetime ``httpx.AsyncClient``
+so chat requests reuse pooled keep-alive connections instead of paying
+for a new TCP+TLS handshake on every question.
+"""
+
+from typing import Optional
+
+import httpx
+
+from ..config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def build_llm_client() -> httpx.AsyncClient:
+    """Create an ``httpx.AsyncClient`` configured from settings.
+
+    Returns:
+        httpx.AsyncClient: Client with connection limits, keep-alive,
+        optional HTTP/2, and separate connect/read timeouts.
+    """
+    return httpx.AsyncClient(
+        http2=settings.deepseek_http2,
+        limits=httpx.Limits(
+            max_connections=settings.deepseek_max_connections,
+            max_keepalive_connections=settings.deepseek_max_keepalive_connections,
+            keepalive_expiry=settings.deepseek_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.deepseek_connect_timeout,
+            read=settings.deepseek_read_timeout,
+            write=settings.deepseek_connect_timeout,
+            pool=settings.deepseek_connect_timeout,
+        ),
+    )
+
+
+async def start_llm_client() -> None:
+    """Open the shared client (called from the application lifespan)."""
+    global _client
+    if _client is None:
+        _client = build_llm_client()
+
+
+async def close_llm_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_llm_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it if the lifespan has not run.
+
+    Returns:
+        httpx.AsyncClient: The application-wide client.
+    """
+    global _client
+    if _client is None:
+        _client = build_llm_client()
+    return _client
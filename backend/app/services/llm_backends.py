@@ -0,0 +1,274 @@
+"""Pluggable backends answering chat completion requests.
+
+The chatbot builds an OpenAI-style chat completion payload and hands it
+to the backend selected by ``LLM_BACKEND``:
+
+- ``deepseek`` (default): the DeepSeek API, through the shared HTTP
+  client and the load guard.
+- ``stub``: a deterministic in-process answer after ``LLM_STUB_LATENCY``
+  seconds; no network, no API key needed.
+- ``record``: calls DeepSeek and saves every request/response pair as a
+  JSON file in ``LLM_RECORDINGS_DIR``.
+- ``replay``: answers from those files only, so chat benchmarks run
+  offline and reproducibly (e.g. in CI).
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Dict, List
+
+import httpx
+
+from ..config import settings
+from .http_client import get_llm_client
+from .llm_guard import llm_guard
+
+
+class RecordingNotFound(LookupError):
+    """Raised in replay mode when no recording matches a request."""
+
+
+class LLMBackend(ABC):
+    """Interface for chat completion backends.
+
+    Both methods take the chat completion payload; its ``stream`` flag is
+    set by the caller to match the method.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def complete(self, payload: dict) -> dict:
+        """Return the chat completion response body.
+
+        Args:
+            payload: Chat completion request body.
+
+        Returns:
+            dict: Response with ``choices`` and, if known, ``usage``.
+        """
+
+    @abstractmethod
+    def stream(self, payload: dict) -> AsyncIterator[dict]:
+        """Yield the chunks of a streamed chat completion.
+
+        Args:
+            payload: Chat completion request body with ``stream`` set.
+
+        Returns:
+            AsyncIterator[dict]: Parsed SSE chunks (``choices[].delta``,
+            and a final chunk with ``usage`` if requested).
+        """
+
+
+class DeepSeekBackend(LLMBackend):
+    """DeepSeek chat completions API over HTTP."""
+
+    name = "deepseek"
+
+    def _sender(self, payload: dict) -> Callable[[], Awaitable[httpx.Response]]:
+        """Return a function sending ``payload``, once per attempt."""
+        client = get_llm_client()
+        request = client.build_request(
+            "POST",
+            settings.deepseek_api_url,
+            json=payload,
+            headers={"Authorization": f"Bearer {settings.deepseek_api_key}"},
+        )
+        return lambda: client.send(request, stream=True)
+
+    async def complete(self, payload: dict) -> dict:
+        async with llm_guard.request(self._sender(payload)) as resp:
+            await resp.aread()
+        return resp.json()
+
+    async def stream(self, payload: dict) -> AsyncIterator[dict]:
+        async with llm_guard.request(self._sender(payload)) as resp:
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                yield json.loads(data)
+
+
+def _last_user_message(payload: dict) -> str:
+    for message in reversed(payload.get("messages", [])):
+        if message.get("role") == "user":
+            return message.get("content", "")
+    return ""
+
+
+class StubBackend(LLMBackend):
+    """Deterministic in-process answers for offline load tests.
+
+    The answer depends only on the request, so repeated runs produce
+    identical output. Token usage is estimated at four characters per
+    token.
+
+    Attributes:
+        latency: Seconds to wait before answering.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
+    def _answer(self, payload: dict) -> str:
+        prompt = _last_user_message(payload)
+        question = prompt.splitlines()[0] if prompt else ""
+        digest = hashlib.sha256(prompt.encode()).hexdigest()[:8]
+        return f"Jawaban stub ({digest}) untuk: {question}"
+
+    def _usage(self, payload: dict, answer: str) -> dict:
+        prompt_chars = sum(len(m.get("content", "")) for m in payload.get("messages", []))
+        prompt_tokens, completion_tokens = prompt_chars // 4, len(answer) // 4
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    async def complete(self, payload: dict) -> dict:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        answer = self._answer(payload)
+        return {
+            "model": payload.get("model", "stub"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": answer},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": self._usage(payload, answer),
+        }
+
+    async def stream(self, payload: dict) -> AsyncIterator[dict]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        answer = self._answer(payload)
+        for word in answer.split(" "):
+            yield {"choices": [{"index": 0, "delta": {"content": word + " "}}]}
+        yield {"choices": [], "usage": self._usage(payload, answer)}
+
+
+# Dates in prompts ("Hari ini: 2026-01-31") change daily; replay also
+# matches recordings that differ from the request only in dates
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def recording_keys(payload: dict) -> tuple:
+    """Return the exact and date-insensitive keys of a request.
+
+    Args:
+        payload: Chat completion request body.
+
+    Returns:
+        tuple: ``(exact_key, loose_key)`` hex digests.
+    """
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    loose = _DATE.sub("YYYY-MM-DD", canonical)
+    return (
+        hashlib.sha256(canonical.encode()).hexdigest(),
+        hashlib.sha256(loose.encode()).hexdigest(),
+    )
+
+
+class RecordReplayBackend(LLMBackend):
+    """Record responses of another backend to disk, or replay them.
+
+    Each recording is ``<exact_key>.json`` holding the request, the
+    response (or the list of streamed chunks) and the date-insensitive
+    key.
+
+    Attributes:
+        directory: Where recordings are stored.
+        replay: Answer from recordings only instead of recording.
+        inner: Backend whose responses are recorded.
+    """
+
+    def __init__(self, directory: str, replay: bool, inner: LLMBackend) -> None:
+        self.directory = Path(directory)
+        self.replay = replay
+        self.inner = inner
+        self.name = "replay" if replay else "record"
+        self._loose_index: Dict[str, Path] = {}
+        if replay:
+            self._load_index()
+
+    def _load_index(self) -> None:
+        for path in sorted(self.directory.glob("*.json")):
+            with path.open(encoding="utf-8") as f:
+                self._loose_index[json.load(f)["loose_key"]] = path
+
+    def _find(self, payload: dict) -> dict:
+        exact, loose = recording_keys(payload)
+        path = self.directory / f"{exact}.json"
+        if not path.exists():
+            path = self._loose_index.get(loose)
+        if path is None:
+            raise RecordingNotFound(f"No LLM recording for request {exact}")
+        with path.open(encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save(self, payload: dict, field: str, value) -> None:
+        exact, loose = recording_keys(payload)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record = {"loose_key": loose, "request": payload, field: value}
+        # Write then rename so concurrent readers never see partial files
+        tmp = self.directory / f".{exact}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(record, ensure_ascii=False, indent=1), encoding="utf-8")
+        tmp.replace(self.directory / f"{exact}.json")
+
+    async def complete(self, payload: dict) -> dict:
+        if self.replay:
+            return self._find(payload)["response"]
+        response = await self.inner.complete(payload)
+        self._save(payload, "response", response)
+        return response
+
+    async def stream(self, payload: dict) -> AsyncIterator[dict]:
+        if self.replay:
+            for chunk in self._find(payload)["chunks"]:
+                yield chunk
+            return
+        chunks: List[dict] = []
+        async for chunk in self.inner.stream(payload):
+            chunks.append(chunk)
+            yield chunk
+        # Only complete streams are worth replaying
+        self._save(payload, "chunks", chunks)
+
+
+def build_llm_backend() -> LLMBackend:
+    """Create the backend selected by ``LLM_BACKEND``.
+
+    Returns:
+        LLMBackend: Configured backend.
+
+    Raises:
+        ValueError: If ``LLM_BACKEND`` is not recognised.
+    """
+    if settings.llm_backend == "deepseek":
+        return DeepSeekBackend()
+    if settings.llm_backend == "stub":
+        return StubBackend(latency=settings.llm_stub_latency)
+    if settings.llm_backend in ("record", "replay"):
+        return RecordReplayBackend(
+            settings.llm_recordings_dir,
+            replay=settings.llm_backend == "replay",
+            inner=DeepSeekBackend(),
+        )
+    raise ValueError(f"Unknown LLM_BACKEND: {settings.llm_backend}")
+
+
+llm_backend = build_llm_backend()
@@ -0,0 +1,398 @@
+"""Protection for upstream LLM calls under load.
+
+Every DeepSeek request goes through :data:`llm_guard`, which combines:
+
+- a concurrency cap: at most ``LLM_MAX_CONCURRENCY`` requests in flight,
+  with up to ``LLM_QUEUE_SIZE`` callers waiting (at most
+  ``LLM_QUEUE_TIMEOUT`` seconds) for a slot; beyond that callers are
+  turned away at once instead of piling onto the API;
+- retries of 429, 5xx, timeouts and connection errors with jittered
+  exponential backoff, waiting exactly as long as ``Retry-After`` asks
+  when the API sends it;
+- a circuit breaker that, after ``LLM_BREAKER_FAILURE_THRESHOLD`` calls
+  in a row have failed, fails fast for ``LLM_BREAKER_RESET_TIMEOUT``
+  seconds and then lets one probe call through to test recovery.
+
+State is per process; each worker protects its own share of the load.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: rate limited or the upstream is struggling
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class LLMUnavailable(Exception):
+    """Raised when a call is refused without contacting the upstream.
+
+    Attributes:
+        reason: ``"busy"`` (wait queue full or wait timed out) or
+            ``"circuit_open"``.
+        retry_after: Suggested seconds before trying again.
+    """
+
+    def __init__(self, reason: str, retry_after: float = 1.0) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (seconds or an HTTP date).
+
+    Args:
+        value: Raw header value.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return a "full jitter" exponential backoff delay.
+
+    Args:
+        attempt: Retry number, starting at 0.
+        base: Delay ceiling of the first retry, in seconds.
+        cap: Maximum delay in seconds.
+
+    Returns:
+        float: Random delay between 0 and ``min(cap, base * 2**attempt)``.
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class ConcurrencyLimiter:
+    """Semaphore with a bounded number of waiters.
+
+    Attributes:
+        limit: Maximum concurrent holders.
+        queue_size: Maximum callers waiting for a slot.
+        timeout: Maximum seconds a caller waits for a slot.
+        active: Slots currently held.
+        waiting: Callers currently waiting.
+        rejected: Callers turned away because the queue was full or their
+            wait timed out.
+    """
+
+    def __init__(self, limit: int, queue_size: int, timeout: float) -> None:
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the ``async with`` block.
+
+        Raises:
+            LLMUnavailable: ``"busy"`` if the queue is full or the wait
+                times out.
+        """
+        if not self._semaphore.locked():
+            # Free slot: taken at once. Going through wait_for would
+            # suspend first, letting a burst of callers all see free slots
+            # and bypass the queue limit.
+            await self._semaphore.acquire()
+        elif self.waiting >= self.queue_size:
+            self.rejected += 1
+            raise LLMUnavailable("busy")
+        else:
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise LLMUnavailable("busy")
+            finally:
+                self.waiting -= 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    ``closed``: calls pass. After ``failure_threshold`` failed calls in a
+    row it turns ``open`` and refuses calls for ``reset_timeout`` seconds,
+    then ``half_open``: one probe call passes; its success closes the
+    circuit, its failure opens it again.
+
+    Attributes:
+        state: ``"closed"``, ``"open"`` or ``"half_open"``.
+        failures: Consecutive failed calls.
+        opened: Times the circuit has opened.
+        rejected: Calls refused while open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._clock = clock
+        self._opened_at = 0.0
+        self._probing = False
+
+    def check(self) -> None:
+        """Refuse early while open, without changing state.
+
+        Raises:
+            LLMUnavailable: ``"circuit_open"`` while the circuit is open.
+        """
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if remaining > 0:
+                self.rejected += 1
+                raise LLMUnavailable("circuit_open", retry_after=remaining)
+
+    def before_call(self) -> None:
+        """Admit a call or refuse it.
+
+        Raises:
+            LLMUnavailable: ``"circuit_open"`` while the circuit is open or
+                a half-open probe is already running.
+        """
+        self.check()
+        if self.state == self.OPEN:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self.rejected += 1
+                raise LLMUnavailable("circuit_open", retry_after=1.0)
+            self._probing = True
+
+    def record_success(self) -> None:
+        """Close the circuit after a healthy upstream response."""
+        if self.state != self.CLOSED:
+            logger.info("LLM circuit closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failures += 1
+        self._probing = False
+        if self.state == self.OPEN:
+            # A call admitted before the circuit opened; keep the timer
+            return
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened += 1
+            logger.warning("LLM circuit opened after %d failures", self.failures)
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+
+    def record_abandoned(self) -> None:
+        """Release a probe whose caller went away before an outcome."""
+        self._probing = False
+
+
+def _is_upstream_failure(exc: BaseException) -> bool:
+    """Whether ``exc`` says the upstream is unhealthy (not a bad request)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUSES
+    return isinstance(exc, (httpx.TimeoutException, httpx.TransportError))
+
+
+class LLMGuard:
+    """Concurrency cap, retries and circuit breaker around LLM requests.
+
+    Attributes:
+        limiter: Concurrency cap with bounded wait queue.
+        breaker: Circuit breaker.
+        max_retries: Retries after the first attempt.
+        retry_base_delay: Backoff ceiling of the first retry, in seconds.
+        retry_max_delay: Longest wait before a retry; a ``Retry-After``
+            beyond it is not waited for.
+        retries: Retries performed.
+    """
+
+    def __init__(
+        self,
+        limiter: ConcurrencyLimiter,
+        breaker: CircuitBreaker,
+        max_retries: int,
+        retry_base_delay: float,
+        retry_max_delay: float,
+    ) -> None:
+        self.limiter = limiter
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retries = 0
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> Optional[float]:
+        """Seconds to wait before retry ``attempt``, or None to give up."""
+        if attempt >= self.max_retries:
+            return None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.retry_max_delay else None
+        return backoff_delay(attempt, self.retry_base_delay, self.retry_max_delay)
+
+    async def _send_with_retries(
+        self, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = await send()
+            except (httpx.TimeoutException, httpx.TransportError):
+                delay = self._retry_delay(attempt, None)
+                if delay is None:
+                    raise
+            else:
+                if response.is_success:
+                    return response
+                await response.aclose()
+                delay = None
+                if response.status_code in RETRYABLE_STATUSES:
+                    delay = self._retry_delay(attempt, response)
+                if delay is None:
+                    response.raise_for_status()
+            self.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def request(
+        self, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> AsyncIterator[httpx.Response]:
+        """Send an LLM request under the guard and yield the response.
+
+        The concurrency slot is held until the block exits, so streamed
+        responses count against the cap while they are being read.
+        Failures while reading the body (e.g. a read timeout mid-stream)
+        also count towards the circuit breaker.
+
+        Args:
+            send: Coroutine function sending the request with
+                ``stream=True`` and returning the unread response. Called
+                once per attempt.
+
+        Yields:
+            httpx.Response: A successful (2xx) response, closed on exit.
+
+        Raises:
+            LLMUnavailable: If refused by the circuit breaker or the
+                concurrency limiter.
+            httpx.HTTPStatusError: If the final attempt got an error status.
+            httpx.TimeoutException: If the final attempt timed out.
+            httpx.TransportError: If the final attempt could not connect.
+        """
+        # Fail fast before queueing; checked again once a slot is free
+        self.breaker.check()
+        recorded = False
+        try:
+            async with self.limiter.slot():
+                self.breaker.before_call()
+                response = await self._send_with_retries(send)
+                try:
+                    yield response
+                finally:
+                    await response.aclose()
+            self.breaker.record_success()
+            recorded = True
+        except Exception as exc:
+            if _is_upstream_failure(exc):
+                self.breaker.record_failure()
+                recorded = True
+            elif not isinstance(exc, LLMUnavailable):
+                # The upstream answered; the error is ours (bad payload etc.)
+                self.breaker.record_success()
+                recorded = True
+            raise
+        finally:
+            if not recorded:
+                self.breaker.record_abandoned()
+
+    def stats(self) -> dict:
+        """Return limiter, retry and breaker counters.
+
+        Returns:
+            dict: ``active``, ``waiting``, ``rejected_busy``, ``retries``,
+            ``circuit_state``, ``circuit_opened`` and
+            ``rejected_circuit_open``.
+        """
+        return {
+            "active": self.limiter.active,
+            "waiting": self.limiter.waiting,
+            "rejected_busy": self.limiter.rejected,
+            "retries": self.retries,
+            "circuit_state": self.breaker.state,
+            "circuit_opened": self.breaker.opened,
+            "rejected_circuit_open": self.breaker.rejected,
+        }
+
+
+def build_llm_guard() -> LLMGuard:
+    """Create the guard configured from settings.
+
+    Returns:
+        LLMGuard: Guard for DeepSeek requests.
+    """
+    return LLMGuard(
+        ConcurrencyLimiter(
+            settings.llm_max_concurrency,
+            settings.llm_queue_size,
+            settings.llm_queue_timeout,
+        ),
+        CircuitBreaker(
+            settings.llm_breaker_failure_threshold,
+            settings.llm_breaker_reset_timeout,
+        ),
+        max_retries=settings.llm_max_retries,
+        retry_base_delay=settings.llm_retry_base_delay,
+        retry_max_delay=settings.llm_retry_max_delay,
+    )
+
+
+llm_guard = build_llm_guard()
@@ -0,0 +1,174 @@
+"""Token-budgeted task context for chat prompts.
+
+This module renders the tasks sent to the LLM as one compact
+pipe-separated row each, most relevant first, and stops adding rows once
+the prompt reaches a token budget. The exact statistics computed in SQL
+are always included, so counts stay correct however many rows are cut.
+"""
+
+import re
+from datetime import date
+from typing import List, Optional, Sequence
+
+from ..core.clock import utc_today
+from ..models import Task, TaskStatus
+from .task_stats import TaskStatistics
+
+# Longest title kept in a row; the rest is cut with "…"
+MAX_TITLE_CHARS = 80
+
+ROW_HEADER = "id|judul|status|deadline|assignee"
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate how many tokens the LLM tokenizer produces for ``text``.
+
+    DeepSeek's tokenizer is not available offline. Words count one token
+    per four characters (Indonesian words often split into several
+    pieces), ASCII symbols one token and other symbols (emoji) two, which
+    slightly overestimates real counts.
+
+    Args:
+        text: Prompt text.
+
+    Returns:
+        int: Estimated token count.
+    """
+    tokens = 0
+    for piece in _PIECE.findall(text):
+        if piece[0].isalnum() or piece[0] == "_":
+            tokens += (len(piece) + 3) // 4
+        else:
+            tokens += 1 if piece.isascii() else 2
+    return tokens
+
+
+def _urgency(task: Task, today: date) -> int:
+    """Higher for unfinished tasks whose deadline is past or close."""
+    if task.status == TaskStatus.done:
+        return -1
+    if task.deadline is None:
+        return 0
+    days = (task.deadline.date() - today).days
+    if days < 0:
+        return 3
+    if days <= 1:
+        return 2
+    if days <= 7:
+        return 1
+    return 0
+
+
+def rank_tasks(tasks: Sequence[Task], intent: dict, today: date) -> List[Task]:
+    """Order tasks by relevance to the question's intent.
+
+    Search results keep their relevance order and deadline questions
+    keep the deadline order they were loaded in. Otherwise overdue and
+    nearly due unfinished tasks come first and finished tasks last.
+
+    Args:
+        tasks: Candidate tasks in load order.
+        intent: Result of ``_detect_intent`` for the question.
+        today: Date used to judge deadlines.
+
+    Returns:
+        List[Task]: The same tasks, most relevant first.
+    """
+    if intent.get("search_keyword") or intent.get("filter_deadline"):
+        return list(tasks)
+    # sorted() is stable, so ties keep the load order
+    return sorted(tasks, key=lambda task: -_urgency(task, today))
+
+
+def _cell(text: str) -> str:
+    return " ".join(text.replace("|", "/").split())
+
+
+def format_task_row(task: Task, today: date) -> str:
+    """Render one task as ``id|judul|status|deadline|assignee``.
+
+    Overdue unfinished tasks get ``!`` after the deadline; ``-`` marks an
+    empty field.
+
+    Args:
+        task: Task with its assignee loaded.
+        today: Date used to flag overdue tasks.
+
+    Returns:
+        str: The row.
+    """
+    title = _cell(task.title)
+    if len(title) > MAX_TITLE_CHARS:
+        title = title[: MAX_TITLE_CHARS - 1] + "…"
+    deadline = "-"
+    if task.deadline is not None:
+        deadline = task.deadline.strftime("%Y-%m-%d")
+        if task.status != TaskStatus.done and task.deadline.date() < today:
+            deadline += "!"
+    assignee = _cell(task.assignee_rel.name) if task.assignee_rel else "-"
+    return f"{task.id}|{title}|{task.status.value}|{deadline}|{assignee}"
+
+
+def format_statistics(stats: TaskStatistics) -> str:
+    """Render the exact SQL statistics on one line."""
+    return (
+        f"STATISTIK (seluruh data, angka pasti): total={stats.total} "
+        f"todo={stats.todo} in_progress={stats.in_progress} done={stats.done} "
+        f"deadline_hari_ini={stats.due_today} terlambat={stats.overdue} "
+        f"tanpa_assignee={stats.unassigned}"
+    )
+
+
+def build_compact_prompt(
+    question: str,
+    tasks: Sequence[Task],
+    stats: TaskStatistics,
+    intent: dict,
+    token_budget: int,
+    today: Optional[date] = None,
+) -> str:
+    """Build the user prompt with as many ranked task rows as fit the budget.
+
+    The question, date, statistics and table header are always
+    included; rows are added in relevance order until the next one would
+    exceed ``token_budget``, and a final line says how many were left out.
+
+    Args:
+        question: The user's question.
+        tasks: Candidate tasks with their assignees loaded.
+        stats: Exact statistics over all tasks.
+        intent: Result of ``_detect_intent`` for the question.
+        token_budget: Maximum estimated tokens for the whole prompt.
+        today: Date used for deadlines; defaults to today (UTC).
+
+    Returns:
+        str: The prompt.
+    """
+    today = today or utc_today()
+    head = [
+        f"Pertanyaan user: {question}",
+        f"Hari ini: {today.isoformat()}",
+        format_statistics(stats),
+        f"TASK ({ROW_HEADER}; '-' = kosong; '!' = terlambat):",
+    ]
+    footer = "Jawab berdasarkan data di atas."
+    used = estimate_tokens("\n".join(head + [footer]))
+
+    ranked = rank_tasks(tasks, intent, today)
+    rows: List[str] = []
+    for task in ranked:
+        row = format_task_row(task, today)
+        # Reserve room for the "left out" line in case this row is the last
+        cost = estimate_tokens(row) + 1
+        if used + cost + 8 > token_budget:
+            break
+        rows.append(row)
+        used += cost
+
+    if not rows and not ranked:
+        rows.append("(tidak ada task yang cocok)")
+    if len(rows) < len(ranked):
+        rows.append(f"(+{len(ranked) - len(rows)} task lain tidak ditampilkan)")
+    return "\n".join(head + rows + [footer])
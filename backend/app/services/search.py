@@ -0,0 +1,173 @@
+"""Full-text search over task titles and descriptions.
+
+On PostgreSQL, searches run against the weighted ``tsvector`` expression
+covered by the ``ix_tasks_search`` GIN index and are ordered by
+``ts_rank``. Every word of the query must match, and words also match as
+prefixes ("lapor" finds "laporan"), so results update as the user
+types.
+
+Other databases (SQLite test runs) use an in-memory inverted index with
+the same matching rules and a similar title-over-description ranking.
+The index is rebuilt lazily after task writes and is per process.
+"""
+
+import asyncio
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from ..models import TASK_SEARCH_VECTOR_SQL, Task
+
+# Words of a query that are used; the rest are ignored
+MAX_QUERY_TERMS = 8
+
+# Fallback ranking weights, mirroring the A/B weights of the tsvector
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split ``text`` into lower-case search terms.
+
+    Args:
+        text: Free text.
+
+    Returns:
+        List[str]: Words, without punctuation or tsquery operators.
+    """
+    return _TOKEN.findall(text.lower())
+
+
+class InvertedIndex:
+    """In-memory term -> task postings used when PostgreSQL isn't available.
+
+    Attributes:
+        stale: Whether the index must be rebuilt before the next search.
+    """
+
+    def __init__(self) -> None:
+        self.stale = True
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._vocabulary: List[str] = []
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Mark the index out of date after a task write."""
+        self.stale = True
+
+    def build(self, rows: Iterable[Tuple[int, str, str]]) -> None:
+        """Replace the index contents.
+
+        Args:
+            rows: ``(id, title, description)`` of every task.
+        """
+        postings: Dict[str, Dict[int, float]] = {}
+        for task_id, title, description in rows:
+            for weight, text in (
+                (DESCRIPTION_WEIGHT, description or ""),
+                (TITLE_WEIGHT, title or ""),
+            ):
+                for term in set(tokenize(text)):
+                    entry = postings.setdefault(term, {})
+                    entry[task_id] = max(entry.get(task_id, 0.0), weight)
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+        self.stale = False
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Rebuild from the database if stale.
+
+        Args:
+            db: Database session.
+        """
+        async with self._lock:
+            if not self.stale:
+                return
+            result = await db.execute(select(Task.id, Task.title, Task.description))
+            self.build(result.all())
+
+    def _matches(self, term: str) -> Dict[int, float]:
+        """Best weight per task for words starting with ``term``."""
+        matches: Dict[int, float] = {}
+        start = bisect_left(self._vocabulary, term)
+        for word in self._vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            for task_id, weight in self._postings[word].items():
+                matches[task_id] = max(matches.get(task_id, 0.0), weight)
+        return matches
+
+    def search(self, terms: Sequence[str]) -> Dict[int, float]:
+        """Score tasks matching every term (prefix match).
+
+        Args:
+            terms: Query terms from :func:`tokenize`.
+
+        Returns:
+            Dict[int, float]: Score per matching task ID.
+        """
+        scores: Dict[int, float] = {}
+        for i, term in enumerate(terms):
+            matches = self._matches(term)
+            if i == 0:
+                scores = matches
+            else:
+                scores = {
+                    task_id: score + matches[task_id]
+                    for task_id, score in scores.items()
+                    if task_id in matches
+                }
+            if not scores:
+                break
+        return scores
+
+
+search_index = InvertedIndex()
+
+
+async def search_tasks(
+    db: AsyncSession, text: str, conditions: Sequence = (), limit: int = 20
+) -> List[Task]:
+    """Find tasks whose title or description matches ``text``, best first.
+
+    Args:
+        db: Database session.
+        text: Search words; all must match, as words or word prefixes.
+        conditions: Extra filter conditions (status, deadline, ...).
+        limit: Maximum number of tasks returned.
+
+    Returns:
+        List[Task]: Matching tasks with their assignee loaded, ordered by
+        relevance.
+    """
+    terms = tokenize(text)[:MAX_QUERY_TERMS]
+    if not terms:
+        return []
+    base = select(Task).options(joinedload(Task.assignee_rel))
+
+    if db.get_bind().dialect.name == "postgresql":
+        vector = literal_column(f"({TASK_SEARCH_VECTOR_SQL})")
+        query = func.to_tsquery(
+            literal_column("'simple'::regconfig"),
+            " & ".join(f"{term}:*" for term in terms),
+        )
+        result = await db.execute(
+            base.where(vector.op("@@", is_comparison=True)(query), *conditions)
+            .order_by(func.ts_rank(vector, query).desc(), Task.id.desc())
+            .limit(limit)
+        )
+        return list(result.scalars())
+
+    await search_index.refresh(db)
+    scores = search_index.search(terms)
+    if not scores:
+        return []
+    result = await db.execute(base.where(Task.id.in_(scores), *conditions))
+    tasks = sorted(result.scalars(), key=lambda t: (-scores[t.id], -t.id))
+    return tasks[:limit]
@@ -0,0 +1,190 @@
+"""Coalescing of identical concurrent work ("single flight").
+
+When several requests need the same result at the same time (ten people
+asking "apa yang terlambat?" during standup), only the first starts the
+work; the others wait for and share its result, or its exception.
+
+The work runs in its own task, so a caller that gives up (client
+disconnect) cancels only its own wait, never the result the others are
+waiting for. Streamed work publishes its chunks through a ``Broadcast``
+so every waiter can relay them as they arrive.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    Flights are tracked per process; with several workers each worker
+    coalesces its own requests.
+
+    Attributes:
+        flights: Calls actually started.
+        coalesced: Calls that joined a flight already in progress.
+    """
+
+    def __init__(self) -> None:
+        self.flights = 0
+        self.coalesced = 0
+        self._in_flight: Dict[str, "asyncio.Task"] = {}
+
+    def join(self, key: str) -> Optional["asyncio.Task"]:
+        """Return the running flight for ``key`` without starting one.
+
+        A caller that gets a flight counts as coalesced and should await
+        it through ``asyncio.shield``.
+
+        Args:
+            key: Identity of the work.
+
+        Returns:
+            Optional[asyncio.Task]: The flight, or None if nothing is running.
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        return task
+
+    def start(self, key: str, fn: Callable[[], Awaitable[T]]) -> "asyncio.Task":
+        """Return the flight for ``key``, starting ``fn()`` if none is running.
+
+        Callers should await the flight through ``asyncio.shield``.
+
+        Args:
+            key: Identity of the work; calls with equal keys are coalesced.
+            fn: Coroutine function doing the work; called only if no flight
+                for ``key`` is running.
+
+        Returns:
+            asyncio.Task: The new or already running flight.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            self.flights += 1
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.coalesced += 1
+        return task
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``fn()``, sharing it with concurrent callers.
+
+        Args:
+            key: Identity of the work; calls with equal keys are coalesced.
+            fn: Coroutine function doing the work; called only if no flight
+                for ``key`` is running.
+
+        Returns:
+            T: The (possibly shared) result.
+
+        Raises:
+            Exception: Whatever ``fn`` raised, re-raised in every waiter.
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+    def _forget(self, key: str, task: "asyncio.Task") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter has gone away
+            task.exception()
+
+    def stats(self) -> dict:
+        """Return flight counters.
+
+        Returns:
+            dict: ``flights``, ``coalesced`` and ``in_flight``.
+        """
+        return {
+            "flights": self.flights,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+
+class Broadcast:
+    """Chunks of one streamed result, relayed to every subscriber.
+
+    A subscriber that arrives late first gets the chunks published so
+    far. When the last subscriber leaves before the stream is closed,
+    ``abandoned`` turns true so the producer can stop early.
+
+    Attributes:
+        parts: Chunks published so far.
+        closed: Whether the producer has finished.
+        abandoned: Whether every subscriber has left before the end.
+    """
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.closed = False
+        self.abandoned = False
+        self._subscribers = 0
+        self._wakeup = asyncio.Event()
+
+    def publish(self, part: str) -> None:
+        """Append a chunk and wake the subscribers.
+
+        Args:
+            part: The chunk.
+        """
+        self.parts.append(part)
+        self._notify()
+
+    def close(self) -> None:
+        """Mark the stream finished and wake the subscribers."""
+        self.closed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+
+    @contextmanager
+    def subscription(self) -> Iterator[None]:
+        """Keep the stream wanted while the block runs."""
+        self._subscribers += 1
+        self.abandoned = False
+        try:
+            yield
+        finally:
+            self._subscribers -= 1
+            if not self._subscribers and not self.closed:
+                self.abandoned = True
+
+    async def follow(self) -> AsyncIterator[str]:
+        """Yield every chunk, already published or not, until the stream closes.
+
+        Yields:
+            str: The next chunk.
+        """
+        sent = 0
+        with self.subscription():
+            while True:
+                wakeup = self._wakeup
+                while sent < len(self.parts):
+                    yield self.parts[sent]
+                    sent += 1
+                if self.closed:
+                    return
+                await wakeup.wait()
+
+
+# LLM answers for identical chat questions at the same task-data version
+chat_flights = SingleFlight()
@@ -0,0 +1,106 @@
+"""Streaming export of the tasks table.
+
+Rows are read through a server-side cursor in fixed-size partitions and
+encoded as NDJSON or CSV chunk by chunk, so memory use does not depend
+on the size of the table. Assignee names come from a join to ``users``
+in the same query.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Sequence
+
+from sqlalchemy import select
+
+from ..db import AsyncSessionLocal
+from ..models import Task, TaskStatus, User
+
+# Rows fetched from the cursor and encoded per chunk
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "deadline",
+    "assignee_id",
+    "assignee_name",
+    "assignee_email",
+    "created_at",
+    "updated_at",
+)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _export_query():
+    return (
+        select(
+            Task.id,
+            Task.title,
+            Task.description,
+            Task.status,
+            Task.deadline,
+            Task.assignee_id,
+            User.name.label("assignee_name"),
+            User.email.label("assignee_email"),
+            Task.created_at,
+            Task.updated_at,
+        )
+        .outerjoin(User, Task.assignee_id == User.id)
+        .order_by(Task.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+
+def _plain(value):
+    """Convert a column value to a JSON/CSV friendly scalar."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, TaskStatus):
+        return value.value
+    return value
+
+
+def _encode_ndjson(rows: Iterable[Sequence]) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, map(_plain, row))), ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def _encode_csv(rows: Iterable[Sequence]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        ["" if v is None else _plain(v) for v in row] for row in rows
+    )
+    return buffer.getvalue()
+
+
+async def export_tasks(fmt: str) -> AsyncIterator[str]:
+    """Stream every task, joined with its assignee, as NDJSON or CSV.
+
+    Opens its own session because the response body is produced after
+    the request's dependencies have been cleaned up.
+
+    Args:
+        fmt: ``"ndjson"`` or ``"csv"``.
+
+    Yields:
+        str: Encoded chunks of up to ``EXPORT_BATCH_SIZE`` rows; for CSV
+        the first chunk is the header line.
+    """
+    encode = _encode_csv if fmt == "csv" else _encode_ndjson
+    if fmt == "csv":
+        yield _encode_csv([EXPORT_COLUMNS])
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(_export_query())
+        async for partition in result.partitions():
+            yield encode(partition)
@@ -0,0 +1,322 @@
+"""Streaming bulk import of tasks from CSV or NDJSON.
+
+Uploaded files are processed by a pipeline of generators, so only one
+batch of rows is held in memory at a time:
+
+    read records -> validate with ``schemas.TaskCreate`` -> batch -> write
+
+Assignees can be given by ``assignee_id``, ``assignee_email`` or
+``assignee_name`` and are resolved from a lookup table loaded once per
+import. Batches are written with ``COPY`` on PostgreSQL (asyncpg) and a
+batched executemany ``INSERT`` elsewhere (SQLite). Invalid rows are
+reported with their line number and skipped; they never abort the
+import. If the database rejects a whole batch, it is retried row by row
+so only the offending rows fail.
+"""
+
+import csv
+import heapq
+import io
+import json
+import time
+from datetime import datetime
+from itertools import islice
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from .. import schemas
+from ..models import Task, User
+
+# Rows written per COPY / executemany round-trip
+IMPORT_BATCH_SIZE = 5000
+
+# Per-row errors included in the report
+MAX_REPORTED_ERRORS = 100
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Columns written for every imported task
+COPY_COLUMNS = (
+    "title", "description", "status", "deadline", "assignee_id",
+    "created_at", "updated_at",
+)
+
+Record = Tuple[int, dict]
+RowError = Tuple[int, str]
+ValidRow = Tuple[int, schemas.TaskCreate]
+
+
+class RowErrors:
+    """Rejected rows of an import: a total count and the first few.
+
+    Only the ``limit`` lowest line numbers are kept, so a file full of
+    bad rows does not grow memory with its size. Errors may be added
+    out of line order (database errors arrive after the validation
+    errors of later rows in the same batch).
+
+    Attributes:
+        limit: Errors kept for the report.
+        count: Errors added in total.
+    """
+
+    def __init__(self, limit: int = MAX_REPORTED_ERRORS) -> None:
+        self.limit = limit
+        self.count = 0
+        # Max-heap on the line number (stored negated)
+        self._kept: List[Tuple[int, str]] = []
+
+    def append(self, error: RowError) -> None:
+        """Record one rejected row.
+
+        Args:
+            error: ``(line, message)`` of the row.
+        """
+        self.count += 1
+        line, message = error
+        item = (-line, message)
+        if len(self._kept) < self.limit:
+            heapq.heappush(self._kept, item)
+        elif item > self._kept[0]:
+            # Earlier than the latest kept line; replace that one
+            heapq.heapreplace(self._kept, item)
+
+    def first(self) -> List[RowError]:
+        """Return the kept errors in line order."""
+        return sorted((-line, message) for line, message in self._kept)
+
+
+class AssigneeResolver:
+    """In-memory lookup of users by ID, email and name.
+
+    Loaded with one query at the start of an import so resolving
+    assignees costs no database round-trips per row.
+    """
+
+    def __init__(self, users: List[Tuple[int, str, str]]) -> None:
+        self._ids: Set[int] = {user_id for user_id, _, _ in users}
+        self._by_email = {email.lower(): user_id for user_id, _, email in users}
+        self._by_name: Dict[str, Optional[int]] = {}
+        for user_id, name, _ in users:
+            key = name.strip().lower()
+            # None marks a name shared by several users
+            self._by_name[key] = None if key in self._by_name else user_id
+
+    @classmethod
+    async def load(cls, db: AsyncSession) -> "AssigneeResolver":
+        """Build the lookup table from the users table.
+
+        Args:
+            db: Database session.
+
+        Returns:
+            AssigneeResolver: Resolver over all current users.
+        """
+        result = await db.execute(select(User.id, User.name, User.email))
+        return cls([tuple(row) for row in result])
+
+    def resolve(self, record: dict) -> Optional[int]:
+        """Return the assignee ID referenced by ``record``, if any.
+
+        Args:
+            record: Parsed row with optional ``assignee_id``,
+                ``assignee_email`` or ``assignee_name``.
+
+        Returns:
+            Optional[int]: The user ID, or None when no assignee is given.
+
+        Raises:
+            ValueError: If the referenced user doesn't exist or the name
+                is ambiguous.
+        """
+        assignee_id = record.get("assignee_id")
+        if assignee_id not in (None, ""):
+            try:
+                assignee_id = int(assignee_id)
+            except (TypeError, ValueError):
+                raise ValueError("Invalid assignee_id")
+            if assignee_id not in self._ids:
+                raise ValueError("Assignee not found")
+            return assignee_id
+
+        email = (record.get("assignee_email") or "").strip().lower()
+        if email:
+            if email not in self._by_email:
+                raise ValueError("Assignee not found")
+            return self._by_email[email]
+
+        name = (record.get("assignee_name") or "").strip().lower()
+        if name:
+            if name not in self._by_name:
+                raise ValueError("Assignee not found")
+            if self._by_name[name] is None:
+                raise ValueError("Ambiguous assignee name, use assignee_email")
+            return self._by_name[name]
+        return None
+
+
+def read_records(file: IO[bytes], fmt: str) -> Iterator[Record]:
+    """Parse an uploaded file into ``(line, record)`` pairs, lazily.
+
+    Args:
+        file: Binary file object positioned at the start.
+        fmt: ``"csv"`` or ``"ndjson"``.
+
+    Yields:
+        Record: Line number and parsed row. Unparseable NDJSON lines are
+        yielded with an ``"__error__"`` key.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            for row in reader:
+                # Empty cells mean "not set", like missing NDJSON keys
+                yield reader.line_num, {k: v for k, v in row.items() if v != ""}
+            return
+
+        for line_no, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield line_no, {"__error__": "Invalid JSON"}
+                continue
+            if not isinstance(record, dict):
+                record = {"__error__": "Expected a JSON object"}
+            yield line_no, record
+    except UnicodeDecodeError:
+        yield 0, {"__error__": "File is not valid UTF-8"}
+    finally:
+        # Leave the upload open; its owner closes it
+        text.detach()
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in exc.errors()
+    )
+
+
+def validate_records(
+    records: Iterator[Record], resolver: AssigneeResolver, errors: RowErrors
+) -> Iterator[ValidRow]:
+    """Validate parsed rows, yielding tasks and collecting row errors.
+
+    Args:
+        records: Output of :func:`read_records`.
+        resolver: Assignee lookup table.
+        errors: Receives ``(line, message)`` for rejected rows.
+
+    Yields:
+        ValidRow: Line number and the valid task, assignee resolved.
+    """
+    for line_no, record in records:
+        if "__error__" in record:
+            errors.append((line_no, record["__error__"]))
+            continue
+        try:
+            assignee_id = resolver.resolve(record)
+            task = schemas.TaskCreate(**{**record, "assignee_id": assignee_id})
+        except ValidationError as exc:
+            errors.append((line_no, _validation_message(exc)))
+            continue
+        except ValueError as exc:
+            errors.append((line_no, str(exc)))
+            continue
+        yield line_no, task
+
+
+def batched(rows: Iterator[ValidRow], size: int) -> Iterator[List[ValidRow]]:
+    """Group ``rows`` into lists of at most ``size`` items."""
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+async def _copy_batch(db: AsyncSession, batch: List[schemas.TaskCreate]) -> None:
+    """Write a batch with PostgreSQL ``COPY`` through asyncpg."""
+    now = datetime.utcnow()
+    records = [
+        (t.title, t.description, t.status.name, t.deadline, t.assignee_id, now, now)
+        for t in batch
+    ]
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Task.__tablename__, records=records, columns=COPY_COLUMNS
+    )
+
+
+async def _insert_batch(db: AsyncSession, batch: List[schemas.TaskCreate]) -> None:
+    """Write a batch with one executemany ``INSERT`` (non-PostgreSQL)."""
+    now = datetime.utcnow()
+    await db.execute(
+        insert(Task.__table__),
+        [{**t.dict(), "created_at": now, "updated_at": now} for t in batch],
+    )
+
+
+async def import_tasks(db: AsyncSession, file: IO[bytes], fmt: str) -> dict:
+    """Import tasks from an uploaded CSV or NDJSON file.
+
+    Each batch is committed on its own; if the database rejects a batch,
+    its rows are reported as failed and the import continues.
+
+    Args:
+        db: Database session.
+        file: Uploaded file (binary).
+        fmt: ``"csv"`` or ``"ndjson"``.
+
+    Returns:
+        dict: Counts, throughput and the first ``MAX_REPORTED_ERRORS``
+        row errors (see ``schemas.TaskImportResult``).
+    """
+    start = time.perf_counter()
+    resolver = await AssigneeResolver.load(db)
+    connection = await db.connection()
+    write_batch = _copy_batch if connection.dialect.name == "postgresql" else _insert_batch
+
+    errors = RowErrors()
+    batches = batched(
+        validate_records(read_records(file, fmt), resolver, errors), IMPORT_BATCH_SIZE
+    )
+    imported = 0
+    while True:
+        # Parsing and validation are CPU-bound; keep them off the event loop
+        batch = await run_in_threadpool(next, batches, None)
+        if batch is None:
+            break
+        try:
+            await write_batch(db, [task for _, task in batch])
+            await db.commit()
+            imported += len(batch)
+            continue
+        # COPY raises asyncpg errors, which SQLAlchemy does not wrap
+        except Exception:
+            await db.rollback()
+        # Isolate the rows the database refused
+        for line_no, task in batch:
+            try:
+                await write_batch(db, [task])
+                await db.commit()
+                imported += 1
+            except Exception as exc:
+                await db.rollback()
+                errors.append((line_no, f"Database error: {exc.__class__.__name__}"))
+
+    elapsed = time.perf_counter() - start
+    return {
+        "imported": imported,
+        "failed": errors.count,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(imported / elapsed, 1) if elapsed else 0.0,
+        "errors": [{"line": line, "error": message} for line, message in errors.first()],
+        "errors_truncated": errors.count > errors.limit,
+    }
@@ -0,0 +1,94 @@
+"""Task statistics computed in SQL.
+
+This module aggregates task counts over the whole ``tasks`` table in a
+single query, so chat statistics stay exact and cheap regardless of how
+many tasks exist. It also provides the task-data version that keys
+caches derived from tasks.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.clock import utc_today
+from ..models import Task, TaskDeletion, TaskStatus
+
+
+@dataclass(frozen=True)
+class TaskStatistics:
+    """Exact task counts over the whole table.
+
+    Attributes:
+        total: All tasks.
+        todo: Tasks with status Todo.
+        in_progress: Tasks with status In Progress.
+        done: Tasks with status Done.
+        overdue: Unfinished tasks whose deadline was before today.
+        due_today: Tasks whose deadline falls today.
+        unassigned: Tasks without an assignee.
+    """
+
+    total: int
+    todo: int
+    in_progress: int
+    done: int
+    overdue: int
+    due_today: int
+    unassigned: int
+
+
+async def get_tasks_version(db: AsyncSession) -> tuple:
+    """Return a fingerprint that changes whenever any task changes.
+
+    Creates and updates move ``max(change_seq)``; deletes add to the
+    deletion log. Both come from the database through index-backed
+    lookups, so every worker sees the same version, whichever worker (or
+    script) made the write.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        tuple: ``(max_change_seq, max_deletion_id)``.
+    """
+    result = await db.execute(
+        select(
+            func.coalesce(func.max(Task.change_seq), 0),
+            select(func.coalesce(func.max(TaskDeletion.id), 0)).scalar_subquery(),
+        )
+    )
+    return tuple(result.one())
+
+
+async def get_task_statistics(db: AsyncSession) -> TaskStatistics:
+    """Compute task statistics with one ``COUNT ... FILTER`` query.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        TaskStatistics: Exact counts for the whole table.
+    """
+    start_of_today = datetime.combine(utc_today(), datetime.min.time())
+    start_of_tomorrow = start_of_today + timedelta(days=1)
+    count = func.count(Task.id)
+
+    result = await db.execute(
+        select(
+            count.label("total"),
+            count.filter(Task.status == TaskStatus.todo).label("todo"),
+            count.filter(Task.status == TaskStatus.in_progress).label("in_progress"),
+            count.filter(Task.status == TaskStatus.done).label("done"),
+            count.filter(
+                Task.deadline < start_of_today, Task.status != TaskStatus.done
+            ).label("overdue"),
+            count.filter(
+                Task.deadline >= start_of_today, Task.deadline < start_of_tomorrow
+            ).label("due_today"),
+            count.filter(Task.assignee_id.is_(None)).label("unassigned"),
+        )
+    )
+    row = result.one()
+    return TaskStatistics(**row._asdict())
@@ -0,0 +1 @@
+"""Benchmark scripts for the backend (run from ``backend/`` with ``python -m``)."""
@@ -0,0 +1,76 @@
+"""Benchmark: per-request httpx client vs the shared pooled client.
+
+Sends the same chat completion request to a local stub LLM server,
+first creating a new ``httpx.AsyncClient`` per request (the old
+behaviour of ``ask_deepseek``), then through the pooled client built by
+``app.services.http_client``. Prints per-request latency for both.
+
+Usage (from ``backend/``, with the usual environment variables set)::
+
+    python -m benchmarks.llm_client --requests 200 --latency 0.005
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+
+from app.services.http_client import build_llm_client
+
+from .stub_llm import StubLLM, StubServer
+
+PAYLOAD = {
+    "model": "deepseek-chat",
+    "messages": [{"role": "user", "content": "Berapa task yang done?"}],
+}
+
+
+async def _per_request_client(url: str, n: int) -> List[float]:
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(timeout=30) as client:
+            resp = await client.post(url, json=PAYLOAD)
+            resp.raise_for_status()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def _shared_client(url: str, n: int) -> List[float]:
+    timings = []
+    async with build_llm_client() as client:
+        for _ in range(n):
+            start = time.perf_counter()
+            resp = await client.post(url, json=PAYLOAD)
+            resp.raise_for_status()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _summary(timings: List[float]) -> str:
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    return f"mean={statistics.mean(ms):7.2f}ms p50={statistics.median(ms):7.2f}ms p95={p95:7.2f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="stub latency (s)")
+    args = parser.parse_args()
+
+    with StubServer(StubLLM(latency=args.latency)) as server:
+        per_request = asyncio.run(_per_request_client(server.url, args.requests))
+        shared = asyncio.run(_shared_client(server.url, args.requests))
+
+    saved = statistics.mean(per_request) - statistics.mean(shared)
+    print(f"per-request client: {_summary(per_request)}")
+    print(f"shared client:      {_summary(shared)}")
+    print(f"saved per request:  {saved * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Load test: LLM concurrency cap, retries and circuit breaker.
+
+Fires waves of concurrent ``ask_deepseek`` calls at the local stub LLM
+while it injects errors and latency, once through an unguarded
+configuration (no retries, no cap, no breaker: the old behaviour) and
+once through the guard configured from settings. Reports answered and
+failed calls, upstream requests, retries, rejections and latency.
+
+Scenarios:
+
+- ``ratelimit``: a share of requests get 429 with ``Retry-After``.
+- ``outage``: every request gets 503; the breaker should open and
+  later calls fail fast without reaching the upstream.
+
+Usage (from ``backend/``, with the usual environment variables set)::
+
+    python -m benchmarks.llm_resilience --calls 200 --error-rate 0.3
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from app.config import settings
+from app.services import chatbot, llm_backends
+from app.services.chatbot import ChatbotError, ask_deepseek
+from app.services.http_client import close_llm_client
+from app.services.llm_guard import (
+    CircuitBreaker,
+    ConcurrencyLimiter,
+    LLMGuard,
+    build_llm_guard,
+)
+
+from .prompt_context import make_statistics, make_tasks
+from .stub_llm import StubLLM, StubServer
+
+
+def _unguarded() -> LLMGuard:
+    limiter = ConcurrencyLimiter(limit=10**6, queue_size=0, timeout=1)
+    breaker = CircuitBreaker(failure_threshold=10**9, reset_timeout=0)
+    return LLMGuard(limiter, breaker, max_retries=0, retry_base_delay=0, retry_max_delay=0)
+
+
+async def _bursts(calls: int, waves: int, tasks, stats) -> tuple:
+    async def one():
+        start = time.perf_counter()
+        try:
+            await ask_deepseek("Apa yang terlambat?", tasks, stats)
+            ok = True
+        except ChatbotError:
+            ok = False
+        return ok, time.perf_counter() - start
+
+    results = []
+    for _ in range(waves):
+        results += await asyncio.gather(*(one() for _ in range(calls)))
+    await close_llm_client()
+    return [ok for ok, _ in results], [elapsed for _, elapsed in results]
+
+
+def _report(
+    label: str, stub: StubLLM, guard: LLMGuard, oks: List[bool], timings: List[float]
+) -> None:
+    ms = sorted(t * 1000 for t in timings)
+    stats = guard.stats()
+    print(
+        f"{label:10} answered={sum(oks):4} failed={len(oks) - sum(oks):4} "
+        f"upstream={stub.requests:4} injected={stub.errors_sent:4} "
+        f"retries={stats['retries']:4} busy={stats['rejected_busy']:4} "
+        f"breaker_rejects={stats['rejected_circuit_open']:4} "
+        f"p50={statistics.median(ms):7.1f}ms p95={ms[int(len(ms) * 0.95) - 1]:7.1f}ms"
+    )
+
+
+def run_scenario(args: argparse.Namespace, name: str) -> None:
+    # Exercise the HTTP path whatever LLM_BACKEND says
+    chatbot.llm_backend = llm_backends.DeepSeekBackend()
+    tasks = make_tasks(20)
+    stats = make_statistics(tasks)
+    print(f"-- {name}")
+    for label, guard in (("unguarded", _unguarded()), ("guarded", build_llm_guard())):
+        if name == "ratelimit":
+            stub = StubLLM(
+                latency=args.latency, error_rate=args.error_rate, retry_after=args.retry_after
+            )
+        else:
+            stub = StubLLM(latency=args.latency, error_rate=1.0, error_status=503)
+        with StubServer(stub) as server:
+            settings.deepseek_api_url = server.url
+            llm_backends.llm_guard = guard
+            oks, timings = asyncio.run(_bursts(args.calls, args.waves, tasks, stats))
+        _report(label, stub, guard, oks, timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200, help="concurrent calls per burst")
+    parser.add_argument("--waves", type=int, default=3, help="bursts, one after another")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.3, help="share of 429s")
+    parser.add_argument("--retry-after", type=float, default=0.2, help="Retry-After (s)")
+    parser.add_argument(
+        "--scenario", choices=("ratelimit", "outage", "all"), default="all"
+    )
+    args = parser.parse_args()
+
+    for name in ("ratelimit", "outage"):
+        if args.scenario in (name, "all"):
+            run_scenario(args, name)
+
+
+if __name__ == "__main__":
+    main()
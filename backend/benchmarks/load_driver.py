@@ -0,0 +1,380 @@
+"""Async load driver replaying a weighted traffic mix against the API.
+
+Concurrent workers pick operations at random according to ``--mix``
+weights and report throughput and latency percentiles per endpoint as
+JSON, so runs can be stored and compared:
+
+- ``board``: ``GET /tasks/`` (first page, sometimes filtered by status);
+- ``board_next``: ``GET /tasks/`` following a ``next_cursor``;
+- ``task``: ``GET /tasks/{id}`` of a task seen on the board;
+- ``search``: ``GET /tasks/search``;
+- ``create`` / ``update`` / ``delete``: CRUD on tasks the driver created;
+- ``login``: ``POST /auth/login`` (bcrypt-bound);
+- ``chat``: ``POST /chat/query``.
+
+Start the server with a stubbed LLM so chat traffic needs no network and
+stays reproducible, e.g. ``LLM_BACKEND=stub LLM_STUB_LATENCY=0.2 uvicorn
+app.main:app``, and seed data first with ``benchmarks.seed_data``.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.load_driver --url http://localhost:8000 \\
+        --duration 60 --concurrency 50 --output run.json
+    python -m benchmarks.load_driver --mix board=70,task=20,create=10 \\
+        --baseline run.json
+
+With ``--baseline`` the JSON gains a ``comparison`` section with the
+relative change of throughput, p95 and p99 per endpoint.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+
+DEFAULT_MIX = (
+    "board=40,board_next=10,task=15,search=8,create=8,update=8,delete=3,login=3,chat=5"
+)
+
+STATUSES = ("Todo", "In Progress", "Done")
+SEARCH_WORDS = ("laporan", "login", "deploy", "rapat", "api", "data", "desain", "audit")
+CHAT_QUESTIONS = (
+    "Task apa saja yang terlambat?",
+    "Siapa yang paling banyak mengerjakan task tentang laporan keuangan?",
+    "Apa prioritas tim minggu ini?",
+    "Task apa yang deadlinenya besok dan belum selesai?",
+    "Ringkas progres task tentang aplikasi mobile",
+)
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse ``name=weight,...`` into a weight per operation.
+
+    Args:
+        spec: Comma-separated ``operation=weight`` pairs.
+
+    Returns:
+        Dict[str, float]: Positive weight per operation.
+
+    Raises:
+        ValueError: On unknown operations or malformed weights.
+    """
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; use one of {sorted(OPERATIONS)}")
+        mix[name] = float(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LoadState:
+    """Shared state of the workers: auth, known task IDs and samples.
+
+    Attributes:
+        headers: Authorization header for API calls.
+        credentials: Login form data for ``login`` operations.
+        seen_ids: Task IDs seen on board pages.
+        own_ids: Task IDs created by the driver, for update/delete.
+        cursors: ``next_cursor`` values seen on board pages.
+        recording: Whether samples are kept (false during warm-up).
+        samples: Latencies in seconds per endpoint.
+        statuses: Response status counts per endpoint.
+        errors: Failed calls (transport errors and 5xx) per endpoint.
+    """
+
+    def __init__(self, headers: Dict[str, str], credentials: dict) -> None:
+        self.headers = headers
+        self.credentials = credentials
+        self.seen_ids: List[int] = []
+        self.own_ids: List[int] = []
+        self.cursors: List[str] = []
+        self.recording = False
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def remember(self, ids: List[int], limit: int = 5000) -> None:
+        self.seen_ids.extend(ids)
+        if len(self.seen_ids) > limit:
+            del self.seen_ids[: len(self.seen_ids) - limit]
+
+
+async def _timed(state: LoadState, endpoint: str, request) -> Optional[httpx.Response]:
+    """Await ``request`` and record its latency and status under ``endpoint``."""
+    start = time.perf_counter()
+    try:
+        response = await request
+    except httpx.HTTPError:
+        if state.recording:
+            state.errors[endpoint] += 1
+        return None
+    elapsed = time.perf_counter() - start
+    if state.recording:
+        state.samples[endpoint].append(elapsed)
+        state.statuses[endpoint][response.status_code] += 1
+        if response.status_code >= 500:
+            state.errors[endpoint] += 1
+    return response
+
+
+async def op_board(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    params = {"limit": 50}
+    if rng.random() < 0.3:
+        params["status"] = rng.choice(STATUSES)
+    resp = await _timed(
+        state, "GET /tasks/", client.get("/tasks/", params=params, headers=state.headers)
+    )
+    if resp is not None and resp.status_code == 200:
+        page = resp.json()
+        state.remember([task["id"] for task in page["items"]])
+        if page["next_cursor"]:
+            state.cursors.append(page["next_cursor"])
+            del state.cursors[:-100]
+
+
+async def op_board_next(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    if not state.cursors:
+        return await op_board(client, state, rng)
+    params = {"limit": 50, "cursor": rng.choice(state.cursors)}
+    request = client.get("/tasks/", params=params, headers=state.headers)
+    resp = await _timed(state, "GET /tasks/?cursor", request)
+    if resp is not None and resp.status_code == 200:
+        state.remember([task["id"] for task in resp.json()["items"]])
+
+
+async def op_task(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    if not state.seen_ids:
+        return await op_board(client, state, rng)
+    task_id = rng.choice(state.seen_ids)
+    await _timed(
+        state, "GET /tasks/{id}", client.get(f"/tasks/{task_id}", headers=state.headers)
+    )
+
+
+async def op_search(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    params = {"q": " ".join(rng.sample(SEARCH_WORDS, rng.randint(1, 2))), "limit": 20}
+    request = client.get("/tasks/search", params=params, headers=state.headers)
+    await _timed(state, "GET /tasks/search", request)
+
+
+async def op_create(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    body = {
+        "title": f"Load test {rng.randint(0, 10**9)}",
+        "description": "Dibuat oleh load driver",
+        "status": rng.choice(STATUSES),
+    }
+    resp = await _timed(
+        state, "POST /tasks/", client.post("/tasks/", json=body, headers=state.headers)
+    )
+    if resp is not None and resp.status_code == 201:
+        state.own_ids.append(resp.json()["id"])
+
+
+async def op_update(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    if not state.own_ids:
+        return await op_create(client, state, rng)
+    # Taken out of the pool while in use, so delete never races this update
+    task_id = state.own_ids.pop(rng.randrange(len(state.own_ids)))
+    body = {"status": rng.choice(STATUSES)}
+    request = client.put(f"/tasks/{task_id}", json=body, headers=state.headers)
+    resp = await _timed(state, "PUT /tasks/{id}", request)
+    if resp is None or resp.status_code != 404:
+        state.own_ids.append(task_id)
+
+
+async def op_delete(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    if not state.own_ids:
+        return await op_create(client, state, rng)
+    task_id = state.own_ids.pop(rng.randrange(len(state.own_ids)))
+    request = client.delete(f"/tasks/{task_id}", headers=state.headers)
+    await _timed(state, "DELETE /tasks/{id}", request)
+
+
+async def op_login(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    await _timed(state, "POST /auth/login", client.post("/auth/login", data=state.credentials))
+
+
+async def op_chat(client: httpx.AsyncClient, state: LoadState, rng: random.Random) -> None:
+    body = {"question": rng.choice(CHAT_QUESTIONS)}
+    await _timed(
+        state, "POST /chat/query", client.post("/chat/query", json=body, headers=state.headers)
+    )
+
+
+OPERATIONS = {
+    "board": op_board,
+    "board_next": op_board_next,
+    "task": op_task,
+    "search": op_search,
+    "create": op_create,
+    "update": op_update,
+    "delete": op_delete,
+    "login": op_login,
+    "chat": op_chat,
+}
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    state: LoadState,
+    mix: Dict[str, float],
+    seed: int,
+    stop_at: float,
+) -> None:
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < stop_at:
+        name = rng.choices(names, weights)[0]
+        await OPERATIONS[name](client, state, rng)
+
+
+def summarize(state: LoadState, duration: float) -> dict:
+    """Build the per-endpoint report.
+
+    Args:
+        state: Collected samples.
+        duration: Measured seconds (after warm-up).
+
+    Returns:
+        dict: Totals and, per endpoint, count, errors, throughput,
+        latency percentiles in milliseconds and status counts.
+    """
+    endpoints = {}
+    total = 0
+    for endpoint in sorted(set(state.samples) | set(state.errors)):
+        ms = sorted(sample * 1000 for sample in state.samples.get(endpoint, []))
+        total += len(ms)
+        endpoints[endpoint] = {
+            "count": len(ms),
+            "errors": state.errors.get(endpoint, 0),
+            "rps": round(len(ms) / duration, 2),
+            "mean_ms": round(sum(ms) / len(ms), 2) if ms else 0.0,
+            "p50_ms": round(percentile(ms, 50), 2),
+            "p95_ms": round(percentile(ms, 95), 2),
+            "p99_ms": round(percentile(ms, 99), 2),
+            "max_ms": round(ms[-1], 2) if ms else 0.0,
+            "status": {str(code): n for code, n in sorted(state.statuses[endpoint].items())},
+        }
+    return {
+        "duration_s": round(duration, 2),
+        "requests": total,
+        "errors": sum(state.errors.values()),
+        "throughput_rps": round(total / duration, 2),
+        "endpoints": endpoints,
+    }
+
+
+def compare(current: dict, baseline: dict) -> dict:
+    """Relative change of throughput and p95/p99 against a baseline run.
+
+    Args:
+        current: Report of this run.
+        baseline: Report of an earlier run (same format).
+
+    Returns:
+        dict: Per endpoint ``rps_change``, ``p95_change`` and
+        ``p99_change`` as fractions (``0.1`` = 10% higher).
+    """
+
+    def change(new: float, old: float) -> Optional[float]:
+        return round(new / old - 1, 4) if old else None
+
+    result = {
+        "throughput_change": change(current["throughput_rps"], baseline["throughput_rps"])
+    }
+    for endpoint, stats in current["endpoints"].items():
+        old = baseline["endpoints"].get(endpoint)
+        if old is None:
+            continue
+        result[endpoint] = {
+            "rps_change": change(stats["rps"], old["rps"]),
+            "p95_change": change(stats["p95_ms"], old["p95_ms"]),
+            "p99_change": change(stats["p99_ms"], old["p99_ms"]),
+        }
+    return result
+
+
+async def run(args: argparse.Namespace) -> dict:
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    base_url = args.url.rstrip("/")
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        credentials = {"username": args.email, "password": args.password}
+        resp = await client.post("/auth/login", data=credentials)
+        resp.raise_for_status()
+        headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+        state = LoadState(headers, credentials)
+
+        start = time.perf_counter()
+        stop_at = start + args.warmup + args.duration
+        workers = [
+            asyncio.create_task(_worker(client, state, mix, args.seed + i, stop_at))
+            for i in range(args.concurrency)
+        ]
+        await asyncio.sleep(args.warmup)
+        state.recording = True
+        measured_from = time.perf_counter()
+        await asyncio.gather(*workers)
+        duration = time.perf_counter() - measured_from
+
+        # Leave the database as we found it
+        for task_id in state.own_ids:
+            await client.delete(f"/tasks/{task_id}", headers=headers)
+
+    report = summarize(state, duration)
+    report["config"] = {
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "warmup_s": args.warmup,
+        "mix": mix,
+        "seed": args.seed,
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare(report, json.load(f))
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="unmeasured seconds first")
+    parser.add_argument("--concurrency", type=int, default=20, help="concurrent workers")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="operation=weight,...")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=None, help="write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="earlier JSON report to compare")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
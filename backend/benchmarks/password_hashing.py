@@ -0,0 +1,96 @@
+"""Benchmark: login throughput of the bcrypt worker pool versus workers.
+
+Runs a burst of concurrent password verifications through
+``app.core.security.PasswordHasher`` for 1..N worker threads and prints
+logins per second, latency and how many attempts were shed with 429.
+While the burst runs, a ticker measures event-loop lag to show that the
+loop stays responsive.
+
+Usage (from ``backend/``, with the usual environment variables set)::
+
+    python -m benchmarks.password_hashing --logins 64 --rounds 12 --max-workers 8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+from passlib.context import CryptContext
+
+from app.core.security import PasswordHasher, PasswordHasherBusy
+
+PASSWORD = "password123"
+
+
+async def _loop_lag(stop: asyncio.Event, samples: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        samples.append(time.perf_counter() - start - 0.01)
+
+
+async def _burst(workers: int, queue_size: int, logins: int, hashed: str) -> dict:
+    hasher = PasswordHasher(workers=workers, queue_size=queue_size)
+    timings: List[float] = []
+    lag: List[float] = []
+    rejected = 0
+
+    async def login() -> None:
+        nonlocal rejected
+        start = time.perf_counter()
+        try:
+            valid, _ = await hasher.verify_and_update(PASSWORD, hashed)
+            assert valid
+            timings.append(time.perf_counter() - start)
+        except PasswordHasherBusy:
+            rejected += 1
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_loop_lag(stop, lag))
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    hasher.shutdown()
+
+    ms = sorted(t * 1000 for t in timings) or [0.0]
+    return {
+        "workers": workers,
+        "throughput": len(timings) / elapsed,
+        "p50": statistics.median(ms),
+        "p95": ms[max(int(len(ms) * 0.95) - 1, 0)],
+        "rejected": rejected,
+        "max_lag": max(lag, default=0.0) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--queue-size", type=int, default=None,
+        help="queued operations allowed (default: no shedding)",
+    )
+    args = parser.parse_args()
+
+    hashed = CryptContext(schemes=["bcrypt"], bcrypt__rounds=args.rounds).hash(PASSWORD)
+    queue_size = args.logins if args.queue_size is None else args.queue_size
+    print(f"cpu cores: {os.cpu_count()}, bcrypt rounds: {args.rounds}")
+
+    for workers in range(1, args.max_workers + 1):
+        r = asyncio.run(_burst(workers, queue_size, args.logins, hashed))
+        print(
+            f"workers={r['workers']:2d} {r['throughput']:7.1f} logins/s "
+            f"p50={r['p50']:8.1f}ms p95={r['p95']:8.1f}ms "
+            f"rejected={r['rejected']:3d} max loop lag={r['max_lag']:6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark: prompt tokens and LLM latency, verbose vs compact context.
+
+Builds the chat prompt for a set of questions over synthetic tasks in
+both formats and sends each to a chat completions endpoint, reporting
+prompt size (characters, estimated tokens and the ``prompt_tokens`` the
+server reports) and request latency.
+
+By default the requests go to the local stub LLM, whose latency grows
+with prompt length (``--prompt-token-latency``). Pass ``--url`` and
+``--api-key`` to measure against the real DeepSeek API instead.
+
+Usage (from ``backend/``, with the usual environment variables set)::
+
+    python -m benchmarks.prompt_context --tasks 50 --rounds 5
+    python -m benchmarks.prompt_context --url https://api.deepseek.com/chat/completions \\
+        --api-key $DEEPSEEK_API_KEY --rounds 3
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import httpx
+
+from app.models import Task, TaskStatus, User
+from app.services.chatbot import _build_payload, build_prompt
+from app.services.prompt_context import estimate_tokens
+from app.services.task_stats import TaskStatistics
+
+from .stub_llm import StubLLM, StubServer
+
+QUESTIONS = [
+    "Task apa saja yang terlambat dan siapa assignee-nya?",
+    "Siapa yang mengerjakan task tentang laporan keuangan?",
+    "Apa prioritas saya minggu ini?",
+    "Ringkas progres tim dan task yang belum ada assignee-nya",
+]
+
+WORDS = (
+    "laporan keuangan rapat tim desain halaman login migrasi database "
+    "review kode deploy server dokumentasi api perbaikan bug testing "
+    "integrasi pembayaran analisis data presentasi klien"
+).split()
+
+
+def make_tasks(n: int, seed: int = 1) -> List[Task]:
+    """Build ``n`` detached tasks with assignees and varied deadlines."""
+    rng = random.Random(seed)
+    users = [User(id=i, name=f"User {i}", email=f"user{i}@example.com") for i in range(1, 9)]
+    now = datetime.now()
+    tasks = []
+    for i in range(1, n + 1):
+        deadline = now + timedelta(days=rng.randint(-10, 30)) if rng.random() < 0.8 else None
+        tasks.append(
+            Task(
+                id=i,
+                title=" ".join(rng.sample(WORDS, rng.randint(2, 5))).capitalize(),
+                description="",
+                status=rng.choice(list(TaskStatus)),
+                deadline=deadline,
+                assignee_rel=rng.choice(users + [None]),
+            )
+        )
+    return tasks
+
+
+def make_statistics(tasks: List[Task]) -> TaskStatistics:
+    """Count ``tasks`` the way ``get_task_statistics`` does in SQL."""
+    today = datetime.now().date()
+    unfinished = [t for t in tasks if t.status != TaskStatus.done]
+    return TaskStatistics(
+        total=len(tasks),
+        todo=sum(t.status == TaskStatus.todo for t in tasks),
+        in_progress=sum(t.status == TaskStatus.in_progress for t in tasks),
+        done=sum(t.status == TaskStatus.done for t in tasks),
+        overdue=sum(1 for t in unfinished if t.deadline and t.deadline.date() < today),
+        due_today=sum(1 for t in tasks if t.deadline and t.deadline.date() == today),
+        unassigned=sum(t.assignee_rel is None for t in tasks),
+    )
+
+
+async def _measure(
+    url: str, api_key: Optional[str], payloads: List[dict], rounds: int
+) -> tuple:
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    timings, prompt_tokens = [], []
+    async with httpx.AsyncClient(timeout=120) as client:
+        for _ in range(rounds):
+            for payload in payloads:
+                start = time.perf_counter()
+                resp = await client.post(url, json=payload, headers=headers)
+                resp.raise_for_status()
+                timings.append(time.perf_counter() - start)
+                usage = resp.json().get("usage") or {}
+                prompt_tokens.append(usage.get("prompt_tokens", 0))
+    return timings, prompt_tokens
+
+
+async def run(args: argparse.Namespace, url: str) -> None:
+    tasks = make_tasks(args.tasks)
+    stats = make_statistics(tasks)
+    results = {}
+    for fmt in ("verbose", "compact"):
+        prompts = [
+            build_prompt(q, tasks, stats, context_format=fmt, token_budget=args.budget)
+            for q in QUESTIONS
+        ]
+        payloads = []
+        for question, prompt in zip(QUESTIONS, prompts):
+            payload = _build_payload(question, tasks, stats)
+            payload["messages"][-1]["content"] = prompt
+            payload["max_tokens"] = args.max_tokens
+            payloads.append(payload)
+        timings, prompt_tokens = await _measure(url, args.api_key, payloads, args.rounds)
+        results[fmt] = (prompts, timings, prompt_tokens)
+
+    print(f"tasks: {args.tasks}, questions: {len(QUESTIONS)}, budget: {args.budget}")
+    for fmt, (prompts, timings, prompt_tokens) in results.items():
+        ms = sorted(t * 1000 for t in timings)
+        print(
+            f"{fmt:8} chars={statistics.mean(map(len, prompts)):7.0f} "
+            f"est_tokens={statistics.mean(map(estimate_tokens, prompts)):6.0f} "
+            f"prompt_tokens={statistics.mean(prompt_tokens):6.0f} "
+            f"latency p50={statistics.median(ms):7.1f}ms mean={statistics.mean(ms):7.1f}ms"
+        )
+    before = statistics.mean(results["verbose"][2]) or 1
+    after = statistics.mean(results["compact"][2])
+    print(f"prompt tokens saved: {(1 - after / before) * 100:.0f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=50, help="tasks in the context")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--budget", type=int, default=1500, help="compact token budget")
+    parser.add_argument("--max-tokens", type=int, default=200, help="completion limit")
+    parser.add_argument("--url", default=None, help="chat completions URL (default: stub)")
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument(
+        "--prompt-token-latency", type=float, default=0.0002,
+        help="stub seconds per prompt token",
+    )
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(run(args, args.url))
+        return
+    stub = StubLLM(latency=0.05, prompt_token_latency=args.prompt_token_latency)
+    with StubServer(stub) as server:
+        asyncio.run(run(args, server.url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Generate load-test data: N users and M tasks with realistic shapes.
+
+Creates users sharing one password (hashed once, so a million users do
+not cost a million bcrypt rounds) and tasks with:
+
+- status: ~35% Todo, ~25% In Progress, ~40% Done;
+- deadline: none for ~15%; otherwise a few days to weeks after the task
+  was created within the last six months, so a realistic share of
+  unfinished tasks is overdue and a few fall due today or this week;
+- assignee: none for ~10%; otherwise skewed, a few users own many tasks;
+- title/description: Indonesian work phrases, usable by search and chat.
+
+Rows are written in batches with PostgreSQL ``COPY`` (asyncpg) or, on
+other databases, executemany ``INSERT``. Runs are reproducible with
+``--seed`` and can be repeated: new users get fresh numbers.
+
+Usage (from ``backend/``, with the usual environment variables set)::
+
+    python -m benchmarks.seed_data --users 1000 --tasks 100000
+    python -m benchmarks.seed_data --users 10000 --tasks 1000000 --batch 20000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Iterator, List, Sequence
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.security import get_password_hash
+from app.db import async_engine
+from app.models import Task, TaskStatus, User
+
+STATUS_WEIGHTS = {TaskStatus.todo: 35, TaskStatus.in_progress: 25, TaskStatus.done: 40}
+
+VERBS = (
+    "Susun", "Review", "Perbaiki", "Deploy", "Uji", "Dokumentasikan", "Rancang",
+    "Migrasi", "Analisis", "Siapkan", "Presentasikan", "Integrasikan",
+)
+OBJECTS = (
+    "laporan keuangan", "halaman login", "API pembayaran", "database pelanggan",
+    "desain dashboard", "rapat mingguan", "modul notifikasi", "data penjualan",
+    "kontrak vendor", "server staging", "dokumentasi API", "bug checkout",
+    "fitur ekspor", "proposal klien", "anggaran Q3", "aplikasi mobile",
+)
+DETAILS = (
+    "sebelum rilis", "untuk klien utama", "bersama tim QA", "versi 2",
+    "sesuai masukan manajer", "untuk audit", "tahap awal", "prioritas tinggi",
+)
+
+
+def _users(rng: random.Random, start: int, count: int, password_hash: str) -> Iterator[tuple]:
+    now = datetime.utcnow()
+    for number in range(start, start + count):
+        created = now - timedelta(days=rng.uniform(0, 365))
+        yield (f"Load User {number}", f"loaduser{number}@example.com", password_hash, created)
+
+
+def _task(rng: random.Random, now: datetime, user_ids: Sequence[int]) -> tuple:
+    status = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+    created = now - timedelta(days=rng.uniform(0, 180))
+    deadline = None
+    if rng.random() >= 0.15:
+        deadline = created + timedelta(days=rng.lognormvariate(2.3, 0.8))
+        deadline = deadline.replace(hour=17, minute=0, second=0, microsecond=0)
+    updated = created
+    if status != TaskStatus.todo:
+        updated = min(created + timedelta(days=rng.uniform(0, 30)), now)
+    assignee_id = None
+    if user_ids and rng.random() >= 0.10:
+        # Pareto-distributed index: a few users get most of the tasks
+        index = int(rng.paretovariate(1.2)) - 1
+        assignee_id = user_ids[index % len(user_ids)]
+    title = f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(DETAILS)}"
+    description = (
+        f"{title}. Koordinasikan dengan tim terkait dan catat hasilnya "
+        f"di {rng.choice(OBJECTS)}."
+    )
+    return (title, description, status, deadline, assignee_id, created, updated)
+
+
+USER_COLUMNS = ("name", "email", "password_hash", "created_at")
+TASK_COLUMNS = (
+    "title", "description", "status", "deadline", "assignee_id", "created_at", "updated_at",
+)
+
+
+async def _write(conn: AsyncConnection, table, columns: Sequence[str], rows: List[tuple]) -> None:
+    """Insert ``rows`` with COPY on PostgreSQL, executemany elsewhere."""
+    if conn.dialect.name == "postgresql":
+        # COPY takes enum labels, which SQLAlchemy stores by member name
+        records = [
+            tuple(value.name if isinstance(value, TaskStatus) else value for value in row)
+            for row in rows
+        ]
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=list(columns)
+        )
+    else:
+        await conn.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+
+
+async def _insert_batched(
+    table, columns: Sequence[str], rows: Iterator[tuple], total: int, batch_size: int
+) -> None:
+    start = time.perf_counter()
+    done = 0
+    while done < total:
+        batch = [next(rows) for _ in range(min(batch_size, total - done))]
+        async with async_engine.begin() as conn:
+            await _write(conn, table, columns, batch)
+        done += len(batch)
+        elapsed = time.perf_counter() - start
+        rate = done / elapsed
+        print(f"\r{table.name}: {done}/{total} ({rate:,.0f} rows/s)", end="", flush=True)
+    print()
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    async with async_engine.connect() as conn:
+        # Above every existing ID, so repeated runs never reuse an email
+        first_number = ((await conn.execute(select(func.max(User.id)))).scalar() or 0) + 1
+
+    password_hash = get_password_hash(args.password)
+    await _insert_batched(
+        User.__table__, USER_COLUMNS,
+        _users(rng, first_number, args.users, password_hash), args.users, args.batch,
+    )
+    async with async_engine.connect() as conn:
+        user_ids = list((await conn.execute(select(User.id))).scalars())
+
+    now = datetime.utcnow()
+    tasks = (_task(rng, now, user_ids) for _ in range(args.tasks))
+    await _insert_batched(Task.__table__, TASK_COLUMNS, tasks, args.tasks, args.batch)
+
+    async with async_engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Fresh statistics so the planner sees the new table sizes
+            await conn.execute(text("ANALYZE users"))
+            await conn.execute(text("ANALYZE tasks"))
+    await async_engine.dispose()
+    print(
+        f"created {args.users} users (password {args.password!r}, "
+        f"loaduser{first_number}@example.com ...) and {args.tasks} tasks"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=10000, help="rows per transaction")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default="password", help="password of every user")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
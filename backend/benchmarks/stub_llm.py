@@ -0,0 +1,202 @@
+"""Local stub of an OpenAI-compatible chat completions server.
+
+Used by benchmarks to exercise the LLM client path without network
+access or API cost. Run standalone with::
+
+    python -m benchmarks.stub_llm --port 9100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+from typing import Optional
+
+import uvicorn
+
+
+class StubLLM:
+    """Minimal ASGI app answering ``POST /chat/completions``.
+
+    Requests with ``"stream": true`` are answered as SSE, one word per
+    chunk, like the real API.
+
+    Attributes:
+        latency: Seconds to wait before answering each request.
+        prompt_token_latency: Extra seconds per prompt token, to model
+            the prefill cost of long prompts.
+        error_rate: Share of requests answered with ``error_status``
+            instead of a completion, to inject rate limiting or outages.
+        error_status: Status of injected errors (429 by default).
+        retry_after: ``Retry-After`` seconds sent with injected errors.
+        errors_sent: Number of injected errors so far.
+        chunk_delay: Seconds between streamed chunks.
+        answer: Completion text returned to every request.
+        requests: Number of requests served so far.
+        chunks_sent: Number of streamed chunks written so far.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        answer: str = "Stub answer.",
+        chunk_delay: float = 0.0,
+        prompt_token_latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 429,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        self.latency = latency
+        self.prompt_token_latency = prompt_token_latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.errors_sent = 0
+        self.chunk_delay = chunk_delay
+        self.answer = answer
+        self.requests = 0
+        self.chunks_sent = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        self.requests += 1
+        payload = json.loads(body or b"{}")
+        prompt_chars = sum(len(m.get("content", "")) for m in payload.get("messages", []))
+        delay = self.latency + self.prompt_token_latency * (prompt_chars // 4)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and random.random() < self.error_rate:
+            await self._error(send)
+            return
+        if payload.get("stream"):
+            await self._stream(receive, send)
+            return
+        response = {
+            "id": f"stub-{self.requests}",
+            "object": "chat.completion",
+            "model": payload.get("model", "stub"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.answer},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_chars // 4,
+                "completion_tokens": len(self.answer) // 4,
+                "total_tokens": (prompt_chars + len(self.answer)) // 4,
+            },
+        }
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": json.dumps(response).encode()})
+
+    async def _error(self, send) -> None:
+        self.errors_sent += 1
+        headers = [(b"content-type", b"application/json")]
+        if self.retry_after is not None:
+            headers.append((b"retry-after", str(self.retry_after).encode()))
+        await send(
+            {"type": "http.response.start", "status": self.error_status, "headers": headers}
+        )
+        body = {"error": {"message": "injected error", "type": "rate_limit_exceeded"}}
+        await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+
+    async def _stream(self, receive, send) -> None:
+        # Stop generating as soon as the client goes away, like a real API
+        disconnected = asyncio.ensure_future(receive())
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")],
+            }
+        )
+        for word in self.answer.split(" "):
+            if disconnected.done():
+                return
+            chunk = {"choices": [{"index": 0, "delta": {"content": word + " "}}]}
+            line = f"data: {json.dumps(chunk)}\n\n".encode()
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+            self.chunks_sent += 1
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+        disconnected.cancel()
+        await send({"type": "http.response.body", "body": b"data: [DONE]\n\n"})
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StubServer:
+    """Run a :class:`StubLLM` with uvicorn in a background thread.
+
+    Example::
+
+        with StubServer(StubLLM(latency=0.02)) as server:
+            httpx.post(server.url, json={...})
+    """
+
+    def __init__(self, app: StubLLM, port: Optional[int] = None) -> None:
+        self.app = app
+        self.port = port or _free_port()
+        self.url = f"http://127.0.0.1:{self.port}/chat/completions"
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning")
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--chunk-delay", type=float, default=0.0)
+    parser.add_argument("--prompt-token-latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument("--retry-after", type=float, default=None)
+    args = parser.parse_args()
+    app = StubLLM(
+        latency=args.latency,
+        chunk_delay=args.chunk_delay,
+        prompt_token_latency=args.prompt_token_latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+    )
+    uvicorn.run(app, host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Load test: thousands of idle WebSocket clients on ``/ws/tasks``.
+
+Opens ``--clients`` sockets against a running server, keeps them idle,
+then creates one task over HTTP and measures how long the
+``task.created`` event takes to reach every socket. With ``--pid`` the
+server's resident memory is sampled before and after connecting, to
+estimate the cost per idle connection.
+
+Usage (server started separately, e.g. ``uvicorn app.main:app``)::
+
+    python -m benchmarks.ws_idle --url http://localhost:8000 \\
+        --email admin@example.com --password admin123 --clients 5000 --pid <uvicorn pid>
+
+Raise the open-file limit first (``ulimit -n 65535``) for large runs;
+the script lifts its own soft limit to the hard limit.
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import time
+from typing import List, Optional
+
+import httpx
+import websockets
+
+
+def _rss_mb(pid: Optional[int]) -> Optional[float]:
+    if pid is None:
+        return None
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return None
+
+
+def _raise_fd_limit() -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def _connect_all(ws_url: str, n: int, concurrency: int) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def connect():
+        async with semaphore:
+            # Idle clients: no keepalive pings from our side
+            return await websockets.connect(ws_url, ping_interval=None, max_queue=16)
+
+    return await asyncio.gather(*(connect() for _ in range(n)))
+
+
+async def _wait_for_event(socket, task_id: int, sent_at: List[float]) -> float:
+    while True:
+        event = json.loads(await socket.recv())
+        if event.get("type") == "task.created" and event.get("id") == task_id:
+            return time.perf_counter() - sent_at[0]
+
+
+async def run(args: argparse.Namespace) -> None:
+    base = args.url.rstrip("/")
+    async with httpx.AsyncClient(base_url=base, timeout=60) as http:
+        resp = await http.post(
+            "/auth/login", data={"username": args.email, "password": args.password}
+        )
+        resp.raise_for_status()
+        token = resp.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        ws_url = base.replace("http", "ws", 1) + f"/ws/tasks?token={token}"
+
+        rss_before = _rss_mb(args.pid)
+        start = time.perf_counter()
+        sockets = await _connect_all(ws_url, args.clients, args.concurrency)
+        connect_time = time.perf_counter() - start
+        await asyncio.sleep(args.idle)
+        rss_after = _rss_mb(args.pid)
+
+        sent_at = [0.0]
+        resp = await http.post(
+            "/tasks/", json={"title": "ws load test", "description": "-"}, headers=headers
+        )
+        resp.raise_for_status()
+        task = resp.json()
+        # The event may be published before the HTTP response arrives, so
+        # measure from just before the request was sent
+        sent_at[0] = time.perf_counter() - resp.elapsed.total_seconds()
+        latencies = await asyncio.gather(
+            *(_wait_for_event(s, task["id"], sent_at) for s in sockets)
+        )
+
+        await http.delete(f"/tasks/{task['id']}", headers=headers)
+        await asyncio.gather(*(s.close() for s in sockets))
+
+    ms = sorted(latency * 1000 for latency in latencies)
+    print(f"clients:        {args.clients}")
+    print(f"connect time:   {connect_time:.2f}s ({args.clients / connect_time:.0f} conn/s)")
+    print(
+        f"fan-out:        p50={statistics.median(ms):.1f}ms "
+        f"p99={ms[int(len(ms) * 0.99) - 1]:.1f}ms max={ms[-1]:.1f}ms"
+    )
+    if rss_before is not None and rss_after is not None:
+        per_socket = (rss_after - rss_before) * 1024 / args.clients
+        print(
+            f"server RSS:     {rss_before:.1f}MB -> {rss_after:.1f}MB "
+            f"(~{per_socket:.1f}KB per idle socket)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200, help="parallel handshakes")
+    parser.add_argument("--idle", type=float, default=2.0, help="seconds to stay idle")
+    parser.add_argument("--pid", type=int, default=None, help="server PID for RSS")
+    args = parser.parse_args()
+
+    _raise_fd_limit()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
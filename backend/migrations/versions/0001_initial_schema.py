@@ -0,0 +1,57 @@
+"""Initial schema: users and tasks.
+
+Databases bootstrapped by ``Base.metadata.create_all`` before migrations
+existed already have these tables; mark them with
+``alembic stamp 0001`` instead of running this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(length=100), nullable=False, unique=True),
+        sa.Column("email", sa.String(length=255), nullable=False, unique=True),
+        sa.Column("password_hash", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(length=150), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("todo", "in_progress", "done", name="taskstatus"),
+            nullable=False,
+        ),
+        sa.Column("deadline", sa.DateTime(), nullable=True),
+        sa.Column(
+            "assignee_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_tasks_id", "tasks", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_id", table_name="tasks")
+    op.drop_table("tasks")
+    sa.Enum(name="taskstatus").drop(op.get_bind(), checkfirst=True)
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_table("users")
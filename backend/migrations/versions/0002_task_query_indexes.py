@@ -0,0 +1,60 @@
+"""Indexes matching the task list and chat query shapes.
+
+Indexes are built with ``CREATE INDEX CONCURRENTLY`` on PostgreSQL so
+large ``tasks`` tables stay writable during the migration.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+OPEN_TASKS = sa.text("status <> 'done'")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_status_deadline",
+            "tasks",
+            ["status", "deadline"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_created_at_id",
+            "tasks",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_assignee_id",
+            "tasks",
+            ["assignee_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_open_deadline",
+            "tasks",
+            ["deadline"],
+            postgresql_where=OPEN_TASKS,
+            sqlite_where=OPEN_TASKS,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in (
+            "ix_tasks_open_deadline",
+            "ix_tasks_assignee_id",
+            "ix_tasks_created_at_id",
+            "ix_tasks_status_deadline",
+        ):
+            op.drop_index(name, table_name="tasks", postgresql_concurrently=True)
@@ -0,0 +1,87 @@
+"""Database-assigned change sequence for the task change feed.
+
+``tasks.change_seq`` takes a new value from a sequence on every insert
+and update, and ``changed_at``/``task_deletions.deleted_at`` come from
+the database clock, so the feed no longer depends on app-server clocks.
+Existing rows are numbered in ``(updated_at, id)`` order.
+
+On SQLite the new columns stay nullable (adding NOT NULL would rebuild
+the table); the model always fills them.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+PG_NOW = "(clock_timestamp() AT TIME ZONE 'UTC')"
+
+
+def upgrade() -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+
+    op.add_column("tasks", sa.Column("change_seq", sa.BigInteger(), nullable=True))
+    op.add_column("tasks", sa.Column("changed_at", sa.DateTime(), nullable=True))
+    op.execute(
+        "UPDATE tasks SET change_seq = numbered.seq, "
+        "changed_at = coalesce(tasks.updated_at, tasks.created_at, CURRENT_TIMESTAMP) "
+        "FROM (SELECT id, row_number() OVER (ORDER BY updated_at, id) AS seq "
+        "FROM tasks) AS numbered WHERE tasks.id = numbered.id"
+    )
+
+    if postgresql:
+        op.execute("CREATE SEQUENCE task_change_seq OWNED BY tasks.change_seq")
+        op.execute(
+            "SELECT setval('task_change_seq', "
+            "coalesce((SELECT max(change_seq) FROM tasks), 0) + 1, false)"
+        )
+        # Server defaults cover COPY imports, which bypass the ORM
+        op.alter_column(
+            "tasks",
+            "change_seq",
+            nullable=False,
+            server_default=sa.text("nextval('task_change_seq')"),
+        )
+        op.alter_column(
+            "tasks", "changed_at", nullable=False, server_default=sa.text(PG_NOW)
+        )
+        op.alter_column(
+            "task_deletions", "deleted_at", server_default=sa.text(PG_NOW)
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_change_seq_id",
+            "tasks",
+            ["change_seq", "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_task_deletions_deleted_at",
+            "task_deletions",
+            ["deleted_at"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_task_deletions_deleted_at",
+            table_name="task_deletions",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tasks_change_seq_id", table_name="tasks", postgresql_concurrently=True
+        )
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column("task_deletions", "deleted_at", server_default=None)
+    op.drop_column("tasks", "changed_at")
+    op.drop_column("tasks", "change_seq")
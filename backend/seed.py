@@ -1,11 +1,21 @@
+from pathlib import Path
+
 import uvicorn
-from app.db import SessionLocal, Base, engine
+from alembic import command
+from alembic.config import Config
+
+from app.db import SessionLocal
 from app.seed import seed_users
 
+BACKEND_DIR = Path(__file__).resolve().parent
+
 
 def run_seed():
-    # Create tables first
-    Base.metadata.create_all(bind=engine)
+    # Bring the schema up to date through the migration chain; tables
+    # created outside it would make later `alembic upgrade` runs fail
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    command.upgrade(config, "head")
     
     db = SessionLocal()
     try:
@@ -0,0 +1,115 @@
+"""Shared pytest fixtures.
+
+Tests run against a throwaway SQLite database built by the Alembic
+migrations, so they need no running services. Set ``TEST_DATABASE_URL``
+to a disposable database (e.g. PostgreSQL, for the query planner tests)
+to run them there instead; its tables are emptied after every test.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+# Settings are read at import time, so configure them before any app import
+_TMP_DIR = tempfile.mkdtemp(prefix="task-api-tests-")
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL", f"sqlite:///{_TMP_DIR}/test.db"
+)
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("DEEPSEEK_API_KEY", "test-key")
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["LLM_BACKEND"] = "stub"
+os.environ["CHAT_CACHE_BACKEND"] = "memory"
+os.environ["EVENTS_BACKEND"] = "memory"
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app import models  # noqa: E402
+from app.core.security import create_access_token, get_password_hash  # noqa: E402
+from app.db import (  # noqa: E402
+    AsyncSessionLocal,
+    Base,
+    SessionLocal,
+    async_engine,
+    engine,
+)
+from app.deps import user_cache  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.answer_cache import answer_cache  # noqa: E402
+from app.services.search import search_index  # noqa: E402
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def migrated_db() -> None:
+    """Apply every migration once, as ``alembic upgrade head`` would."""
+    config = Config()
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    command.upgrade(config, "head")
+
+
+@pytest.fixture
+def db(migrated_db: None) -> Iterator[Session]:
+    """Sync session for arranging test data; tables are emptied afterwards."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+        user_cache.clear()
+        search_index.invalidate()
+
+
+@pytest.fixture
+async def async_db(db: Session) -> AsyncIterator[AsyncSession]:
+    """Async session on the test database, as the API gets from ``get_db``."""
+    async with AsyncSessionLocal() as session:
+        yield session
+    # Pooled connections belong to this test's event loop
+    await async_engine.dispose()
+
+
+@pytest.fixture
+def user(db: Session) -> models.User:
+    """A user to authenticate as."""
+    user = models.User(
+        name="Tester",
+        email="tester@example.com",
+        password_hash=get_password_hash("password"),
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(user: models.User) -> dict:
+    """``Authorization`` header carrying a valid token for :func:`user`."""
+    token = create_access_token({"sub": str(user.id), "email": user.email})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def client(db: Session) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client calling the app in-process."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    await answer_cache.invalidate()
+    # Pooled connections belong to this test's event loop
+    await async_engine.dispose()
@@ -0,0 +1,42 @@
+"""Chat answer caching across task writes."""
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app import models
+
+pytestmark = pytest.mark.anyio
+
+QUESTION = "Bagaimana sebaiknya tim membagi pekerjaan Laporan bulanan?"
+
+
+async def ask(client, auth_headers) -> str:
+    resp = await client.post(
+        "/chat/query", json={"question": QUESTION}, headers=auth_headers
+    )
+    assert resp.status_code == 200
+    return resp.json()["source"]
+
+
+async def test_writes_from_other_workers_invalidate_answers(
+    db: Session, client, auth_headers
+):
+    db.add(models.Task(title="Laporan bulanan", description="Susun laporan"))
+    db.commit()
+    assert await ask(client, auth_headers) == "llm"
+    assert await ask(client, auth_headers) == "cache"
+
+    # Written straight to the database, as another worker would: this
+    # process's cache is never told
+    db.add(models.Task(title="Rapat", description=""))
+    db.commit()
+    assert await ask(client, auth_headers) == "llm"
+    assert await ask(client, auth_headers) == "cache"
+
+    # Deletes through the API also log a tombstone
+    rapat = db.query(models.Task).filter_by(title="Rapat").one()
+    db.execute(delete(models.Task).where(models.Task.id == rapat.id))
+    db.add(models.TaskDeletion(task_id=rapat.id))
+    db.commit()
+    assert await ask(client, auth_headers) == "llm"
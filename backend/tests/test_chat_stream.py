@@ -0,0 +1,86 @@
+"""Streaming chat answers (``POST /chat/stream``)."""
+
+import asyncio
+import json
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app import models
+from app.services import chatbot
+from app.services.single_flight import Broadcast, chat_flights
+
+pytestmark = pytest.mark.anyio
+
+QUESTION = "Bagaimana sebaiknya tim membagi pekerjaan Laporan bulanan?"
+
+
+def answer_text(body: str) -> str:
+    """Join the deltas of an SSE response body."""
+    messages = [
+        json.loads(line[len("data: "):])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+    return "".join(message.get("delta", "") for message in messages)
+
+
+@pytest.fixture
+def gated_backend(monkeypatch) -> dict:
+    """Make the LLM stream wait for ``gate`` and count upstream calls."""
+    state = {"calls": 0, "gate": asyncio.Event()}
+
+    async def stream(payload: dict) -> AsyncIterator[dict]:
+        state["calls"] += 1
+        await state["gate"].wait()
+        for word in ("Bagi", "per", "bagian."):
+            yield {"choices": [{"index": 0, "delta": {"content": word + " "}}]}
+
+    monkeypatch.setattr(chatbot.llm_backend, "stream", stream)
+    return state
+
+
+async def test_identical_streams_share_one_upstream_call(
+    db: Session, client, auth_headers, gated_backend
+):
+    db.add(models.Task(title="Laporan bulanan", description="Susun laporan"))
+    db.commit()
+    coalesced = chat_flights.coalesced
+
+    async def ask() -> str:
+        resp = await client.post(
+            "/chat/stream", json={"question": QUESTION}, headers=auth_headers
+        )
+        assert resp.status_code == 200
+        return resp.text
+
+    async def release_when_both_joined() -> None:
+        while chat_flights.coalesced < coalesced + 1:
+            await asyncio.sleep(0.01)
+        gated_backend["gate"].set()
+
+    first, second, _ = await asyncio.wait_for(
+        asyncio.gather(ask(), ask(), release_when_both_joined()), timeout=5
+    )
+
+    assert gated_backend["calls"] == 1
+    for body in (first, second):
+        assert answer_text(body) == "Bagi per bagian. "
+        assert "event: done" in body
+
+
+async def test_broadcast_replays_chunks_and_reports_abandonment():
+    broadcast = Broadcast()
+    broadcast.publish("a")
+    early = broadcast.follow()
+    assert await early.__anext__() == "a"
+
+    broadcast.publish("b")
+    late = broadcast.follow()
+    assert [await late.__anext__(), await late.__anext__()] == ["a", "b"]
+
+    await early.aclose()
+    assert not broadcast.abandoned
+    await late.aclose()
+    assert broadcast.abandoned
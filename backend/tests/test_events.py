@@ -0,0 +1,126 @@
+"""Task event broker: reconnecting the PostgreSQL LISTEN connection."""
+
+import asyncio
+import json
+
+import asyncpg
+import pytest
+
+from app.services.events import EventHub, PostgresBroker
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeConnection:
+    """Stand-in for an asyncpg connection that can be made to drop."""
+
+    def __init__(self) -> None:
+        self.notified = []
+        self.closed = False
+        self._listeners = []
+        self._on_terminate = []
+
+    async def add_listener(self, channel, callback) -> None:
+        self._listeners.append(callback)
+
+    def add_termination_listener(self, callback) -> None:
+        self._on_terminate.append(callback)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def execute(self, query, channel, payload) -> None:
+        if self.closed:
+            raise asyncpg.exceptions.ConnectionDoesNotExistError("connection was closed")
+        self.notified.append(payload)
+        for callback in self._listeners:
+            callback(self, 1, channel, payload)
+
+    def drop(self) -> None:
+        """Lose the connection the way asyncpg reports it."""
+        self.closed = True
+        loop = asyncio.get_running_loop()
+        for callback in self._on_terminate:
+            loop.call_soon(callback, self)
+
+    terminate = drop
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Connections opened through ``asyncpg.connect``, in order."""
+    opened = []
+
+    async def connect(dsn):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    monkeypatch.setattr(asyncpg, "connect", connect)
+    return opened
+
+
+@pytest.fixture
+async def broker(connections):
+    hub = EventHub(queue_size=10)
+    broker = PostgresBroker(hub, "postgresql://localhost/test", "task_events")
+    broker.RECONNECT_INITIAL_DELAY = 0.01
+    await broker.start()
+    yield broker
+    await broker.stop()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_dropped_connection_is_reopened_and_clients_reload(broker, connections):
+    subscriber = broker.hub.subscribe()
+
+    connections[0].drop()
+    await _settle()
+
+    assert len(connections) == 2
+    assert broker.reconnects == 1
+    assert json.loads(subscriber.queue.get_nowait()) == {"type": "tasks.reload"}
+
+    await broker.publish("event")
+    assert connections[1].notified == ["event"]
+
+
+async def test_publish_on_dead_connection_reconnects_and_sends(broker, connections):
+    # Dead without the termination callback having run yet
+    connections[0].closed = True
+
+    await broker.publish("event")
+
+    assert len(connections) == 2
+    assert connections[1].notified == ["event"]
+
+
+async def test_reconnect_retries_until_database_is_back(broker, connections, monkeypatch):
+    attempts = []
+
+    async def flaky_connect(dsn):
+        attempts.append(dsn)
+        if len(attempts) < 3:
+            raise OSError("connection refused")
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(asyncpg, "connect", flaky_connect)
+    connections[0].drop()
+    await asyncio.sleep(0.2)
+
+    assert len(attempts) == 3
+    assert broker.reconnects == 1
+
+
+async def test_stop_does_not_reconnect(broker, connections):
+    await broker.stop()
+    await _settle()
+
+    assert len(connections) == 1
@@ -0,0 +1,64 @@
+"""Rule-based chat answers and their fallback to the LLM."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import models
+from app.models import TaskStatus
+from app.services.fast_answers import try_fast_answer
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def tasks(db):
+    """Two overdue open tasks, one future Todo and three Done tasks."""
+    now = datetime.now()
+    rows = [
+        (TaskStatus.todo, now - timedelta(days=3)),
+        (TaskStatus.in_progress, now - timedelta(days=1)),
+        (TaskStatus.todo, now + timedelta(days=5)),
+        (TaskStatus.done, now - timedelta(days=2)),
+        (TaskStatus.done, None),
+        (TaskStatus.done, None),
+    ]
+    for number, (status, deadline) in enumerate(rows):
+        db.add(models.Task(
+            title=f"Task {number}", description="", status=status, deadline=deadline
+        ))
+    db.commit()
+
+
+@pytest.mark.parametrize("question, answer", [
+    ("berapa task yang terlambat?", "Ada **2** task yang terlambat (overdue)."),
+    ("berapa task yang lewat deadline?", "Ada **2** task yang terlambat (overdue)."),
+    ("berapa task yang done?", "Ada **3** task dengan status Done."),
+    ("berapa task yang sudah selesai?", "Ada **3** task dengan status Done."),
+    ("berapa task yang belum selesai?", "Ada **2** task dengan status Todo."),
+])
+async def test_statistical_questions_are_answered_from_sql(async_db, tasks, question, answer):
+    assert await try_fast_answer(async_db, question) == answer
+
+
+@pytest.mark.parametrize("question", [
+    # "sudah" is not a status here; Done + overdue matches nothing
+    "berapa task yang sudah terlambat?",
+    "berapa task yang sudah lewat deadline?",
+    "berapa task yang done dan terlambat?",
+    # Negated statuses cannot be expressed by the intent filters
+    "berapa task yang belum done?",
+    "tampilkan task yang belum in progress",
+    "berapa task yang tidak terlambat?",
+])
+async def test_questions_the_rules_cannot_represent_fall_back(async_db, tasks, question):
+    assert await try_fast_answer(async_db, question) is None
+
+
+async def test_chat_query_reports_llm_path_for_negated_question(client, auth_headers, tasks):
+    resp = await client.post(
+        "/chat/query", json={"question": "berapa task yang belum done?"}, headers=auth_headers
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["source"] == "llm"
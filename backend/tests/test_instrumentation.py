@@ -0,0 +1,28 @@
+"""SQL statement instrumentation."""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.instrumentation import db_queries_total, instrument_queries
+
+
+def queries_counted() -> float:
+    return sum(sample[-1] for sample in db_queries_total.samples())
+
+
+def test_failed_statements_leave_no_state_on_the_connection():
+    engine = create_engine("sqlite://")
+    instrument_queries(engine)
+    before = queries_counted()
+
+    with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        info = dict(conn.info)
+
+    assert info == {}
+    assert queries_counted() == before + 1
+    engine.dispose()
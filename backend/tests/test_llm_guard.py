@@ -0,0 +1,252 @@
+"""LLM guard: Retry-After parsing, retries, circuit breaker and limiter."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.services.llm_guard import (
+    CircuitBreaker,
+    ConcurrencyLimiter,
+    LLMGuard,
+    LLMUnavailable,
+    parse_retry_after,
+)
+
+URL = "http://llm.test/chat/completions"
+
+
+class FakeClock:
+    """Manually advanced replacement for ``time.monotonic``."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_guard(max_retries=3, limit=10, queue_size=10, threshold=5):
+    return LLMGuard(
+        ConcurrencyLimiter(limit=limit, queue_size=queue_size, timeout=1),
+        CircuitBreaker(failure_threshold=threshold, reset_timeout=30),
+        max_retries=max_retries,
+        retry_base_delay=0.01,
+        retry_max_delay=0.5,
+    )
+
+
+def scripted_transport(responses, calls, latency=0.0):
+    """MockTransport answering with ``responses`` in order."""
+    queue = list(responses)
+
+    async def handler(request):
+        calls.append(time.perf_counter())
+        if latency:
+            await asyncio.sleep(latency)
+        response = queue.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.MockTransport(handler)
+
+
+def sender(client):
+    return lambda: client.send(client.build_request("POST", URL, json={}), stream=True)
+
+
+# parse_retry_after
+
+@pytest.mark.parametrize("value, expected", [
+    ("3", 3.0),
+    ("0.5", 0.5),
+    ("-2", 0.0),
+    (None, None),
+    ("", None),
+    ("soon", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 28 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+    past = datetime.now(timezone.utc) - timedelta(minutes=1)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+# CircuitBreaker
+
+def test_breaker_opens_after_threshold_and_probes_after_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(LLMUnavailable) as info:
+        breaker.before_call()
+    assert info.value.reason == "circuit_open"
+    assert info.value.retry_after == pytest.approx(10)
+
+    clock.now += 10
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(LLMUnavailable):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_breaker_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.before_call()
+    breaker.record_failure()
+    clock.now += 10
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.opened == 2
+    with pytest.raises(LLMUnavailable):
+        breaker.check()
+
+
+def test_breaker_late_failure_keeps_open_timer():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 9
+    # A call admitted before the circuit opened fails late
+    breaker.record_failure()
+    clock.now += 1
+
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+# LLMGuard._send_with_retries against httpx.MockTransport
+
+@pytest.mark.anyio
+async def test_retries_429_honouring_retry_after():
+    calls = []
+    transport = scripted_transport([
+        httpx.Response(429, headers={"Retry-After": "0.2"}),
+        httpx.Response(200, json={"ok": True}),
+    ], calls)
+    guard = make_guard()
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await guard._send_with_retries(sender(client))
+        await response.aread()
+
+    assert response.json() == {"ok": True}
+    assert guard.retries == 1
+    assert calls[1] - calls[0] >= 0.2
+
+
+@pytest.mark.anyio
+async def test_retry_after_beyond_max_delay_fails_at_once():
+    calls = []
+    transport = scripted_transport([httpx.Response(429, headers={"Retry-After": "60"})], calls)
+    guard = make_guard()
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await guard._send_with_retries(sender(client))
+
+    assert len(calls) == 1
+
+
+@pytest.mark.anyio
+async def test_retries_5xx_and_timeouts_then_gives_up():
+    calls = []
+    request = httpx.Request("POST", URL)
+    transport = scripted_transport([
+        httpx.Response(503),
+        httpx.ReadTimeout("slow", request=request),
+        httpx.Response(502),
+    ], calls)
+    guard = make_guard(max_retries=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.HTTPStatusError) as info:
+            await guard._send_with_retries(sender(client))
+
+    assert info.value.response.status_code == 502
+    assert len(calls) == 3
+    assert guard.retries == 2
+
+
+@pytest.mark.anyio
+async def test_client_errors_are_not_retried():
+    calls = []
+    transport = scripted_transport([httpx.Response(400)], calls)
+    guard = make_guard()
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await guard._send_with_retries(sender(client))
+
+    assert len(calls) == 1
+
+
+# LLMGuard.request: breaker and limiter together
+
+@pytest.mark.anyio
+async def test_outage_opens_breaker_and_later_calls_skip_upstream():
+    calls = []
+    transport = scripted_transport([httpx.Response(503)] * 3, calls)
+    guard = make_guard(max_retries=0, threshold=3)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                async with guard.request(sender(client)):
+                    pass
+        with pytest.raises(LLMUnavailable) as info:
+            async with guard.request(sender(client)):
+                pass
+
+    assert info.value.reason == "circuit_open"
+    assert len(calls) == 3
+    assert guard.stats()["circuit_state"] == "open"
+
+
+@pytest.mark.anyio
+async def test_limiter_caps_concurrency_and_rejects_beyond_queue():
+    calls = []
+    transport = scripted_transport([httpx.Response(200)] * 3, calls, latency=0.1)
+    guard = make_guard(limit=2, queue_size=1)
+    active = []
+
+    async def one(client):
+        try:
+            async with guard.request(sender(client)):
+                active.append(guard.limiter.active)
+            return "ok"
+        except LLMUnavailable as exc:
+            return exc.reason
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        outcomes = await asyncio.gather(*(one(client) for _ in range(4)))
+
+    assert sorted(outcomes) == ["busy", "ok", "ok", "ok"]
+    assert max(active) <= 2
+    assert guard.stats()["rejected_busy"] == 1
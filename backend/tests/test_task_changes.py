@@ -0,0 +1,115 @@
+"""The task change feed (``GET /tasks/changes``)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app import models
+from app.config import settings
+from app.core.pagination import encode_sync_cursor
+from app.routers import tasks as tasks_router
+
+pytestmark = pytest.mark.anyio
+
+SETTLED = datetime.utcnow() - timedelta(minutes=1)
+
+
+def add_task(db: Session, title: str) -> models.Task:
+    task = models.Task(title=title, description="")
+    db.add(task)
+    db.commit()
+    return task
+
+
+def set_change(db: Session, task: models.Task, seq: int, changed_at: datetime) -> None:
+    db.execute(
+        update(models.Task)
+        .where(models.Task.id == task.id)
+        .values(change_seq=seq, changed_at=changed_at)
+    )
+    db.commit()
+
+
+async def changes(client, auth_headers, since=None) -> dict:
+    params = {"since": since} if since else {}
+    resp = await client.get("/tasks/changes", params=params, headers=auth_headers)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def test_writes_get_increasing_change_seq(db, client, auth_headers):
+    first, second = add_task(db, "First"), add_task(db, "Second")
+    assert second.change_seq > first.change_seq
+
+    resp = await client.put(
+        f"/tasks/{first.id}", json={"title": "First, edited"}, headers=auth_headers
+    )
+    assert resp.status_code == 200
+    db.refresh(first)
+    assert first.change_seq > second.change_seq
+    assert first.changed_at is not None
+
+
+async def test_feed_waits_for_changes_younger_than_the_lag(db, client, auth_headers):
+    # early got the lower number but committed "just now"; a client polling
+    # now must not jump past it to the settled later change
+    early, late = add_task(db, "Early"), add_task(db, "Late")
+    set_change(db, early, seq=1, changed_at=datetime.utcnow())
+    set_change(db, late, seq=2, changed_at=SETTLED)
+
+    page = await changes(client, auth_headers)
+    assert page["items"] == []
+    assert page["has_more"] is False
+
+    set_change(db, early, seq=1, changed_at=SETTLED)
+    page = await changes(client, auth_headers, since=page["next_cursor"])
+    assert [item["title"] for item in page["items"]] == ["Early", "Late"]
+
+    page = await changes(client, auth_headers, since=page["next_cursor"])
+    assert page["items"] == []
+
+
+async def test_deletions_are_reported_once_settled(db, client, auth_headers):
+    task = add_task(db, "Doomed")
+    task_id = task.id
+    set_change(db, task, seq=1, changed_at=SETTLED)
+    cursor = (await changes(client, auth_headers))["next_cursor"]
+
+    resp = await client.delete(f"/tasks/{task_id}", headers=auth_headers)
+    assert resp.status_code == 204
+    page = await changes(client, auth_headers, since=cursor)
+    assert page["deleted"] == []
+
+    db.execute(update(models.TaskDeletion).values(deleted_at=SETTLED))
+    db.commit()
+    page = await changes(client, auth_headers, since=page["next_cursor"])
+    assert [d["id"] for d in page["deleted"]] == [task_id]
+
+
+async def test_cursor_older_than_retention_is_gone(db, client, auth_headers):
+    issued_at = datetime.utcnow() - timedelta(days=settings.changes_retention_days + 1)
+    cursor = encode_sync_cursor(0, 0, 0, issued_at)
+    resp = await client.get(
+        "/tasks/changes", params={"since": cursor}, headers=auth_headers
+    )
+    assert resp.status_code == 410
+
+    resp = await client.get(
+        "/tasks/changes", params={"since": "not-a-cursor"}, headers=auth_headers
+    )
+    assert resp.status_code == 400
+
+
+async def test_old_tombstones_are_pruned(db, async_db, monkeypatch):
+    expired = datetime.utcnow() - timedelta(days=settings.changes_retention_days + 1)
+    db.add(models.TaskDeletion(task_id=1, deleted_at=expired))
+    db.commit()
+    monkeypatch.setattr(tasks_router, "_last_deletion_prune", float("-inf"))
+
+    await tasks_router._record_deletions(async_db, [2])
+    await async_db.commit()
+
+    result = await async_db.execute(select(models.TaskDeletion.task_id))
+    assert result.scalars().all() == [2]
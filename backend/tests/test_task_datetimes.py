@@ -0,0 +1,107 @@
+"""Timezone-aware datetimes sent by clients are stored as naive UTC."""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import models
+from app.core.clock import utc_today
+from app.schemas import TaskCreate, to_naive_utc
+from app.services.task_stats import get_task_statistics
+
+pytestmark = pytest.mark.anyio
+
+# What the frontend sends: new Date(d).toISOString()
+BROWSER_DEADLINE = "2026-03-01T10:00:00.000Z"
+
+
+def test_to_naive_utc_resolves_offsets():
+    jakarta = timezone(timedelta(hours=7))
+
+    assert to_naive_utc(datetime(2026, 3, 1, 17, 0, tzinfo=jakarta)) == datetime(2026, 3, 1, 10)
+    assert to_naive_utc(datetime(2026, 3, 1, 10, 0)) == datetime(2026, 3, 1, 10)
+
+
+def test_task_schema_deadline_is_naive_utc():
+    task = TaskCreate(title="A", description="", deadline="2026-03-01T17:00:00+07:00")
+
+    assert task.deadline == datetime(2026, 3, 1, 10)
+    assert task.deadline.tzinfo is None
+
+
+@pytest.fixture(params=["Etc/GMT-14", "Etc/GMT+12"])
+def local_timezone(request, monkeypatch):
+    """Run with the process in a timezone far from UTC.
+
+    At any moment at least one of UTC+14 and UTC-12 is on a different
+    date than UTC.
+    """
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+async def test_today_is_utc_whatever_the_server_timezone(local_timezone, db, async_db):
+    start_of_today = datetime.combine(utc_today(), datetime.min.time())
+    minute = timedelta(minutes=1)
+    db.add_all([
+        models.Task(title="Hari ini", description="", deadline=start_of_today + minute),
+        models.Task(title="Kemarin", description="", deadline=start_of_today - minute),
+    ])
+    db.commit()
+
+    assert utc_today() == datetime.now(timezone.utc).date()
+    stats = await get_task_statistics(async_db)
+    assert (stats.due_today, stats.overdue) == (1, 1)
+
+
+async def test_create_and_update_accept_browser_deadline(db, client, auth_headers):
+    body = {"title": "Laporan", "description": "", "deadline": BROWSER_DEADLINE}
+    resp = await client.post("/tasks/", json=body, headers=auth_headers)
+    assert resp.status_code == 201
+    assert resp.json()["deadline"] == "2026-03-01T10:00:00"
+
+    task_id = resp.json()["id"]
+    resp = await client.put(
+        f"/tasks/{task_id}",
+        json={"deadline": "2026-03-02T08:30:00+07:00"},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json()["deadline"] == "2026-03-02T01:30:00"
+
+    resp = await client.put(
+        "/tasks/bulk",
+        json={"items": [{"id": task_id, "deadline": BROWSER_DEADLINE}]},
+        headers=auth_headers,
+    )
+    assert resp.json()["succeeded"] == 1
+    assert db.get(models.Task, task_id).deadline == datetime(2026, 3, 1, 10)
+
+
+async def test_deadline_filters_accept_offsets(db, client, auth_headers):
+    db.add(models.Task(title="A", description="", deadline=datetime(2026, 3, 1, 10)))
+    db.commit()
+
+    params = {
+        "deadline_from": "2026-03-01T16:30:00+07:00",  # 09:30 UTC
+        "deadline_to": "2026-03-01T10:30:00Z",
+    }
+    resp = await client.get("/tasks/", params=params, headers=auth_headers)
+
+    assert resp.status_code == 200
+    assert [task["title"] for task in resp.json()["items"]] == ["A"]
+
+
+async def test_import_accepts_browser_deadline(db, client, auth_headers):
+    line = json.dumps({"title": "Impor", "description": "", "deadline": BROWSER_DEADLINE})
+    files = {"file": ("tasks.ndjson", line + "\n", "application/x-ndjson")}
+    resp = await client.post("/tasks/import", files=files, headers=auth_headers)
+
+    assert resp.json()["imported"] == 1
+    task = db.query(models.Task).one()
+    assert task.deadline == datetime(2026, 3, 1, 10)
@@ -0,0 +1,31 @@
+"""Filters of ``GET /tasks/``."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app import models
+
+pytestmark = pytest.mark.anyio
+
+
+def add_tasks(db: Session, *titles: str) -> None:
+    db.add_all(models.Task(title=title, description="") for title in titles)
+    db.commit()
+
+
+@pytest.mark.parametrize(
+    "q, expected",
+    [
+        ("%", ["Diskon 50%"]),
+        ("_", ["file_name"]),
+        ("\\", ["C:\\temp"]),
+        ("50%", ["Diskon 50%"]),
+        ("i_e", []),
+    ],
+)
+async def test_search_matches_wildcards_literally(db, client, auth_headers, q, expected):
+    add_tasks(db, "Diskon 50%", "file_name", "C:\\temp", "Rapat mingguan")
+
+    resp = await client.get("/tasks/", params={"q": q}, headers=auth_headers)
+    assert resp.status_code == 200
+    assert [task["title"] for task in resp.json()["items"]] == expected
@@ -0,0 +1,35 @@
+"""Streaming task import and its error report."""
+
+import json
+
+import pytest
+
+from app.services.task_import import MAX_REPORTED_ERRORS, RowErrors
+
+pytestmark = pytest.mark.anyio
+
+
+def test_row_errors_keep_count_and_lowest_lines():
+    errors = RowErrors(limit=3)
+    for line in (7, 2, 9, 5, 1, 8):
+        errors.append((line, f"line {line}"))
+
+    assert errors.count == 6
+    assert errors.first() == [(1, "line 1"), (2, "line 2"), (5, "line 5")]
+
+
+async def test_import_reports_first_errors_of_many(db, client, auth_headers):
+    lines = [json.dumps({"title": "Rusak", "description": "", "status": "Batal"})] * 250
+    lines.insert(100, json.dumps({"title": "Valid", "description": ""}))
+    files = {"file": ("tasks.ndjson", "\n".join(lines) + "\n", "application/x-ndjson")}
+
+    resp = await client.post("/tasks/import", files=files, headers=auth_headers)
+
+    report = resp.json()
+    assert report["imported"] == 1
+    assert report["failed"] == 250
+    assert report["errors_truncated"] is True
+    reported_lines = [error["line"] for error in report["errors"]]
+    assert len(reported_lines) == MAX_REPORTED_ERRORS
+    assert reported_lines == sorted(reported_lines)
+    assert reported_lines[0] == 1
@@ -0,0 +1,101 @@
+"""The query planner uses the task indexes from the migrations.
+
+Each test runs ``EXPLAIN`` on a query shaped like one the API issues and
+checks which index the plan reads. On PostgreSQL sequential scans are
+disabled first: with a near-empty test table a scan is always cheapest,
+and the point is that a matching index exists and is usable.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+import pytest
+from sqlalchemy import event, select, tuple_
+from sqlalchemy.engine import Connection
+
+from app.db import engine
+from app.models import Task, TaskStatus
+from app.services.fast_answers import intent_filters
+
+NOW = datetime(2026, 1, 15, 9, 0)
+
+
+@pytest.fixture
+def conn(migrated_db: None) -> Iterator[Connection]:
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("SET enable_seqscan = off")
+        yield conn
+        conn.rollback()
+
+
+@contextmanager
+def _explained(conn: Connection) -> Iterator[None]:
+    """Prefix every statement run on ``conn`` with EXPLAIN."""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        return prefix + statement, parameters
+
+    event.listen(conn, "before_cursor_execute", before_cursor_execute, retval=True)
+    try:
+        yield
+    finally:
+        event.remove(conn, "before_cursor_execute", before_cursor_execute)
+
+
+def plan(conn: Connection, statement) -> str:
+    """Return the query plan of ``statement`` as one string."""
+    with _explained(conn):
+        rows = conn.execute(statement).fetchall()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def test_task_page_uses_created_at_id_index(conn):
+    newest_first = (Task.created_at.desc(), Task.id.desc())
+    first_page = select(Task).order_by(*newest_first).limit(51)
+    next_page = (
+        select(Task)
+        .where(tuple_(Task.created_at, Task.id) < tuple_(NOW, 100))
+        .order_by(*newest_first)
+        .limit(51)
+    )
+
+    assert "ix_tasks_created_at_id" in plan(conn, first_page)
+    assert "ix_tasks_created_at_id" in plan(conn, next_page)
+
+
+def test_tasks_by_assignee_use_assignee_index(conn):
+    statement = select(Task).where(Task.assignee_id == 1)
+
+    assert "ix_tasks_assignee_id" in plan(conn, statement)
+
+
+def test_chat_status_and_deadline_filter_uses_status_deadline_index(conn):
+    intent = {"filter_status": TaskStatus.todo, "filter_deadline": "today"}
+    statement = (
+        select(Task)
+        .where(*intent_filters(intent))
+        .order_by(Task.deadline.asc().nullslast(), Task.created_at.desc())
+    )
+
+    assert "ix_tasks_status_deadline" in plan(conn, statement)
+
+
+def test_overdue_filter_uses_partial_open_deadline_index(conn):
+    intent = {"filter_status": None, "filter_deadline": "overdue"}
+    statement = select(Task).where(*intent_filters(intent))
+
+    assert "ix_tasks_open_deadline" in plan(conn, statement)
+
+
+def test_change_feed_uses_change_seq_index(conn):
+    statement = (
+        select(Task)
+        .where(tuple_(Task.change_seq, Task.id) > tuple_(42, 100))
+        .order_by(Task.change_seq, Task.id)
+        .limit(201)
+    )
+
+    assert "ix_tasks_change_seq_id" in plan(conn, statement)
@@ -0,0 +1,61 @@
+"""SQL statement counts of task read paths."""
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import models
+from app.db import async_engine
+
+pytestmark = pytest.mark.anyio
+
+
+@contextmanager
+def count_statements() -> Iterator[List[str]]:
+    """Collect the SQL statements run through the API's engine."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(
+            async_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+        )
+
+
+def add_tasks(db: Session, first: int, count: int) -> None:
+    """Create ``count`` tasks, each assigned to its own user."""
+    for number in range(first, first + count):
+        assignee = models.User(
+            name=f"Assignee {number}",
+            email=f"assignee{number}@example.com",
+            password_hash="x",
+        )
+        db.add(models.Task(title=f"Task {number}", description="", assignee_rel=assignee))
+    db.commit()
+
+
+async def list_statements(client, auth_headers) -> List[str]:
+    with count_statements() as statements:
+        resp = await client.get("/tasks/", headers=auth_headers)
+    assert resp.status_code == 200
+    return statements
+
+
+async def test_list_tasks_query_count_does_not_grow_with_tasks(db, client, auth_headers):
+    add_tasks(db, first=0, count=2)
+    # Warm the token cache so both measured requests do the same work
+    await list_statements(client, auth_headers)
+    few = await list_statements(client, auth_headers)
+
+    add_tasks(db, first=2, count=40)
+    many = await list_statements(client, auth_headers)
+
+    assert len(many) == len(few), many
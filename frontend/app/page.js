@@ -38,6 +38,24 @@ export default function HomePage() {
     }
   }, []);
 
+  /**
+   * Fetch every task by following the paginated `/tasks/` cursor.
+   * @async
+   * @returns {Promise<Array<Object>>} All tasks, newest first
+   */
+  const fetchAllTasks = async () => {
+    const items = [];
+    let cursor = null;
+    do {
+      const res = await api.get("/tasks/", {
+        params: { limit: 200, ...(cursor ? { cursor } : {}) },
+      });
+      items.push(...res.data.items);
+      cursor = res.data.next_cursor;
+    } while (cursor);
+    return items;
+  };
+
   /**
    * Fetch all tasks and users from the API.
    * Also extracts current user info from JWT token.
@@ -45,11 +63,11 @@ export default function HomePage() {
    */
   const fetchAll = async () => {
     try {
-      const [taskRes, userRes] = await Promise.all([
-        api.get("/tasks/"),
+      const [taskItems, userRes] = await Promise.all([
+        fetchAllTasks(),
         api.get("/users/"),
       ]);
-      setTasks(taskRes.data);
+      setTasks(taskItems);
       setUsers(userRes.data);
 
       // Get current user info from token